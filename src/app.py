@@ -1,5 +1,4 @@
 """Root class for starting the daemon/webapp."""
-from logging import DEBUG
 from logging import getLogger as Log
 from os import environ
 
@@ -13,10 +12,14 @@ from uosinterface.webapp.dashboard import shutdown_server
 
 __flask_debug = environ.get("FLASK_DEBUG", "false") == "true"
 __host = environ.get("FLASK_HOST", "127.0.0.1")
+__log_level = environ.get("UOS_LOG_LEVEL", "DEBUG").upper()
+__byte_trace = int(environ.get("UOS_BYTE_TRACE", "0"))
 
-app = create_app(__flask_debug, base_path=base_dir, static_path=static_dir)
-register_hardware_logs(DEBUG, base_dir)
-configure_logs("server", DEBUG, base_dir)
+app = create_app(
+    __flask_debug, base_path=base_dir, static_path=static_dir, log_level=__log_level
+)
+register_hardware_logs(__log_level, base_dir, byte_trace_every=__byte_trace)
+configure_logs("server", __log_level, base_dir)
 
 server = WSGIServer((__host, 5000), app, log=Log("server"))
 server.start()
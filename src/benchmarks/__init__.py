@@ -0,0 +1,167 @@
+"""Package measuring the speed of the protocol, device and API hot paths.
+
+Run with ``python -m benchmarks`` from the src directory, results are
+written as JSON and compared against a stored baseline.
+"""
+import json
+import platform
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Callable
+from typing import Dict
+from typing import List
+
+BASELINE_PATH = Path(__file__).parent.joinpath("baseline.json")
+
+# Fractional drop in speed from the baseline that counts as a regression.
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass
+class BenchmarkResult:
+    """Containing the timing of a benchmarked operation.
+
+    :ivar name: Identifies the benchmark, eg. protocol.get_npc_packet.
+    :ivar iterations: Number of operations timed.
+    :ivar ops_per_s: Operations completed per second.
+    :ivar p50_us: Median latency of an operation in microseconds.
+    :ivar p90_us: 90th percentile latency in microseconds.
+    :ivar p99_us: 99th percentile latency in microseconds.
+    """
+
+    name: str
+    iterations: int
+    ops_per_s: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+
+
+def measure(
+    name: str,
+    operation: Callable[[], object],
+    iterations: int,
+    batch: int = 1,
+    warmup: int = None,
+) -> BenchmarkResult:
+    """Times repeated calls of an operation.
+
+    :param name: Identifies the benchmark.
+    :param operation: Callable to time, called without arguments.
+    :param iterations: Number of samples to take.
+    :param batch: Calls per sample, fast operations are batched so the timer
+        overhead does not dominate. Latencies are per call.
+    :param warmup: Untimed calls made first, defaults to a tenth of iterations.
+    :return: BenchmarkResult object.
+    """
+    for _ in range(iterations // 10 if warmup is None else warmup):
+        operation()
+    samples = []
+    for _ in range(max(iterations, 1)):
+        start_ns = perf_counter_ns()
+        for _ in range(batch):
+            operation()
+        samples.append((perf_counter_ns() - start_ns) / batch)
+    samples.sort()
+    return BenchmarkResult(
+        name=name,
+        iterations=len(samples) * batch,
+        ops_per_s=1e9 * len(samples) / max(sum(samples), 1),
+        p50_us=percentile(samples, 50) / 1000,
+        p90_us=percentile(samples, 90) / 1000,
+        p99_us=percentile(samples, 99) / 1000,
+    )
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """Nearest rank percentile of sorted samples.
+
+    :param samples: Sorted list of samples.
+    :param percent: Percentile to find, between 0 and 100.
+    :return: The sample at the percentile.
+    """
+    rank = round(percent / 100 * (len(samples) - 1))
+    return samples[min(max(rank, 0), len(samples) - 1)]
+
+
+def fastest(runs: List[List[BenchmarkResult]]) -> List[BenchmarkResult]:
+    """Keeps the round of each benchmark with the lowest median latency.
+
+    Noise on a shared machine only ever slows a round down, so the fastest
+    of several is the most repeatable estimate.
+
+    :param runs: Results of each repeated run.
+    :return: List of BenchmarkResult objects in the order of the first run.
+    """
+    best = {}
+    for result in (result for run in runs for result in run):
+        if result.name not in best or result.p50_us < best[result.name].p50_us:
+            best[result.name] = result
+    return list(best.values())
+
+
+def to_report(results: List[BenchmarkResult]) -> dict:
+    """Builds the machine readable form of a benchmark run.
+
+    :param results: The results of the run.
+    :return: Dict with the platform the run was on and results keyed on name.
+    """
+    return {
+        "platform": {
+            "python": platform.python_version(),
+            "system": platform.system(),
+            "machine": platform.machine(),
+        },
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def save_report(report: dict, path: Path):
+    """Writes a report as JSON.
+
+    :param report: Report as returned by to_report.
+    :param path: File to write.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def load_report(path: Path) -> dict:
+    """Reads a report written by save_report.
+
+    :param path: File to read.
+    :return: Report dict, None if the file does not exist.
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def compare(
+    report: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE
+) -> Dict[str, float]:
+    """Finds the benchmarks that slowed down from a baseline.
+
+    Speed is compared on median latency, which unlike the mean throughput is
+    not skewed by the occasional call that is preempted. Benchmarks missing
+    from either report are not compared.
+
+    :param report: The report of the current run.
+    :param baseline: The report to compare against.
+    :param tolerance: Fractional drop in speed allowed before regressing.
+    :return: Dict of the current speed relative to the baseline, keyed on the
+        name of each regressed benchmark.
+    """
+    regressions = {}
+    for name, result in report["results"].items():
+        if name not in baseline["results"]:
+            continue
+        ratio = baseline["results"][name]["p50_us"] / result["p50_us"]
+        if ratio < 1 - tolerance:
+            regressions[name] = ratio
+    return regressions
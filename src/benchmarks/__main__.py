@@ -0,0 +1,89 @@
+"""Runs the benchmark suites and compares the results against a baseline."""
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+from benchmarks import api
+from benchmarks import BASELINE_PATH
+from benchmarks import compare
+from benchmarks import DEFAULT_TOLERANCE
+from benchmarks import device
+from benchmarks import fastest
+from benchmarks import load_report
+from benchmarks import protocol
+from benchmarks import save_report
+from benchmarks import to_report
+
+SUITES = {"protocol": protocol.run, "device": device.run, "api": api.run}
+
+
+def main(argv=None) -> int:
+    """Runs the requested suites, writing and comparing their report.
+
+    :param argv: Command line arguments, defaults to sys.argv.
+    :return: Exit code, 1 if any benchmark regressed from the baseline.
+    """
+    parser = ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "suites", nargs="*", help=f"Suites to run from {list(SUITES)}, default all."
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE_PATH,
+        help="Report to compare against.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Fractional drop in speed allowed before failing.",
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1, help="Multiplier of the iterations run."
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs of each suite, the fastest is reported.",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Replace the baseline with this run instead of comparing.",
+    )
+    args = parser.parse_args(argv)
+    for suite in args.suites:
+        if suite not in SUITES:
+            parser.error(f"unknown suite '{suite}'")
+    results = []
+    for suite in args.suites or SUITES:
+        results.extend(
+            fastest([SUITES[suite](args.scale) for _ in range(max(args.repeat, 1))])
+        )
+    for result in results:
+        print(
+            f"{result.name:<40} {result.ops_per_s:>12.0f} ops/s "
+            f"p50 {result.p50_us:>9.1f}us p90 {result.p90_us:>9.1f}us "
+            f"p99 {result.p99_us:>9.1f}us"
+        )
+    report = to_report(results)
+    if args.output is not None:
+        save_report(report, args.output)
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        return 0
+    baseline = load_report(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline} to compare against.")
+        return 0
+    regressions = compare(report, baseline, args.tolerance)
+    for name, ratio in regressions.items():
+        print(f"REGRESSION {name} at {ratio:.0%} of baseline speed")
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
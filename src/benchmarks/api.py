@@ -0,0 +1,85 @@
+"""Benchmarks of the RESTful hardware API through the Flask test client."""
+import platform
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+
+from benchmarks import BenchmarkResult
+from benchmarks import measure
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from uosinterface import static_dir
+from uosinterface import UOSCommunicationError
+from uosinterface.hardware.simulator.virtual import VirtualSerialDevice
+from uosinterface.hardware.worker import PORT_WORKERS
+from uosinterface.util import stop_logs
+from uosinterface.webapp import create_app
+
+
+def run(scale: float = 1) -> List[BenchmarkResult]:
+    """Benchmarks API requests answered by a pseudo terminal device.
+
+    The API connects over USB so this only runs on Linux, where the device
+    can be served on a pseudo terminal. Logs and the database are written to
+    a temporary directory rather than the install.
+
+    :param scale: Multiplier of the number of requests.
+    :return: List of BenchmarkResult objects, empty if not on Linux.
+    """
+    if platform.system() != "Linux":
+        return []
+    iterations = max(int(500 * scale), 1)
+    results = []
+    with TemporaryDirectory() as temp_dir:
+        app = create_app(True, base_path=Path(temp_dir), static_path=static_dir)
+        engine = create_engine(
+            f"sqlite:///{Path(temp_dir).joinpath('benchmark.db')}", future=True
+        )
+        app.config["DATABASE"] = {
+            "ENGINE": engine,
+            "SESSION": sessionmaker(bind=engine, future=True),
+        }
+        try:
+            with VirtualSerialDevice() as virtual_device, app.test_client() as client:
+                try:
+                    results = measure_requests(client, virtual_device.path, iterations)
+                finally:
+                    PORT_WORKERS.stop_all()  # release the port before it stops
+        finally:
+            stop_logs("uosinterface.webapp")
+            engine.dispose()
+    return results
+
+
+def measure_requests(client, address: str, iterations: int) -> List[BenchmarkResult]:
+    """Times API requests for instructions on a device.
+
+    :param client: The Flask test client.
+    :param address: Connection string of the device.
+    :param iterations: Number of requests timed per instruction.
+    :return: List of BenchmarkResult objects.
+    """
+    device_args = {"identity": "arduino_nano", "address": address}
+    return [
+        measure(
+            f"api.{function}",
+            lambda url=f"/api/1.0/{function}", query=dict(device_args, **args): check(
+                client.get(url, query_string=query)
+            ),
+            iterations,
+        )
+        for function, args in (
+            ("set_gpio_output", {"pin": 13, "level": 1}),
+            ("get_adc_input", {"pin": 0, "level": 0}),
+        )
+    ]
+
+
+def check(response):
+    """Stops the benchmark if a request fails, so failures aren't timed.
+
+    :param response: The test client response.
+    :raises UOSCommunicationError: If the request or instruction failed.
+    """
+    if response.status_code != 200 or not response.get_json()["status"]:
+        raise UOSCommunicationError(f"Benchmarked request failed, {response.data}")
@@ -0,0 +1,88 @@
+"""Benchmarks of instructions executed through UOSDevice."""
+import platform
+from typing import List
+
+from benchmarks import BenchmarkResult
+from benchmarks import measure
+from uosinterface import UOSCommunicationError
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.retry import NO_RETRY
+from uosinterface.hardware.simulator.virtual import VirtualSerialDevice
+
+
+def run(scale: float = 1) -> List[BenchmarkResult]:
+    """Benchmarks instructions on the stub and a pseudo terminal device.
+
+    The pseudo terminal benchmarks only run on Linux.
+
+    :param scale: Multiplier of the number of iterations.
+    :return: List of BenchmarkResult objects.
+    """
+    iterations = max(int(2000 * scale), 1)
+    results = []
+    for loading in ("EAGER", "LAZY"):
+        device = UOSDevice(
+            "arduino_nano",
+            "BENCHMARK",
+            interface=Interface.STUB,
+            loading=loading,
+            retry_policy=NO_RETRY,
+        )
+        results.extend(
+            benchmark_device(f"device.stub_{loading.lower()}", device, iterations)
+        )
+        device.close()
+    if platform.system() == "Linux":
+        with VirtualSerialDevice() as virtual_device:
+            device = UOSDevice(
+                "arduino_nano",
+                virtual_device.path,
+                loading="EAGER",
+                retry_policy=NO_RETRY,
+                low_latency=True,
+            )
+            results.extend(benchmark_device("device.pty", device, iterations))
+            device.close()
+    return results
+
+
+def benchmark_device(
+    prefix: str, device: UOSDevice, iterations: int
+) -> List[BenchmarkResult]:
+    """Benchmarks an output, an input and a configuration instruction.
+
+    :param prefix: Prepended to the function name to name each benchmark.
+    :param device: The device to execute instructions on.
+    :param iterations: Number of instructions of each type to time.
+    :return: List of BenchmarkResult objects.
+    """
+    return [
+        measure(
+            f"{prefix}.set_gpio_output",
+            lambda: check(device.set_gpio_output(13, 1)),
+            iterations,
+        ),
+        measure(
+            f"{prefix}.get_adc_input",
+            lambda: check(device.get_adc_input(0, 0)),
+            iterations,
+        ),
+        measure(
+            f"{prefix}.get_gpio_config",
+            lambda: check(device.get_gpio_config(13)),
+            iterations,
+        ),
+    ]
+
+
+def check(result):
+    """Stops the benchmark if an instruction fails, so failures aren't timed.
+
+    :param result: ComResult of the instruction.
+    :raises UOSCommunicationError: If the instruction failed.
+    """
+    if not result.status:
+        raise UOSCommunicationError(
+            f"Benchmarked instruction failed, {result.exception}"
+        )
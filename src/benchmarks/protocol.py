@@ -0,0 +1,50 @@
+"""Microbenchmarks of the NPC packet building and decoding functions."""
+from typing import List
+
+from benchmarks import BenchmarkResult
+from benchmarks import measure
+from uosinterface.hardware import get_device_definition
+from uosinterface.hardware.uosabstractions import NPCFrameDecoder
+from uosinterface.hardware.uosabstractions import UOSInterface
+
+# A get_gpio_config exchange as received, ACK followed by the config packet.
+RESPONSE = UOSInterface.get_npc_packet(0, 251, (0,)) + UOSInterface.get_npc_packet(
+    0, 251, (1, 0, 1, 0, 1, 0)
+)
+
+
+def run(scale: float = 1) -> List[BenchmarkResult]:
+    """Benchmarks the protocol functions.
+
+    :param scale: Multiplier of the number of iterations.
+    :return: List of BenchmarkResult objects.
+    """
+    iterations = max(int(2000 * scale), 1)
+    device = get_device_definition("arduino_nano")
+    decoder = NPCFrameDecoder()
+
+    def decode_frames():
+        decoder.feed(RESPONSE)
+        return list(decoder.frames())
+
+    return [
+        measure(
+            "protocol.get_npc_packet",
+            lambda: UOSInterface.get_npc_packet(64, 0, (13, 0, 1)),
+            iterations,
+            batch=100,
+        ),
+        measure(
+            "protocol.get_npc_checksum",
+            lambda: UOSInterface.get_npc_checksum([64, 0, 3, 13, 0, 1]),
+            iterations,
+            batch=100,
+        ),
+        measure("protocol.decode_frames", decode_frames, iterations, batch=100),
+        measure(
+            "protocol.get_compatible_pins",
+            lambda: device.get_compatible_pins("set_gpio_output"),
+            iterations,
+            batch=100,
+        ),
+    ]
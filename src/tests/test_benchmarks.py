@@ -0,0 +1,73 @@
+"""Tests for the benchmark suite framework."""
+import pytest
+from benchmarks import BenchmarkResult
+from benchmarks import compare
+from benchmarks import fastest
+from benchmarks import load_report
+from benchmarks import measure
+from benchmarks import percentile
+from benchmarks import protocol
+from benchmarks import save_report
+from benchmarks import to_report
+from benchmarks.__main__ import main
+
+
+def test_measure():
+    """Checks every call is counted and latencies are ordered."""
+    calls = []
+    result = measure("test.append", lambda: calls.append(1), 10, batch=5, warmup=3)
+    assert len(calls) == 53
+    assert result.iterations == 50
+    assert result.ops_per_s > 0
+    assert result.p50_us <= result.p90_us <= result.p99_us
+
+
+@pytest.mark.parametrize(
+    "percent, expected", [(0, 1), (50, 3), (90, 5), (99, 5), (100, 5)]
+)
+def test_percentile(percent: float, expected: float):
+    """Checks the nearest rank of sorted samples is returned."""
+    assert percentile([1, 2, 3, 4, 5], percent) == expected
+
+
+def test_fastest():
+    """Checks the round with the lowest median latency is kept."""
+    rounds = [
+        [BenchmarkResult("a", 1, 1, 5, 5, 5), BenchmarkResult("b", 1, 1, 2, 2, 2)],
+        [BenchmarkResult("a", 1, 1, 3, 9, 9), BenchmarkResult("b", 1, 1, 4, 4, 4)],
+    ]
+    assert fastest(rounds) == [rounds[1][0], rounds[0][1]]
+
+
+def test_compare():
+    """Checks only slow downs beyond the tolerance regress."""
+    baseline = {"results": {"a": {"p50_us": 8}, "b": {"p50_us": 8}}}
+    report = {
+        "results": {
+            "a": {"p50_us": 10},
+            "b": {"p50_us": 16},
+            "c": {"p50_us": 100},  # not in the baseline
+        }
+    }
+    assert compare(report, baseline, tolerance=0.25) == {"b": 0.5}
+    assert compare(report, baseline, tolerance=0.1) == {"a": 0.8, "b": 0.5}
+
+
+def test_main(tmp_path):
+    """Checks a run writes its report and fails against a faster baseline."""
+    output, baseline = tmp_path.joinpath("run.json"), tmp_path.joinpath("base.json")
+    arguments = ["protocol", "--scale", "0.01", "--repeat", "1"]
+    arguments += ["--baseline", str(baseline)]
+    assert main([*arguments, "--save-baseline"]) == 0
+    assert main([*arguments, "--output", str(output), "--tolerance", "1"]) == 0
+    report = load_report(output)
+    assert set(report["results"]) == {
+        result.name for result in protocol.run(scale=0.001)
+    }
+    faster = to_report(protocol.run(scale=0.001))
+    for result in faster["results"].values():
+        result["p50_us"] /= 1000
+    save_report(faster, baseline)
+    assert main(arguments) == 1
+    with pytest.raises(SystemExit):
+        main(["not_a_suite"])
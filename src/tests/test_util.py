@@ -1 +1,38 @@
 """For testing the web-app utility module."""
+from logging import DEBUG
+from logging import getLogger
+from logging.handlers import QueueHandler
+
+from uosinterface.util import configure_logs
+from uosinterface.util import LOG_LISTENERS
+from uosinterface.util import SampledTrace
+from uosinterface.util import stop_logs
+
+
+def test_configure_logs(tmp_path):
+    """Checks records are written to file via the queue listener."""
+    configure_logs("test_util", DEBUG, tmp_path)
+    configure_logs("test_util", DEBUG, tmp_path)  # replaces the first pipeline
+    logger = getLogger("test_util")
+    assert len([h for h in logger.handlers if isinstance(h, QueueHandler)]) == 1
+    logger.debug("queued %s", "record")
+    stop_logs("test_util")
+    assert "test_util" not in LOG_LISTENERS
+    assert len(logger.handlers) == 0
+    log_text = tmp_path.joinpath("logs/test_util.log").read_text()
+    assert "queued record" in log_text
+
+
+def test_sampled_trace(caplog):
+    """Checks only every nth transfer is traced and disabled by default."""
+    trace = SampledTrace("test_util.trace")
+    with caplog.at_level(DEBUG, logger="test_util.trace"):
+        trace.trace("tx %s: %s", b"\x3e\x00")
+        assert len(caplog.records) == 0
+        trace.sample_every = 2
+        for _ in range(4):
+            trace.trace("tx %s: %s", b"\x3e\x00")
+    assert [record.getMessage() for record in caplog.records] == [
+        "tx 2: 3e 00",
+        "tx 4: 3e 00",
+    ]
@@ -1,8 +1,15 @@
 """Tests for the hardware configuration module."""
+from dataclasses import FrozenInstanceError
+
 import pytest
 from uosinterface import UOSUnsupportedError
+from uosinterface.hardware import get_device_definition
 from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.uosabstractions import Device
 from uosinterface.hardware.uosabstractions import Pin
+from uosinterface.hardware.uosabstractions import PinCapability
+from uosinterface.hardware.uosabstractions import UOS_SCHEMA
+from uosinterface.hardware.uosabstractions import UOSInterface
 
 
 def test_get_compatible_pins(uos_device: UOSDevice):
@@ -30,3 +37,67 @@ def test_get_compatible_pins(uos_device: UOSDevice):
     # Check bad function throws unsupported error
     with pytest.raises(UOSUnsupportedError):
         uos_device.device.get_compatible_pins("not_a_uos_function")
+
+
+def test_packet_table(uos_device: UOSDevice):
+    """Checks the compiled packets match those built on demand."""
+    table = uos_device.device.packet_table
+    assert len(table) > 0
+    for (function_name, volatility, payload), packet in table.items():
+        assert packet == UOSInterface.get_npc_packet(
+            to_addr=UOS_SCHEMA[function_name].address_lut[volatility],
+            from_addr=0,
+            payload=payload,
+        )
+    with pytest.raises(TypeError):  # table is immutable
+        table[("reset_all_io", 0, ())] = b""
+    # Packets outside of the table are built on demand.
+    assert uos_device.device.get_packet(
+        "get_gpio_input", 0, (13, 1, 2)
+    ) == UOSInterface.get_npc_packet(to_addr=64, from_addr=0, payload=(13, 1, 2))
+
+
+def test_device_definition():
+    """Checks definitions are compiled once and are not mutated by lookups."""
+    device = get_device_definition("arduino_nano")
+    assert get_device_definition("ARDUINO_NANO") is device
+    assert device.functions_enabled["set_gpio_output"] == {0: True}
+    assert device.address_table["set_gpio_output"] == {0: 64}
+    assert device.address_table["hard_reset"] == {0: -1}
+    assert 13 in device.compatible_pins["set_gpio_output"]
+    assert device.compatible_pins["get_adc_input"] == frozenset(device.analogue_pins)
+    assert get_device_definition("not_a_device") is None
+    with pytest.raises(FrozenInstanceError):
+        device.name = "Changed"
+    with pytest.raises(TypeError):
+        device.address_table["set_gpio_output"][1] = 64
+    with pytest.raises(UOSUnsupportedError):
+        Device("Bad", [], functions_enabled={"not_a_uos_function": {0: True}})
+    custom = Device("Custom", [], functions_enabled={"reset_all_io": {0: True}})
+    assert custom.address_table == {"reset_all_io": {0: 68}}
+
+
+def test_pin_capabilities():
+    """Checks pins missing a required capability are not compatible."""
+    device = Device(
+        "Custom",
+        [],
+        functions_enabled={"set_gpio_output": {0: True}, "get_gpio_input": {0: True}},
+        digital_pins={
+            1: Pin(gpio_out=True, gpio_in=True, pwm_out=True),
+            2: Pin(gpio_in=True),
+            3: Pin(),
+        },
+        analogue_pins={0: Pin(adc_in=True)},
+    )
+    assert device.digital_capabilities[1] == (
+        PinCapability.GPIO_OUT | PinCapability.GPIO_IN | PinCapability.PWM_OUT
+    )
+    assert device.digital_capabilities[3] == PinCapability.NONE
+    assert device.compatible_pins["set_gpio_output"] == {1}
+    assert device.compatible_pins["get_gpio_input"] == {1, 2}
+    assert device.compatible_pins["get_gpio_config"] == {1, 2, 3}
+    assert list(device.get_compatible_pins("set_gpio_output")) == [1]
+    assert device.get_pins_with(PinCapability.GPIO_OUT | PinCapability.PWM_OUT) == {1}
+    assert device.get_pins_with(PinCapability.ADC_IN, analogue=True) == {0}
+    assert ("set_gpio_output", 0, (2, 0, 1)) not in device.packet_table
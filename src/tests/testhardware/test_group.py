@@ -0,0 +1,73 @@
+"""Tests for the concurrent device group module."""
+from time import sleep
+
+import pytest
+from uosinterface import UOSConfigurationError
+from uosinterface import UOSUnsupportedError
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.group import DeviceGroup
+from uosinterface.hardware.stub import NPCStub
+
+
+@pytest.fixture(scope="function")
+def stub_group():
+    """Creates a group of stub devices that is closed on teardown."""
+    group = DeviceGroup(
+        [
+            UOSDevice("arduino_nano", f"/dev/ttyUSB{index}", interface=Interface.STUB)
+            for index in range(10)
+        ]
+    )
+    yield group
+    group.close()
+
+
+def test_execute(stub_group: DeviceGroup, monkeypatch):
+    """Checks devices run concurrently and results are keyed on address."""
+    read_response = NPCStub.read_response
+
+    def slow_read_response(self, expect_packets: int, timeout_s: float):
+        sleep(0.05)  # simulate link latency
+        return read_response(self, expect_packets, timeout_s)
+
+    monkeypatch.setattr(NPCStub, "read_response", slow_read_response)
+    group_result = stub_group.execute("set_gpio_output", pin=13, level=1)
+    assert group_result.status
+    assert set(group_result.results) == set(stub_group.devices)
+    assert group_result.busy_time_s >= 0.5
+    assert group_result.wall_time_s < group_result.busy_time_s / 2
+    with pytest.raises(UOSUnsupportedError):
+        stub_group.execute("not_a_uos_function")
+
+
+def test_execute_batch(stub_group: DeviceGroup):
+    """Checks per device instruction lists run on their devices."""
+    group_result = stub_group.execute_batch(
+        {
+            "/dev/ttyUSB0": [("set_gpio_output", {"pin": 13, "level": 1})],
+            "/dev/ttyUSB1": [
+                ("get_gpio_input", {"pin": 12, "level": 0}),
+                ("get_adc_input", {"pin": 0, "level": 0}),
+            ],
+            "/dev/ttyUSB2": [("get_adc_input", {"pin": 50, "level": 0})],
+        }
+    )
+    assert len(group_result.results["/dev/ttyUSB0"]) == 1
+    assert len(group_result.results["/dev/ttyUSB1"]) == 2
+    assert not group_result.status  # invalid pin error is captured as the result
+    assert not group_result.results["/dev/ttyUSB2"].status
+    assert all(result.status for result in group_result.results["/dev/ttyUSB1"])
+    with pytest.raises(UOSConfigurationError):
+        stub_group.execute_batch({"/dev/ttyUSB99": []})
+
+
+def test_unique_addresses():
+    """Checks devices sharing an address can't be grouped."""
+    with pytest.raises(UOSConfigurationError):
+        DeviceGroup(
+            [
+                UOSDevice("arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB)
+                for _ in range(2)
+            ]
+        )
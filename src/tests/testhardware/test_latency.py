@@ -0,0 +1,78 @@
+"""Tests for the response timeout estimation module."""
+import pytest
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.latency import LATENCY_TRACKER
+from uosinterface.hardware.latency import LatencyTracker
+from uosinterface.hardware.stub import NPCStub
+
+
+def test_get_timeout():
+    """Checks timeouts are estimated from samples and clamped."""
+    tracker = LatencyTracker(margin_s=0.05, floor_s=0.1, ceiling_s=2, min_samples=10)
+    key = ("/dev/ttyUSB0", "get_gpio_input")
+    assert tracker.get_timeout(key) == 2  # no samples uses the ceiling
+    for _ in range(99):
+        tracker.record(key, 0.1)
+    tracker.record(key, 5)  # outlier above the 99th percentile
+    assert tracker.get_timeout(key) == pytest.approx(0.15)
+    for _ in range(100):
+        tracker.record(key, 0.001)
+    assert tracker.get_timeout(key) == 0.1  # floor
+    for _ in range(100):
+        tracker.record(key, 3)
+    assert tracker.get_timeout(key) == 2  # ceiling
+    tracker.reset(key)
+    assert tracker.get_timeout(key) == 2
+
+
+@pytest.mark.parametrize(
+    "device_kwargs, instruction_kwargs, expected_timeout",
+    [
+        [{}, {}, 0.1],  # estimated from the stub latency, hits the floor
+        [{"timeout_s": 0.5}, {}, 0.5],
+        [{"timeout_s": 0.5}, {"timeout_s": 0.25}, 0.25],
+    ],
+)
+def test_device_timeout(
+    monkeypatch, device_kwargs: dict, instruction_kwargs: dict, expected_timeout
+):
+    """Checks devices wait on the estimated or overridden timeout."""
+    timeouts = []
+    read_response = NPCStub.read_response
+    monkeypatch.setattr(
+        NPCStub,
+        "read_response",
+        lambda self, expect_packets, timeout_s: timeouts.append(timeout_s)
+        or read_response(self, expect_packets, timeout_s),
+    )
+    LATENCY_TRACKER.reset()
+    device = UOSDevice(
+        "arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB, **device_kwargs
+    )
+    for _ in range(LATENCY_TRACKER.min_samples + 1):
+        assert device.get_gpio_input(13, 0, **instruction_kwargs).status
+    LATENCY_TRACKER.reset()
+    assert timeouts[-1] == expected_timeout
+
+
+def test_device_latency_reset():
+    """Checks samples are kept per interface and discarded on a hard reset."""
+    LATENCY_TRACKER.reset()
+    stub = UOSDevice("arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB)
+    for _ in range(LATENCY_TRACKER.min_samples):
+        assert stub.get_gpio_input(13, 0).status
+    assert (
+        LATENCY_TRACKER.get_timeout((Interface.STUB, "/dev/ttyUSB0", "get_gpio_input"))
+        < LATENCY_TRACKER.ceiling_s
+    )
+    assert (
+        LATENCY_TRACKER.get_timeout((Interface.USB, "/dev/ttyUSB0", "get_gpio_input"))
+        == LATENCY_TRACKER.ceiling_s
+    )  # the same address on another interface is a different port
+    assert stub.hard_reset().status
+    assert (
+        LATENCY_TRACKER.get_timeout((Interface.STUB, "/dev/ttyUSB0", "get_gpio_input"))
+        == LATENCY_TRACKER.ceiling_s
+    )
+    LATENCY_TRACKER.reset()
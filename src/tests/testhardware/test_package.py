@@ -1,8 +1,13 @@
 """Unit tests for the HardwareCOM package."""
+import asyncio
+
 import pytest
 from uosinterface import UOSCommunicationError
+from uosinterface import UOSConfigurationError
 from uosinterface import UOSUnsupportedError
+from uosinterface.hardware import AsyncUOSDevice
 from uosinterface.hardware import enumerate_system_devices
+from uosinterface.hardware import GPIO_CONFIG_WINDOW
 from uosinterface.hardware import uosabstractions
 from uosinterface.hardware import UOSDevice
 from uosinterface.hardware.devices import Interface
@@ -77,6 +82,56 @@ class TestHardwareCOMInterface:
                             pin=pin, level=1, volatility=volatility
                         )
 
+    @staticmethod
+    @pytest.mark.parametrize("window", [1, 4])
+    def test_execute_batch(uos_device, window: int):
+        """Checks a batch of instructions returns a result per instruction."""
+        pins = uos_device.device.get_compatible_pins("set_gpio_output")
+        instructions = (
+            [("set_gpio_output", {"pin": pin, "level": 1}) for pin in pins]
+            + [("get_adc_input", {"pin": 0, "level": 0}), ("hard_reset", {})]
+            + [("get_system_info", {})]
+        )
+        results = uos_device.execute_batch(instructions, window=window)
+        assert len(results) == len(instructions)
+        assert all(result.status for result in results)
+        assert len(results[-1].rx_packets) == 1
+        assert uos_device.execute_batch([]) == []
+
+    @staticmethod
+    def test_get_all_gpio_config(uos_device, monkeypatch):
+        """Checks the configuration of every digital pin is read in one call."""
+        windows = []
+        execute_batch = UOSDevice.execute_batch
+        monkeypatch.setattr(
+            UOSDevice,
+            "execute_batch",
+            lambda self, batch, window=1: windows.append(window)
+            or execute_batch(self, batch, window),
+        )
+        result = uos_device.get_all_gpio_config()
+        assert windows == [GPIO_CONFIG_WINDOW]  # stays within the device buffer
+        assert result.status
+        assert list(result.aux_data["pins"]) == list(uos_device.device.digital_pins)
+        assert len(result.rx_packets) == len(uos_device.device.digital_pins)
+        assert all(
+            list(config.values()) == [0] * 6
+            for config in result.aux_data["pins"].values()
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "instruction",
+        [("set_gpio_output", {"pin": -1, "level": 1}), ("not_a_uos_function", {})],
+    )
+    def test_execute_batch_invalid(uos_device, instruction):
+        """Checks an invalid instruction fails the batch before execution."""
+        with pytest.raises(UOSUnsupportedError):
+            uos_device.execute_batch(
+                [("set_gpio_output", {"pin": 13, "level": 1}), instruction]
+            )
+        assert uos_device.set_gpio_output(13, 0).status  # not left staging
+
     @staticmethod
     def test_invalid_pin(uos_device):
         """Checks a pin based instruction with an invalid pin throws error."""
@@ -103,6 +158,85 @@ class TestHardwareCOMInterface:
         assert isinstance(devices[0], NPCStub)
 
 
+class TestAsyncUOSDevice:
+    """Tests for the asyncio object orientated abstraction layer."""
+
+    @staticmethod
+    def test_device_functions(uos_identities: {}):
+        """Checks instructions can be awaited concurrently on a device."""
+
+        async def run_instructions():
+            async with AsyncUOSDevice(
+                uos_identities["identity"],
+                uos_identities["address"],
+                uos_identities["interface"],
+                loading=uos_identities["loading"],
+            ) as device:
+                return await asyncio.gather(
+                    device.set_gpio_output(13, 1),
+                    device.get_gpio_input(12, 0),
+                    device.get_adc_input(0, 0),
+                    device.get_system_info(),
+                    device.hard_reset(),
+                )
+
+        results = asyncio.run(run_instructions())
+        assert all(result.status for result in results)
+        assert len(results[3].rx_packets) == 1
+        assert len(results[3].rx_packets[0]) == 6 + 6  # system info payload
+
+    @staticmethod
+    def test_execute_batch(uos_identities: {}):
+        """Checks a batch of instructions can be awaited."""
+        device = AsyncUOSDevice(
+            uos_identities["identity"],
+            uos_identities["address"],
+            uos_identities["interface"],
+        )
+        results = asyncio.run(
+            device.execute_batch(
+                [("set_gpio_output", {"pin": pin, "level": 0}) for pin in range(2, 14)]
+                + [("reset_all_io", {})]
+            )
+        )
+        assert len(results) == 13
+        assert all(result.status for result in results)
+        with pytest.raises(UOSUnsupportedError):
+            asyncio.run(
+                device.execute_batch([("get_adc_input", {"pin": -1, "level": 0})])
+            )
+
+    @staticmethod
+    def test_get_all_gpio_config(uos_identities: {}):
+        """Checks the configuration of every digital pin can be awaited."""
+        device = AsyncUOSDevice(
+            uos_identities["identity"],
+            uos_identities["address"],
+            uos_identities["interface"],
+        )
+        result = asyncio.run(device.get_all_gpio_config())
+        assert result.status
+        assert list(result.aux_data["pins"]) == list(device.device.digital_pins)
+
+    @staticmethod
+    def test_device_errors(uos_identities: {}):
+        """Checks invalid configurations raise the expected errors."""
+        with pytest.raises(UOSConfigurationError):
+            AsyncUOSDevice(
+                uos_identities["identity"],
+                uos_identities["address"],
+                uos_identities["interface"],
+                loading="POOLED",
+            )
+        device = AsyncUOSDevice(
+            uos_identities["identity"], "", interface=uos_identities["interface"]
+        )
+        with pytest.raises(UOSCommunicationError):
+            asyncio.run(device.open())
+        with pytest.raises(UOSUnsupportedError):
+            asyncio.run(device.set_gpio_output(-1, 1))
+
+
 class TestHardwareCOMAbstractions:
     """Test for the UOSInterface abstraction layer and helper functions."""
 
@@ -130,6 +264,105 @@ class TestHardwareCOMAbstractions:
         },
     ]
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "chunks, limit, expected_frames, expected_pending",
+        [
+            [[b">\x00\x40\x01\x00\xbf<"], 1, [b">\x00\x40\x01\x00\xbf<"], b""],
+            [  # leading noise and a trailing partial frame
+                [b"\x00\xff>\x00\x40\x01\x00\xbf<>\x00\x40"],
+                2,
+                [b">\x00\x40\x01\x00\xbf<"],
+                b">\x00\x40",
+            ],
+            [  # frame split across several reads
+                [b">\x00", b"\x40\x01", b"\x00\xbf<"],
+                None,
+                [b">\x00\x40\x01\x00\xbf<"],
+                b"",
+            ],
+            [  # limit reached leaves the following frame buffered
+                [b">\x00\x40\x01\x00\xbf<>\x00\x40\x01\x00\xbf<"],
+                1,
+                [b">\x00\x40\x01\x00\xbf<"],
+                b">\x00\x40\x01\x00\xbf<",
+            ],
+            [  # bad end symbol resyncs to the next start symbol
+                [b">\x00\x40\x01\x00\xbf\x00>\x00\x40\x01\x00\xbf<"],
+                None,
+                [b">\x00\x40\x01\x00\xbf<"],
+                b"",
+            ],
+            [[b">\x00\x40\x01\x00\xbe<"], None, [], b""],  # bad checksum
+            [[b"\x01\x02\x03"], None, [], b""],  # no start symbol
+        ],
+    )
+    def test_frame_decoder(
+        chunks: [], limit: int, expected_frames: [], expected_pending: bytes
+    ):
+        """Checks frames are decoded correctly from chunks of received data."""
+        decoder = uosabstractions.NPCFrameDecoder()
+        frames = []
+        for chunk in chunks:
+            decoder.feed(chunk)
+            frames.extend(decoder.frames(limit))
+        assert frames == expected_frames
+        assert decoder.pending() == expected_pending
+
+    @staticmethod
+    def test_com_result():
+        """Checks results are slotted and frames are decoded on access."""
+        result = uosabstractions.ComResult(
+            True,
+            ack_packet=uosabstractions.UOSInterface.get_npc_packet(0, 250, (0,)),
+            rx_packets=[uosabstractions.UOSInterface.get_npc_packet(0, 250, (1, 2))],
+        )
+        assert not hasattr(result, "__dict__")
+        assert result.get_payload() == bytes([1, 2])
+        assert result.to_dict() == {
+            "status": True,
+            "exception": "",
+            "ack_packet": [62, 0, 250, 1, 0, 5, 60],
+            "rx_packets": [[62, 0, 250, 2, 1, 2, 1, 60]],
+            "aux_data": {},
+        }
+        result.aux_data["failure"] = uosabstractions.Failure.TIMEOUT
+        assert result != uosabstractions.ComResult(True)
+        assert "timeout" in repr(result)
+
+    @staticmethod
+    def test_stub_responses():
+        """Checks the stub answers each instruction with the frames it expects."""
+        stub = NPCStub("STUB")
+        assert stub.open()
+        assert not stub.execute_instruction(99, ()).status  # unknown address
+        assert stub.execute_instruction(64, (13, 1, 0)).status  # get_gpio_input
+        assert stub.execute_instruction(250, ()).status  # get_system_info
+        result = stub.read_response(2, 0.1)
+        assert result.ack_packet == NPCStub.get_npc_packet(0, 64, (0,))
+        assert result.rx_packets == [NPCStub.get_npc_packet(0, 64, (0,))]
+        result = stub.read_response(2, 0.1)
+        assert result.rx_packets == [NPCStub.get_npc_packet(0, 250, (0,) * 6)]
+        assert not stub.read_response(2, 0.1).status  # nothing left to read
+        assert stub.execute_instruction(68, ()).status and stub.reset_input()
+        assert not stub.read_response(1, 0.1).status  # discarded
+
+    @staticmethod
+    def test_frame_decoder_counters():
+        """Checks discarded bytes are accounted for by the decoder."""
+        decoder = uosabstractions.NPCFrameDecoder()
+        decoder.feed(b"\x00\x00>\x00\x40\x01\x00\xbe<>\x00\x40\x01\x00\xbf\x00")
+        assert list(decoder.frames()) == []
+        assert decoder.dropped_bytes == 8  # leading noise and the resynced tail
+        assert decoder.checksum_errors == 1
+        assert decoder.resynced_bytes == 8
+        decoder.verify_lrc = False
+        decoder.feed(b">\x00\x40\x01\x00\xbe<")
+        assert list(decoder.frames()) == [b">\x00\x40\x01\x00\xbe<"]
+        decoder.feed(b">\x00")
+        decoder.reset()
+        assert decoder.pending() == b""
+
     @staticmethod
     def test_execute_instruction():
         """Using the base class directly should throw an error."""
@@ -169,6 +402,34 @@ class TestHardwareCOMAbstractions:
             # noinspection PyTypeChecker
             uosabstractions.UOSInterface.close(self=None)
 
+    @staticmethod
+    def test_check_open():
+        """Using the base class directly should throw an error."""
+        with pytest.raises(UOSUnsupportedError):
+            # noinspection PyTypeChecker
+            uosabstractions.UOSInterface.check_open(self=None)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "function_name",
+        ["execute_instruction", "read_response", "hard_reset", "open", "close"],
+    )
+    def test_async_interface(function_name: str):
+        """Using the asyncio base class directly should throw an error."""
+        arguments = {
+            "execute_instruction": {"address": 10, "payload": ()},
+            "read_response": {"expect_packets": 1, "timeout_s": 2},
+        }
+        with pytest.raises(UOSUnsupportedError):
+            asyncio.run(
+                getattr(uosabstractions.AsyncUOSInterface, function_name)(
+                    None,
+                    **(arguments[function_name] if function_name in arguments else {}),
+                )
+            )
+        with pytest.raises(UOSUnsupportedError):
+            uosabstractions.AsyncUOSInterface.check_open(self=None)
+
     @staticmethod
     @pytest.mark.parametrize(
         "test_packet_data, expected_lrc",
@@ -0,0 +1,136 @@
+"""Tests for the interface connection pool module."""
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import sleep
+
+import pytest
+from uosinterface import UOSCommunicationError
+from uosinterface import UOSConfigurationError
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.pool import ConnectionPool
+from uosinterface.hardware.pool import CONNECTION_POOL
+from uosinterface.hardware.stub import NPCStub
+
+
+@pytest.fixture(scope="function")
+def pool():
+    """Creates an empty connection pool that is closed on teardown."""
+    connection_pool = ConnectionPool(idle_timeout_s=60)
+    yield connection_pool
+    connection_pool.close_all()
+
+
+def test_acquire_release(pool: ConnectionPool):
+    """Checks handles are opened on acquire and reused while warm."""
+    key = (Interface.STUB, "/dev/ttyUSB0")
+    interface = pool.acquire(key, lambda: NPCStub("/dev/ttyUSB0"))
+    assert interface.check_open()
+    pool.release(key)
+    assert len(pool) == 1
+    assert pool.acquire(key, lambda: NPCStub("/dev/ttyUSB0")) is interface
+    assert interface.check_open()
+    pool.release(key, healthy=False)  # unhealthy handles are closed
+    assert not interface.check_open()
+    assert pool.acquire(key, lambda: NPCStub("/dev/ttyUSB0")) is interface
+    assert interface.check_open()  # re-opened by health check
+    pool.release(key)
+
+
+def test_acquire_errors(pool: ConnectionPool):
+    """Checks busy and un-openable handles raise communication errors."""
+    pool.acquire_timeout_s = 0.01
+    key = (Interface.STUB, "/dev/ttyUSB0")
+    pool.acquire(key, lambda: NPCStub("/dev/ttyUSB0"))
+    with pytest.raises(UOSCommunicationError):  # locked by the first acquire
+        pool.acquire(key, lambda: NPCStub("/dev/ttyUSB0"))
+    pool.release(key)
+    with pytest.raises(UOSCommunicationError):
+        pool.acquire((Interface.STUB, ""), lambda: NPCStub(""))
+
+
+def test_acquire_settings(pool: ConnectionPool):
+    """Checks a handle can't be shared by users asking for other settings."""
+    key = (Interface.STUB, "/dev/ttyUSB0")
+    interface = pool.get_interface(key, partial(NPCStub, "/dev/ttyUSB0", errored=0))
+    assert pool.get_interface(key, partial(NPCStub, "/dev/ttyUSB0", errored=0)) is (
+        interface
+    )
+    with pytest.raises(UOSConfigurationError):
+        pool.acquire(key, partial(NPCStub, "/dev/ttyUSB0", errored=1))
+
+
+def test_evict_idle(pool: ConnectionPool):
+    """Checks idle handles are closed and removed from the pool."""
+    key = (Interface.STUB, "/dev/ttyUSB0")
+    interface = pool.acquire(key, lambda: NPCStub("/dev/ttyUSB0"))
+    pool.idle_timeout_s = 0
+    pool.evict_idle()
+    assert len(pool) == 1  # in use so cannot be evicted
+    pool.release(key)  # release evicts
+    assert len(pool) == 0
+    assert not interface.check_open()
+
+
+def test_idle_close(pool: ConnectionPool):
+    """Checks the last connection is closed once idle without further use."""
+    pool.idle_timeout_s = 0.05
+    key = (Interface.STUB, "/dev/ttyUSB0")
+    interface = pool.acquire(key, lambda: NPCStub("/dev/ttyUSB0"))
+    pool.release(key)
+    assert len(pool) == 1 and interface.check_open()  # still warm
+    sleep(0.2)
+    assert len(pool) == 0
+    assert not interface.check_open()
+
+
+def test_pooled_device(monkeypatch):
+    """Checks pooled devices share a connection that stays open."""
+    devices = [
+        UOSDevice("arduino_nano", "/dev/ttyUSB1", Interface.STUB, loading="POOLED")
+        for _ in range(2)
+    ]
+    assert all(device.is_pooled() and not device.is_lazy() for device in devices)
+    for device in devices:
+        assert device.set_gpio_output(13, 1).status
+    interface = CONNECTION_POOL.get_interface((Interface.STUB, "/dev/ttyUSB1"), None)
+    assert interface.check_open()
+    devices[0].open()  # explicitly holding the connection blocks others
+    CONNECTION_POOL.acquire_timeout_s, timeout_s = (
+        0.01,
+        CONNECTION_POOL.acquire_timeout_s,
+    )
+    with pytest.raises(UOSCommunicationError):
+        devices[1].open()
+    CONNECTION_POOL.acquire_timeout_s = timeout_s
+    devices[0].close()
+    CONNECTION_POOL.close_all()
+    assert not interface.check_open()
+
+
+def test_pooled_device_threads(monkeypatch):
+    """Checks threads sharing a pooled device take turns on the handle."""
+    in_flight, peak = [0], [0]
+    execute_instruction, read_response = (
+        NPCStub.execute_instruction,
+        NPCStub.read_response,
+    )
+
+    def counted_execute_instruction(self, *args):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        sleep(0.001)  # widen the window for another thread to interleave
+        return execute_instruction(self, *args)
+
+    def counted_read_response(self, *args):
+        in_flight[0] -= 1
+        return read_response(self, *args)
+
+    monkeypatch.setattr(NPCStub, "execute_instruction", counted_execute_instruction)
+    monkeypatch.setattr(NPCStub, "read_response", counted_read_response)
+    device = UOSDevice("arduino_nano", "/dev/ttyUSB2", Interface.STUB, loading="POOLED")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: device.get_gpio_input(13, 0), range(40)))
+    assert all(result.status for result in results)
+    assert peak[0] == 1
+    CONNECTION_POOL.close_all()
@@ -0,0 +1,93 @@
+"""Tests for the instruction retry policy module."""
+import asyncio
+
+import pytest
+from uosinterface.hardware import AsyncUOSDevice
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.retry import NO_RETRY
+from uosinterface.hardware.retry import RetryPolicy
+from uosinterface.hardware.retry import RetryRule
+from uosinterface.hardware.stub import NPCStub
+from uosinterface.hardware.uosabstractions import ComResult
+from uosinterface.hardware.uosabstractions import Failure
+
+
+def test_get_rule():
+    """Checks rules are looked up on the failure class."""
+    policy = RetryPolicy()
+    for failure in Failure:
+        result = ComResult(False, aux_data={"failure": failure})
+        assert policy.get_rule(result) is policy.rules[failure]
+    assert policy.get_rule(ComResult(False)) is policy.default
+    assert NO_RETRY.get_rule(ComResult(False)).attempts == 0
+    assert RetryRule(backoff_s=0.1).get_delay(3) == pytest.approx(0.4)
+
+
+@pytest.fixture(scope="function")
+def flaky_stub(monkeypatch):
+    """Patches the stub to fail reads with a failure class a number of times."""
+    calls = {"reads": 0, "resyncs": 0, "failures": [], "failure": Failure.TIMEOUT}
+    read_response = NPCStub.read_response
+
+    def failing_read_response(self, expect_packets: int, timeout_s: float):
+        calls["reads"] += 1
+        if calls["reads"] <= calls["failures"]:
+            read_response(self, expect_packets, timeout_s)  # discard the response
+            return ComResult(False, aux_data={"failure": calls["failure"]})
+        return read_response(self, expect_packets, timeout_s)
+
+    def reset_input(self):
+        calls["resyncs"] += 1
+        return True
+
+    monkeypatch.setattr(NPCStub, "read_response", failing_read_response)
+    monkeypatch.setattr(NPCStub, "reset_input", reset_input)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "failure, failures, expected_status, expected_reads",
+    [
+        [Failure.TIMEOUT, 1, False, 1],  # timeouts aren't retried by default
+        [Failure.PARTIAL_FRAME, 1, True, 2],
+        [Failure.PARTIAL_FRAME, 2, False, 2],  # one retry on partial frames
+        [Failure.CHECKSUM, 2, True, 3],  # two retries on checksum errors
+        [Failure.CHECKSUM, 3, False, 3],
+    ],
+)
+def test_device_retry(
+    flaky_stub: dict,
+    failure: Failure,
+    failures: int,
+    expected_status: bool,
+    expected_reads: int,
+):
+    """Checks failures are retried with a resync as defined by the policy."""
+    flaky_stub["failure"] = failure
+    flaky_stub["failures"] = failures
+    device = UOSDevice("arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB)
+    assert device.get_gpio_input(13, 0).status == expected_status
+    assert flaky_stub["reads"] == expected_reads
+    assert flaky_stub["resyncs"] == expected_reads - 1
+
+
+def test_device_no_retry(flaky_stub: dict):
+    """Checks failures are returned immediately when retries are disabled."""
+    flaky_stub["failures"] = 1
+    device = UOSDevice(
+        "arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB, retry_policy=NO_RETRY
+    )
+    result = device.get_gpio_input(13, 0)
+    assert not result.status
+    assert result.aux_data["failure"] == Failure.TIMEOUT
+    assert flaky_stub["reads"] == 1
+
+
+def test_async_device_retry(flaky_stub: dict):
+    """Checks asyncio devices retry with the same policy."""
+    flaky_stub["failure"] = Failure.CHECKSUM
+    flaky_stub["failures"] = 2
+    device = AsyncUOSDevice("arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB)
+    assert asyncio.run(device.get_gpio_input(13, 0)).status
+    assert flaky_stub["reads"] == 3
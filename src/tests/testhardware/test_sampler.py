@@ -0,0 +1,62 @@
+"""Tests for the ADC streaming sampler module."""
+from time import sleep
+
+import pytest
+from uosinterface import UOSConfigurationError
+from uosinterface import UOSUnsupportedError
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.sampler import ADCSampler
+
+
+@pytest.fixture(scope="function")
+def stub_device():
+    """Creates an eagerly loaded stub device that is closed on teardown."""
+    device = UOSDevice(
+        "arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB, loading="EAGER"
+    )
+    yield device
+    device.close()
+
+
+def test_sampler(stub_device: UOSDevice):
+    """Checks sweeps are stored and the latest views wrap the ring buffer."""
+    sampler = ADCSampler(stub_device, [0, 1], rate_hz=1000, capacity=8)
+    assert len(sampler.latest(0)) == 0
+    assert sampler.achieved_rate_hz == 0
+    with sampler:
+        assert sampler.is_running()
+        sleep(0.1)
+    assert not sampler.is_running()
+    assert sampler.sweeps > sampler.capacity  # buffer has wrapped
+    assert sampler.errors == 0
+    achieved_rate_hz = sampler.achieved_rate_hz
+    assert achieved_rate_hz > 0
+    sleep(0.05)
+    assert sampler.achieved_rate_hz == achieved_rate_hz  # frozen once stopped
+    with sampler:  # restarting only counts the sweeps of the new run
+        sleep(0.05)
+    assert 0 < sampler.achieved_rate_hz < 2 * achieved_rate_hz
+    values = sampler.latest(1)
+    assert len(values) == sampler.capacity
+    assert values.format == "H" and values.tolist() == [0] * sampler.capacity
+    assert len(sampler.latest(0, 3)) == 3
+    timestamps = sampler.latest_timestamps()
+    assert list(timestamps) == sorted(timestamps)
+    assert timestamps[-1] >= timestamps[0] > 0
+
+
+@pytest.mark.parametrize(
+    "pins, loading, error",
+    [
+        ([0, 13], "EAGER", UOSUnsupportedError),  # 13 is not analogue
+        ([0], "LAZY", UOSConfigurationError),
+    ],
+)
+def test_sampler_configuration(pins: list, loading: str, error: type):
+    """Checks invalid pins and lazy devices are rejected."""
+    device = UOSDevice(
+        "arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB, loading=loading
+    )
+    with pytest.raises(error):
+        ADCSampler(device, pins, rate_hz=100)
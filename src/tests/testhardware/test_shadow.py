@@ -0,0 +1,87 @@
+"""Tests for the pin state shadow cache module."""
+import asyncio
+from time import sleep
+
+import pytest
+from uosinterface.hardware import AsyncUOSDevice
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.shadow import PinStateCache
+
+CONFIG = {
+    "current_mode": 0,
+    "current_level": 1,
+    "ram_mode": 1,
+    "ram_level": 0,
+    "eeprom_mode": 1,
+    "eeprom_level": 0,
+}
+
+
+def test_pin_state_cache():
+    """Checks entries are written through, expire and are invalidated."""
+    cache = PinStateCache(max_age_s=0.05)
+    assert cache.get(13) is None
+    cache.write(13, 0, 0, 1)
+    assert cache.get(13) is None  # ram and eeprom state unknown
+    cache.update(13, CONFIG)
+    assert cache.get(13) == CONFIG
+    cache.write(13, 0, 0, 0)
+    assert cache.get(13)["current_level"] == 0
+    sleep(0.06)
+    assert cache.get(13) is None  # stale
+    cache.update(13, CONFIG)
+    cache.update(12, CONFIG)
+    cache.invalidate(13)
+    assert cache.get(13) is None and cache.get(12) == CONFIG
+    cache.invalidate()
+    assert cache.get(12) is None
+
+
+@pytest.mark.parametrize(
+    "instruction, cached",
+    [
+        (("set_gpio_output", {"pin": 13, "level": 1}), True),
+        (("set_gpio_output", {"pin": 12, "level": 1}), True),  # other pin
+        (("get_gpio_input", {"pin": 13, "level": 0}), False),
+        (("reset_all_io", {}), False),
+        (("hard_reset", {}), False),
+    ],
+)
+def test_device_state_cache(instruction: tuple, cached: bool):
+    """Checks config reads are answered locally until invalidated."""
+    device = UOSDevice(
+        "arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB, state_cache_s=10
+    )
+    result = device.get_gpio_config(13)
+    assert result.status and "cached" not in result.aux_data
+    result = device.get_gpio_config(13)
+    assert result.status and result.aux_data["cached"]
+    assert "cached" not in device.get_gpio_config(13, force_read=True).aux_data
+    function_name, arguments = instruction
+    assert getattr(device, function_name)(**arguments).status
+    result = device.get_gpio_config(13)
+    assert result.aux_data.get("cached", False) == cached
+    if function_name == "set_gpio_output" and arguments["pin"] == 13:
+        assert result.rx_packets[0][5] == arguments["level"]  # written through
+
+
+def test_device_state_cache_disabled(uos_device):
+    """Checks config is read from the device when the cache isn't enabled."""
+    assert uos_device.set_gpio_output(13, 1).status
+    assert "cached" not in uos_device.get_gpio_config(13).aux_data
+
+
+def test_async_device_state_cache():
+    """Checks asyncio devices share the cache behaviour."""
+
+    async def read_config_twice():
+        async with AsyncUOSDevice(
+            "arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB, state_cache_s=10
+        ) as device:
+            await device.get_gpio_config(13)
+            await device.set_gpio_output(13, 1)
+            return await device.get_gpio_config(13)
+
+    result = asyncio.run(read_config_twice())
+    assert result.aux_data["cached"]
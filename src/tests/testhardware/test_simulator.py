@@ -0,0 +1,84 @@
+"""Tests for the latency modelled device simulator."""
+from time import monotonic
+
+import pytest
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.retry import NO_RETRY
+from uosinterface.hardware.simulator import constant
+from uosinterface.hardware.simulator import NPCSimulator
+from uosinterface.hardware.simulator import sine_wave
+from uosinterface.hardware.uosabstractions import Failure
+
+
+def get_device(**simulation) -> UOSDevice:
+    """Creates an eagerly loaded device on the simulator interface."""
+    return UOSDevice(
+        "arduino_nano",
+        "SIMULATOR",
+        interface=Interface.SIMULATOR,
+        loading="EAGER",
+        retry_policy=NO_RETRY,
+        simulation=simulation,
+    )
+
+
+def test_pin_state():
+    """Checks pin state is kept and restored by resets."""
+    device = get_device(inputs={12: 1})
+    config = device.get_gpio_config(13)
+    assert config.status and config.get_payload() == bytes([1, 0] * 3)
+    assert device.set_gpio_output(13, 1).status
+    assert device.get_gpio_config(13).get_payload()[:2] == bytes([0, 1])
+    assert device.get_gpio_input(12, 0).get_payload() == bytes([1])  # driven
+    assert device.get_gpio_input(11, 1).get_payload() == bytes([1])  # pull up
+    assert device.reset_all_io().status
+    assert device.get_gpio_config(13).get_payload()[:2] == bytes([1, 0])
+    assert device.set_gpio_output(13, 1).status
+    assert device.hard_reset().status
+    assert device.get_gpio_config(13).get_payload()[:2] == bytes([1, 0])
+    assert device.get_device_info(force_read=True).version == (0, 0, 0)
+    device.close()
+
+
+@pytest.mark.parametrize(
+    "waveform, expected",
+    [(constant(700), 700), (constant(5000), 1023), (sine_wave(0, 100, 0), 0)],
+)
+def test_waveforms(waveform, expected: int):
+    """Checks ADC readings follow the waveform, clamped to 10 bits."""
+    device = get_device(waveforms={0: waveform})
+    result = device.get_adc_input(0, 0)
+    assert int.from_bytes(result.get_payload(), "little") == expected
+    device.close()
+
+
+def test_link_timing():
+    """Checks responses take the modelled link time, and pipelining overlaps them."""
+    simulator = NPCSimulator("SIMULATOR", baudrate=9600, processing_s=0.001)
+    assert simulator.get_link_time_s(12) == pytest.approx(0.0125)
+    assert simulator.open()
+    start_s = monotonic()
+    assert simulator.execute_instruction(250, ()).status
+    assert simulator.read_response(2, 1).status
+    single_s = monotonic() - start_s
+    assert single_s >= simulator.get_link_time_s(6 + 7 + 12) + 0.001
+    instructions = [(85, (pin,), 2, None) for pin in range(8)]
+    start_s = monotonic()
+    assert all(r.status for r in simulator.execute_pipeline(instructions, 1, 1))
+    stop_and_wait_s = monotonic() - start_s
+    start_s = monotonic()
+    assert all(r.status for r in simulator.execute_pipeline(instructions, 1, 8))
+    assert monotonic() - start_s < stop_and_wait_s
+    assert not simulator.read_response(2, 0.01).status  # nothing in flight
+
+
+def test_error_injection():
+    """Checks injected faults are classified like real link failures."""
+    device = get_device(error_rate=1, seed=1)
+    failures = {
+        device.get_system_info(timeout_s=0.05).aux_data["failure"] for _ in range(20)
+    }
+    assert failures == {Failure.TIMEOUT, Failure.CHECKSUM, Failure.PARTIAL_FRAME}
+    device.close()
+    assert not device.get_system_info().status  # closed
@@ -0,0 +1,96 @@
+"""Tests for the typed and memoized system information."""
+import asyncio
+
+import pytest
+from uosinterface import UOSCommunicationError
+from uosinterface.hardware import AsyncUOSDevice
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import ARDUINO_NANO_3
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.stub import NPCStub
+from uosinterface.hardware.sysinfo import SYSTEM_INFO_CACHE
+from uosinterface.hardware.sysinfo import SystemInfo
+from uosinterface.hardware.uosabstractions import ComResult
+from uosinterface.hardware.uosabstractions import UOSInterface
+from uosinterface.hardware.usbserial import PORT_INVENTORY
+
+
+@pytest.mark.parametrize(
+    "payload, version_string, device",
+    [
+        ((1, 2, 3, 0, 0, 0), "V1.2.3", ARDUINO_NANO_3),
+        ((0, 0, 9, 255, 0, 0), "V0.0.9", None),
+    ],
+)
+def test_from_result(payload: tuple, version_string: str, device):
+    """Checks system info responses are parsed into typed fields."""
+    system_info = SystemInfo.from_result(
+        ComResult(True, rx_packets=[UOSInterface.get_npc_packet(0, 250, payload)])
+    )
+    assert system_info.version == payload[:3]
+    assert system_info.hwid == payload[3]
+    assert system_info.version_string == version_string
+    assert system_info.device == device
+
+
+@pytest.fixture(scope="function")
+def counted_reads(monkeypatch):
+    """Counts the system info instructions executed on stub devices."""
+    SYSTEM_INFO_CACHE.invalidate()
+    reads = []
+    execute_instruction = NPCStub.execute_instruction
+
+    def counting_execute_instruction(self, address, payload, packet=None):
+        if address == 250:
+            reads.append(address)
+        return execute_instruction(self, address, payload, packet)
+
+    monkeypatch.setattr(NPCStub, "execute_instruction", counting_execute_instruction)
+    yield reads
+    SYSTEM_INFO_CACHE.invalidate()
+
+
+def test_device_info_memoized(counted_reads: list, monkeypatch):
+    """Checks system info is read once per connection generation."""
+    device = UOSDevice("arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB)
+    system_info = device.get_device_info()
+    assert system_info.device == ARDUINO_NANO_3
+    assert (
+        UOSDevice(
+            "arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB
+        ).get_device_info()
+        is system_info
+    )  # shared across device instances
+    assert len(counted_reads) == 1
+    device.get_device_info(force_read=True)
+    assert len(counted_reads) == 2
+    assert device.hard_reset().status
+    device.get_device_info()
+    assert len(counted_reads) == 3
+    monkeypatch.setattr(PORT_INVENTORY, "generation", PORT_INVENTORY.generation + 1)
+    device.get_device_info()  # ports changed
+    assert len(counted_reads) == 4
+    device.get_device_info()
+    assert len(counted_reads) == 4
+
+
+def test_async_reset_invalidates(counted_reads: list):
+    """Checks a hard reset by an asyncio device invalidates the port's info."""
+    UOSDevice(
+        "arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB
+    ).get_device_info()
+    device = AsyncUOSDevice("arduino_nano", "/dev/ttyUSB0", interface=Interface.STUB)
+    assert asyncio.run(device.hard_reset()).status
+    assert (
+        SYSTEM_INFO_CACHE.get(
+            (Interface.STUB, "/dev/ttyUSB0"), PORT_INVENTORY.generation
+        )
+        is None
+    )
+
+
+def test_device_info_error():
+    """Checks a failed read raises rather than returning partial info."""
+    device = UOSDevice("arduino_nano", "", interface=Interface.STUB)
+    with pytest.raises(UOSCommunicationError):
+        device.get_device_info()
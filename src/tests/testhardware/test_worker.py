@@ -0,0 +1,99 @@
+"""Tests for the per-port worker thread module."""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+
+import pytest
+from uosinterface import UOSCommunicationError
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.stub import NPCStub
+from uosinterface.hardware.worker import PORT_WORKERS
+from uosinterface.hardware.worker import PortWorker
+
+
+def test_port_worker():
+    """Checks requests run in order and errors are returned via futures."""
+    worker = PortWorker(NPCStub("/dev/ttyUSB0"), idle_timeout_s=0.05)
+    order = []
+    futures = [
+        worker.submit(lambda interface, index=index: order.append(index) or index)
+        for index in range(10)
+    ]
+    assert [future.result() for future in futures] == list(range(10))
+    assert order == list(range(10))
+    with pytest.raises(ZeroDivisionError):
+        worker.submit(lambda interface: 1 / 0).result()
+    worker.submit(lambda interface: interface.open()).result()
+    sleep(0.2)
+    assert not worker.interface.check_open()  # closed when idle
+    worker.stop()
+    assert not worker.is_alive()
+
+
+def test_queued_device(monkeypatch):
+    """Checks concurrent instructions on a queued device don't interleave."""
+    active = []
+    overlaps = []
+    execute_instruction = NPCStub.execute_instruction
+    read_response = NPCStub.read_response
+
+    def tracked_execute_instruction(self, address, payload, packet=None):
+        overlaps.append(len(active) > 0)
+        active.append(address)
+        return execute_instruction(self, address, payload, packet)
+
+    def tracked_read_response(self, expect_packets, timeout_s):
+        sleep(0.001)  # widen the window for interleaving
+        response = read_response(self, expect_packets, timeout_s)
+        active.pop()
+        return response
+
+    monkeypatch.setattr(NPCStub, "execute_instruction", tracked_execute_instruction)
+    monkeypatch.setattr(NPCStub, "read_response", tracked_read_response)
+    devices = [
+        UOSDevice("arduino_nano", "/dev/ttyUSB0", Interface.STUB, loading="QUEUED")
+        for _ in range(8)
+    ]
+    assert len({id(device._device_interface) for device in devices}) == 1
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda device: [device.get_gpio_input(13, 0) for _ in range(10)],
+                devices,
+            )
+        )
+    assert all(result.status for device_results in results for result in device_results)
+    assert len(overlaps) == 80 and not any(overlaps)
+    PORT_WORKERS.stop_all()
+    assert len(PORT_WORKERS) == 0
+
+
+def test_queued_open_error():
+    """Checks errors opening the port are raised to the caller."""
+    device = UOSDevice("arduino_nano", "", Interface.STUB, loading="QUEUED")
+    with pytest.raises(UOSCommunicationError):
+        device.get_gpio_input(13, 0)
+    PORT_WORKERS.stop_all()
+
+
+def test_shared_device_batches():
+    """Checks instructions from other threads aren't staged into a batch."""
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often to expose races
+    device = UOSDevice("arduino_nano", "/dev/ttyUSB0", Interface.STUB, loading="QUEUED")
+    batch = [("get_gpio_input", {"pin": 13, "level": 0})] * 8
+
+    def run(index: int) -> list:
+        if index % 2 == 0:
+            return [len(device.execute_batch(batch, window=8)) for _ in range(50)]
+        return [len(device.get_gpio_input(13, 0).ack_packet) for _ in range(50)]
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(run, range(8)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert all(size == 8 for sizes in results[::2] for size in sizes)
+    assert all(ack > 0 for acks in results[1::2] for ack in acks)  # really ran
+    PORT_WORKERS.stop_all()
@@ -1,8 +1,12 @@
 """Module for testing the the USB serial package hardware interface."""
 from time import sleep
+from types import SimpleNamespace
 
 import pytest
+from uosinterface.hardware import usbserial
+from uosinterface.hardware.uosabstractions import Failure
 from uosinterface.hardware.usbserial import NPCSerialPort
+from uosinterface.hardware.usbserial import PortInventory
 
 
 class TestNPCSerialPort:
@@ -40,6 +44,19 @@ class TestNPCSerialPort:
         assert not npc_serial_port.check_open()
         assert isinstance(npc_serial_port.enumerate_devices(), list)
 
+    @staticmethod
+    def test_low_latency(usb_serial_argument):
+        """Checks instructions complete when waiting on data instead of polling."""
+        serial_port = NPCSerialPort(
+            usb_serial_argument, baudrate=115200, low_latency=True
+        )
+        assert serial_port.is_low_latency()
+        assert serial_port.open()
+        sleep(2)  # Allow the system time to boot
+        assert serial_port.execute_instruction(64, (13, 0, 1)).status
+        assert serial_port.read_response(expect_packets=1, timeout_s=2).status
+        assert serial_port.close()
+
     @staticmethod
     def test_basic_fault_cases(invalid_serial_port):
         """Checks the invalid fixture fails correctly."""
@@ -50,3 +67,111 @@ class TestNPCSerialPort:
         assert not invalid_serial_port.read_response(
             expect_packets=1, timeout_s=1
         ).status
+
+
+def test_port_inventory(monkeypatch):
+    """Checks ports are cached between refreshes and indexed by device."""
+    ports = [SimpleNamespace(device="/dev/ttyUSB0")]
+    scans = []
+    monkeypatch.setattr(
+        usbserial.list_ports, "comports", lambda: scans.append(1) or list(ports)
+    )
+    inventory = PortInventory(ttl_s=60)
+    assert inventory.find("/dev/ttyUSB0") is ports[0]
+    assert inventory.find("ttyUSB0") is ports[0]  # partial connection string
+    assert inventory.find("/dev/ttyUSB1") is None
+    assert inventory.get_ports() == ports
+    assert len(scans) == 1  # served from the cache
+    generation = inventory.generation
+    ports.append(SimpleNamespace(device="/dev/ttyUSB1"))
+    assert inventory.find("/dev/ttyUSB1") is None  # stale until refreshed
+    inventory.invalidate()
+    assert inventory.find("/dev/ttyUSB1") is ports[1]
+    assert inventory.generation == generation + 1
+    inventory.ttl_s = 0  # expires immediately
+    inventory.find("/dev/ttyUSB1")
+    assert len(scans) == 3
+
+
+def test_port_inventory_dev_mtime(monkeypatch):
+    """Checks a change to the device directory refreshes the ports before the TTL."""
+    ports = [SimpleNamespace(device="/dev/ttyUSB0")]
+    scans = []
+    dev_mtime = [1]
+    monkeypatch.setattr(
+        usbserial.list_ports, "comports", lambda: scans.append(1) or list(ports)
+    )
+    monkeypatch.setattr(
+        usbserial, "stat", lambda path: SimpleNamespace(st_mtime_ns=dev_mtime[0])
+    )
+    inventory = PortInventory(ttl_s=60)
+    assert inventory.find("/dev/ttyUSB0") is ports[0]
+    generation = inventory.generation
+    ports.append(SimpleNamespace(device="/dev/ttyUSB1"))
+    assert inventory.find("/dev/ttyUSB1") is None  # directory unchanged
+    assert len(scans) == 1
+    dev_mtime[0] = 2  # port added to /dev
+    assert inventory.find("/dev/ttyUSB1") is ports[1]
+    assert len(scans) == 2
+    assert inventory.generation == generation + 1
+    inventory.find("/dev/ttyUSB1")
+    assert len(scans) == 2  # cached again at the new modification time
+
+
+class FakeSerial:
+    """Serial device double returning a fixed byte stream to reads."""
+
+    def __init__(self, stream: bytes):
+        """Instantiate with the bytes to be received."""
+        self.stream = bytearray(stream)
+        self.written = []
+
+    @property
+    def in_waiting(self) -> int:
+        """Number of bytes left to read."""
+        return len(self.stream)
+
+    def read(self, size: int) -> bytes:
+        """Reads up to size bytes of the stream."""
+        data = bytes(self.stream[:size])
+        del self.stream[:size]
+        return data
+
+    def write(self, data: bytes) -> int:
+        """Records written data."""
+        self.written.append(data)
+        return len(data)
+
+    def flush(self):
+        """Nothing is buffered."""
+
+
+def test_pipeline_lost_frame():
+    """Checks a lost data frame isn't replaced by the next instruction's ACK."""
+    ack = NPCSerialPort.get_npc_packet(0, 251, (0,))
+    config = NPCSerialPort.get_npc_packet(0, 251, (1, 0, 1, 0, 1, 0))
+    serial_port = NPCSerialPort("not_a_valid_connection")
+    serial_port._device = FakeSerial(ack + ack + config)  # first config lost
+    results = serial_port.execute_pipeline(
+        [(251, (pin,), 2, None) for pin in (2, 3)], timeout_s=0.2, window=2
+    )
+    assert not results[0].status
+    assert results[0].aux_data["failure"] == Failure.PARTIAL_FRAME
+    assert results[1].status and results[1].rx_packets == [config]
+
+
+def test_read_response_keeps_buffered_frames():
+    """Checks frames received early are kept for the following read."""
+    ack = NPCSerialPort.get_npc_packet(0, 64, (0,))
+    gpio = NPCSerialPort.get_npc_packet(0, 64, (1,))
+    serial_port = NPCSerialPort("not_a_valid_connection")
+    serial_port._device = FakeSerial(ack + gpio + ack)  # both responses at once
+    first = serial_port.read_response(expect_packets=2, timeout_s=0.2)
+    assert first.status and first.ack_packet == ack and first.rx_packets == [gpio]
+    second = serial_port.read_response(expect_packets=1, timeout_s=0.2)
+    assert second.status and second.ack_packet == ack
+    serial_port._device.stream += ack + gpio[:3]  # next frame partly received
+    assert serial_port.read_response(expect_packets=1, timeout_s=0.2).status
+    serial_port._device.stream += gpio[3:]
+    third = serial_port.read_response(expect_packets=1, timeout_s=0.2)
+    assert third.status and third.ack_packet == gpio
@@ -0,0 +1,95 @@
+"""Tests the serial backend end to end against a pseudo terminal device."""
+import asyncio
+import platform
+
+import pytest
+from uosinterface.hardware import AsyncUOSDevice
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.retry import NO_RETRY
+from uosinterface.hardware.simulator import constant
+from uosinterface.hardware.simulator.virtual import VirtualSerialDevice
+from uosinterface.hardware.usbserial import NPCSerialPort
+from uosinterface.hardware.usbserial import PortInventory
+
+pytestmark = pytest.mark.skipif(
+    platform.system() != "Linux", reason="Pseudo terminals require Linux."
+)
+
+
+@pytest.fixture
+def virtual_device():
+    """Serves a virtual device on a pseudo terminal for a test."""
+    with VirtualSerialDevice(
+        version=(1, 2, 3), hwid=1, waveforms={0: constant(700)}
+    ) as device:
+        yield device
+
+
+@pytest.mark.parametrize("low_latency", [False, True])
+def test_serial_port(virtual_device: VirtualSerialDevice, low_latency: bool):
+    """Checks the serial port writes and reads frames over a pseudo terminal."""
+    assert PortInventory.is_pseudo_terminal(virtual_device.path)
+    assert not PortInventory.is_pseudo_terminal("/dev/pts/not_a_terminal")
+    serial_port = NPCSerialPort(virtual_device.path, low_latency=low_latency)
+    assert serial_port.open()
+    assert serial_port.execute_instruction(64, (13, 0, 1)).status
+    assert serial_port.read_response(expect_packets=1, timeout_s=1).status
+    assert serial_port.execute_instruction(99, ()).status  # ignored by the device
+    assert serial_port.read_response(expect_packets=1, timeout_s=0.1).exception
+    results = serial_port.execute_pipeline(
+        [(251, (13,), 2, None), (85, (0,), 2, None)], timeout_s=1, window=2
+    )
+    assert [result.get_payload() for result in results] == [
+        bytes([0, 1, 1, 0, 1, 0]),
+        (700).to_bytes(2, "little"),
+    ]
+    assert not serial_port.hard_reset().status  # no DTR line to drive
+    assert serial_port.close()
+    assert virtual_device.instructions == 3
+    assert virtual_device.unknown == 1
+
+
+def test_device(virtual_device: VirtualSerialDevice):
+    """Checks a device can be used over the USB interface with no hardware."""
+    device = UOSDevice(
+        "arduino_nano",
+        virtual_device.path,
+        loading="EAGER",
+        retry_policy=NO_RETRY,
+        low_latency=True,
+    )
+    for level in (1, 0) * 50:
+        assert device.set_gpio_output(13, level).status
+    assert device.get_gpio_config(13).get_payload()[:2] == bytes([0, 0])
+    assert device.get_device_info(force_read=True).version == (1, 2, 3)
+    device.close()
+    assert virtual_device.instructions == 102
+
+
+def test_async_device(virtual_device: VirtualSerialDevice):
+    """Checks the asyncio serial port reads frames from a pseudo terminal."""
+
+    async def run():
+        device = AsyncUOSDevice(
+            "arduino_nano", virtual_device.path, retry_policy=NO_RETRY
+        )
+        try:
+            result = await device.get_adc_input(0, 0)
+            assert int.from_bytes(result.get_payload(), "little") == 700
+            assert not (await device.hard_reset()).status
+        finally:
+            await device.close()
+
+    asyncio.run(run())
+
+
+def test_stop():
+    """Checks the pseudo terminal is released when the server stops."""
+    device = VirtualSerialDevice()
+    assert not device.is_running()
+    path = device.start()
+    assert device.start() == path  # already serving
+    assert device.is_running()
+    device.stop()
+    device.stop()  # safe to stop twice
+    assert not device.is_running()
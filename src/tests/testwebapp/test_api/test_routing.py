@@ -0,0 +1,15 @@
+"""Module for testing the routing of the API."""
+import pytest
+
+
+@pytest.mark.parametrize("function", ["get_device_info", "is_lazy", "open", "close"])
+def test_non_instruction_route(client, function: str):
+    """Checks functions that don't return a ComResult aren't executed."""
+    response = client.get(
+        f"/api/1.0/{function}?identity=arduino_nano&address=/dev/ttyUSB0"
+    )
+    assert response.status_code == 200
+    assert response.json["status"] is False
+    assert response.json["exception"] == (
+        f"function '{function}' has not been implemented."
+    )
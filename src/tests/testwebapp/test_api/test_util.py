@@ -0,0 +1,27 @@
+"""Module for testing the API utilities."""
+import json
+
+from uosinterface.hardware.uosabstractions import ComResult
+from uosinterface.hardware.uosabstractions import Failure
+from uosinterface.webapp.api.util import APIresult
+from uosinterface.webapp.api.util import UOSJSONEncoder
+
+
+def test_json_encoder():
+    """Checks results serialize with frames as lists of integers."""
+    result = ComResult(
+        False,
+        exception="timed out",
+        ack_packet=bytes([62, 0, 64, 1, 0, 191, 60]),
+        aux_data={"failure": Failure.TIMEOUT},
+    )
+    encoded = json.loads(
+        json.dumps(APIresult(False, result.exception, result), cls=UOSJSONEncoder)
+    )
+    assert encoded["com_data"] == {
+        "status": False,
+        "exception": "timed out",
+        "ack_packet": [62, 0, 64, 1, 0, 191, 60],
+        "rx_packets": [],
+        "aux_data": {"failure": "timeout"},
+    }
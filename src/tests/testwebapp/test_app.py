@@ -0,0 +1,19 @@
+"""Module for testing the creation of the web-app."""
+from logging import getLogger
+from logging import WARNING
+from pathlib import Path
+
+from uosinterface.util import stop_logs
+from uosinterface.webapp import create_app
+
+
+def test_create_app_log_level(tmp_path):
+    """Checks the web-app logs at the level it is created with."""
+    static_dir = (
+        Path(__file__).resolve().parents[2].joinpath("uosinterface/webapp/static/")
+    )
+    create_app(True, base_path=tmp_path, static_path=static_dir, log_level=WARNING)
+    logger = getLogger("uosinterface.webapp")
+    assert not logger.isEnabledFor(WARNING - 1)
+    stop_logs("uosinterface.webapp")
+    assert tmp_path.joinpath("logs/uosinterface.webapp.log").exists()
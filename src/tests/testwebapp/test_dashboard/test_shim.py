@@ -1,4 +1,7 @@
 """Module for testing the dashboard to HAL shim."""
+from uosinterface.hardware.devices import DEVICES
+from uosinterface.hardware.worker import PORT_WORKERS
+from uosinterface.webapp.dashboard.shim import get_system_config
 from uosinterface.webapp.dashboard.shim import get_system_info
 
 
@@ -16,3 +19,26 @@ def test_get_system_info(uos_identities: ()):
         assert response["version"].count(".") == 2
         assert response["address"] == uos_identities["address"]
         assert "unknown" not in response["type"].lower() and len(response["type"]) > 0
+
+
+def test_get_system_config(uos_identities: ()):
+    """Test the shim reads the configuration of every digital pin."""
+    response = get_system_config(
+        device_identity=uos_identities["identity"],
+        device_address=uos_identities["address"],
+        interface=uos_identities["interface"],
+    )
+    assert list(response) == list(DEVICES[uos_identities["identity"]].digital_pins)
+    assert all("current_level" in config for config in response.values())
+
+
+def test_shim_port_worker(uos_identities: ()):
+    """Checks the shim queues instructions on the port worker like the API."""
+    PORT_WORKERS.stop_all()
+    get_system_config(
+        device_identity=uos_identities["identity"],
+        device_address=uos_identities["address"],
+        interface=uos_identities["interface"],
+    )
+    assert len(PORT_WORKERS) == 1
+    PORT_WORKERS.stop_all()
@@ -1,7 +1,15 @@
 """The high level interface for communicating with UOS devices."""
+import asyncio
 import sys
+from abc import ABCMeta
+from abc import abstractmethod
+from functools import partial
 from logging import getLogger as Log
 from pathlib import Path
+from threading import local
+from time import monotonic
+from time import sleep
+from typing import Callable
 from typing import Union
 
 from uosinterface import UOSCommunicationError
@@ -9,26 +17,58 @@ from uosinterface import UOSConfigurationError
 from uosinterface import UOSUnsupportedError
 from uosinterface.hardware.devices import DEVICES
 from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.latency import LATENCY_TRACKER
+from uosinterface.hardware.pool import CONNECTION_POOL
+from uosinterface.hardware.retry import DEFAULT_RETRY_POLICY
+from uosinterface.hardware.retry import RetryPolicy
+from uosinterface.hardware.shadow import PinStateCache
+from uosinterface.hardware.simulator import NPCSimulator
+from uosinterface.hardware.stub import AsyncNPCStub
 from uosinterface.hardware.stub import NPCStub
+from uosinterface.hardware.sysinfo import SYSTEM_INFO_CACHE
+from uosinterface.hardware.sysinfo import SystemInfo
 from uosinterface.hardware.uosabstractions import ComResult
 from uosinterface.hardware.uosabstractions import Device
+from uosinterface.hardware.uosabstractions import Failure
 from uosinterface.hardware.uosabstractions import InstructionArguments
 from uosinterface.hardware.uosabstractions import UOS_SCHEMA
+from uosinterface.hardware.uosabstractions import UOSInterface
+from uosinterface.hardware.usbserial import AsyncNPCSerialPort
+from uosinterface.hardware.usbserial import BYTE_TRACE
 from uosinterface.hardware.usbserial import NPCSerialPort
+from uosinterface.hardware.usbserial import PORT_INVENTORY
+from uosinterface.hardware.worker import PORT_WORKERS
 from uosinterface.util import configure_logs
 
+LOG = Log(__name__)
+
 SUPER_VOLATILE = 0
 VOLATILE = 1
 NON_VOLATILE = 2
 
+# Instructions in flight when reading every pin, the frames sent must fit in
+# the 64 byte serial receive buffer of the device as there is no flow control.
+GPIO_CONFIG_WINDOW = 4
+
+GPIO_CONFIG_FIELDS = (  # order of the get_gpio_config response payload
+    "current_mode",
+    "current_level",
+    "ram_mode",
+    "ram_level",
+    "eeprom_mode",
+    "eeprom_level",
+)
 
-def register_logs(level, base_path: Path):
+
+def register_logs(level, base_path: Path, byte_trace_every: int = 0):
     """Configures the log files for the hardware COM package.
 
     :param level: Set the logger level, debug ect. Use the constants from logging lib.
     :param base_path: Set the logging directory.
+    :param byte_trace_every: Log one in this many serial transfers at debug, 0 disables.
     """
     configure_logs(__name__, level=level, base_path=base_path)
+    BYTE_TRACE.sample_every = byte_trace_every
 
 
 def get_device_definition(identity: str) -> Device:
@@ -38,15 +78,8 @@ def get_device_definition(identity: str) -> Device:
     :return: Device Object or None if not found
     """
     if identity is not None and identity.lower() in DEVICES:
-        device = DEVICES[identity.lower()]
-        for function_enabled in device.functions_enabled:
-            device.functions_enabled[function_enabled] = {
-                vol: UOS_SCHEMA[function_enabled].address_lut[vol]
-                for vol in device.functions_enabled[function_enabled]
-            }
-    else:
-        device = None
-    return device
+        return DEVICES[identity.lower()]
+    return None
 
 
 def enumerate_system_devices(interface_filter: Interface = None) -> []:
@@ -66,34 +99,34 @@ def enumerate_system_devices(interface_filter: Interface = None) -> []:
     return system_devices
 
 
-class UOSDevice:
-    """Class for high level object-orientated control of UOS devices.
+class UOSDeviceBase(metaclass=ABCMeta):
+    """Base class defining the UOS instructions common to all device classes.
+
+    Instruction functions return the result of _dispatch_instruction, this is
+    a ComResult for UOSDevice and an awaitable ComResult for AsyncUOSDevice.
 
     :ivar identity: The type of device, this is must have a valid device in the config.
-    :ivar connection: Compliant connection string for identifying the device and interface.
+    :ivar address: Compliant connection string for identifying the device and interface.
     :ivar device: Device definitions as parsed from a compatible ini.
-    :ivar __kwargs: Connection specific / optional parameters.
-    :ivar __device_interface: Lower level communication protocol layer.
+    :ivar _kwargs: Connection specific / optional parameters.
+    :ivar _device_interface: Lower level communication protocol layer.
+    :ivar _state_cache: Shadow of the device pin state, None if not enabled.
+    :ivar _port_key: Tuple of interface and address identifying the connection.
     """
 
     identity = ""
     address = ""
     device = Device
-    __kwargs = {}
-    __device_interface = None
+    _kwargs = {}
+    _device_interface = None
+    _state_cache = None
+    _port_key = None
 
-    def __init__(
-        self,
-        identity: Union[str, Device],
-        address: str,
-        interface: Interface = Interface.USB,
-        **kwargs,
-    ):
-        """Instantiate a UOS device instance for communication.
+    def __init__(self, identity: Union[str, Device], address: str, **kwargs):
+        """Resolves the device definition for a UOS device instance.
 
         :param identity: Specify the type of device, this must exist in the device dictionary.
         :param address: Compliant connection string for identifying the device and interface.
-        :param interface: Set the type of interface to use for communication.
         :param kwargs: Additional optional connection parameters as defined in documentation.
         """
         self.identity = identity
@@ -102,68 +135,59 @@ class UOSDevice:
             self.device = get_device_definition(identity)
         else:
             self.device = identity
-        self.__kwargs = kwargs
+        self._kwargs = kwargs
         if self.device is None:
             raise UOSUnsupportedError(
                 f"'{self.identity}' does not have a valid look up table"
             )
-        if interface == Interface.USB and Interface.USB in self.device.interfaces:
-            self.__device_interface = NPCSerialPort(
-                address,
-                baudrate=self.device.aux_params["default_baudrate"],
-            )
-        elif interface == Interface.STUB and Interface.STUB in self.device.interfaces:
-            self.__device_interface = NPCStub(
-                connection=address,
-                errored=(kwargs["errored"] if "errored" in kwargs else False),
-            )
-        else:
-            raise UOSCommunicationError(
-                f"Could not correctly open a connection to {self.identity} - {self.address}"
-            )
-        if not self.is_lazy():  # eager connections open when they are created
-            self.open()
-        Log(__name__).debug("Created device %s", self.__device_interface.__repr__())
+        if "state_cache_s" in kwargs and kwargs["state_cache_s"] is not None:
+            self._state_cache = PinStateCache(kwargs["state_cache_s"])
 
     def set_gpio_output(
-        self, pin: int, level: int, volatility: int = SUPER_VOLATILE
+        self, pin: int, level: int, volatility: int = SUPER_VOLATILE, **kwargs
     ) -> ComResult:
         """Sets a pin to digital output mode and sets a level on that pin.
 
         :param pin: The numeric number of the pin as defined in the dictionary for that device.
         :param level: The output level, 0 - low, 1 - High.
         :param volatility: How volatile should the command be, use constants from HardwareCOM.
+        :param kwargs: Control arguments, accepts timeout_s.
         :return: ComResult object.
         """
-        return self.__execute_instruction(
-            UOSDevice.set_gpio_output.__name__,
+        return self._execute_instruction(
+            UOSDeviceBase.set_gpio_output.__name__,
             volatility,
             InstructionArguments(
-                device_function_lut=self.device.functions_enabled,
+                device_function_lut=self.device.address_table,
                 payload=(pin, 0, level),
                 check_pin=pin,
+                timeout_s=kwargs["timeout_s"] if "timeout_s" in kwargs else None,
             ),
+            collector=kwargs["collector"] if "collector" in kwargs else None,
         )
 
     def get_gpio_input(
-        self, pin: int, level: int, volatility: int = SUPER_VOLATILE
+        self, pin: int, level: int, volatility: int = SUPER_VOLATILE, **kwargs
     ) -> ComResult:
         """Reads a GPIO pins level from device and returns the value.
 
         :param pin: The numeric number of the pin as defined in the dictionary for that device.
         :param level: Not used currently, future will define pull-up state.
         :param volatility: How volatile should the command be, use constants from HardwareCOM.
+        :param kwargs: Control arguments, accepts timeout_s.
         :return: ComResult object.
         """
-        return self.__execute_instruction(
-            UOSDevice.get_gpio_input.__name__,
+        return self._execute_instruction(
+            UOSDeviceBase.get_gpio_input.__name__,
             volatility,
             InstructionArguments(
-                device_function_lut=self.device.functions_enabled,
+                device_function_lut=self.device.address_table,
                 payload=(pin, 1, level),
                 expected_rx_packets=2,
                 check_pin=pin,
+                timeout_s=kwargs["timeout_s"] if "timeout_s" in kwargs else None,
             ),
+            collector=kwargs["collector"] if "collector" in kwargs else None,
         )
 
     def get_adc_input(
@@ -171,80 +195,532 @@ class UOSDevice:
         pin: int,
         level: int,
         volatility: int = SUPER_VOLATILE,
+        **kwargs,
     ) -> ComResult:
         """Reads the current 10 bit ADC value.
 
         :param pin: The index of the analogue pin to read
         :param level: Reserved for future use.
         :param volatility: How volatile should the command be, use constants from HardwareCOM.
+        :param kwargs: Control arguments, accepts timeout_s.
         :return: ComResult object containing the ADC readings.
         """
-        return self.__execute_instruction(
-            UOSDevice.get_adc_input.__name__,
+        return self._execute_instruction(
+            UOSDeviceBase.get_adc_input.__name__,
             volatility,
             InstructionArguments(
-                device_function_lut=self.device.functions_enabled,
+                device_function_lut=self.device.address_table,
                 payload=tuple([pin]),
                 expected_rx_packets=2,
                 check_pin=pin,
+                timeout_s=kwargs["timeout_s"] if "timeout_s" in kwargs else None,
             ),
+            collector=kwargs["collector"] if "collector" in kwargs else None,
         )
 
     def get_system_info(self, **kwargs) -> ComResult:
         """Reads the UOS version and device type.
 
-        :param kwargs: Control arguments, accepts volatility.
+        :param kwargs: Control arguments, accepts volatility and timeout_s.
         :return: ComResult object containing the system information.
         """
-        return self.__execute_instruction(
-            UOSDevice.get_system_info.__name__,
+        return self._execute_instruction(
+            UOSDeviceBase.get_system_info.__name__,
             kwargs["volatility"] if "volatility" in kwargs else SUPER_VOLATILE,
             InstructionArguments(
-                device_function_lut=self.device.functions_enabled,
+                device_function_lut=self.device.address_table,
                 expected_rx_packets=2,
+                timeout_s=kwargs["timeout_s"] if "timeout_s" in kwargs else None,
             ),
+            collector=kwargs["collector"] if "collector" in kwargs else None,
         )
 
     def get_gpio_config(self, pin: int, **kwargs) -> ComResult:
         """Reads the configuration for a digital pin on the device.
 
+        When the device has a state cache a fresh shadow of the pin is returned
+        without a hardware read, with aux_data "cached" set.
+
         :param pin: Defines the pin for config querying.
-        :param kwargs: Control arguments accepts volatility.
+        :param kwargs: Control arguments accepts volatility, timeout_s and
+            force_read to bypass the state cache.
         :return: ComResult object containing the system information.
         """
-        return self.__execute_instruction(
-            UOSDevice.get_gpio_config.__name__,
+        return self._execute_instruction(
+            UOSDeviceBase.get_gpio_config.__name__,
             kwargs["volatility"] if "volatility" in kwargs else SUPER_VOLATILE,
             InstructionArguments(
-                device_function_lut=self.device.functions_enabled,
+                device_function_lut=self.device.address_table,
                 payload=tuple([pin]),
                 expected_rx_packets=2,
                 check_pin=pin,
+                timeout_s=kwargs["timeout_s"] if "timeout_s" in kwargs else None,
+                force_read=kwargs["force_read"] if "force_read" in kwargs else False,
             ),
+            collector=kwargs["collector"] if "collector" in kwargs else None,
         )
 
     def reset_all_io(self, **kwargs) -> ComResult:
         """Executes the reset IO at the defined volatility level."""
-        return self.__execute_instruction(
-            UOSDevice.reset_all_io.__name__,
+        return self._execute_instruction(
+            UOSDeviceBase.reset_all_io.__name__,
             kwargs["volatility"] if "volatility" in kwargs else SUPER_VOLATILE,
-            InstructionArguments(device_function_lut=self.device.functions_enabled),
+            InstructionArguments(
+                device_function_lut=self.device.address_table,
+                timeout_s=kwargs["timeout_s"] if "timeout_s" in kwargs else None,
+            ),
+            collector=kwargs["collector"] if "collector" in kwargs else None,
         )
 
     def hard_reset(self, **kwargs) -> ComResult:
         """Hard reset functionality for the UOS Device."""
-        return self.__execute_instruction(
-            UOSDevice.hard_reset.__name__,
+        return self._execute_instruction(
+            UOSDeviceBase.hard_reset.__name__,
             kwargs["volatility"] if "volatility" in kwargs else SUPER_VOLATILE,
-            InstructionArguments(device_function_lut=self.device.functions_enabled),
+            InstructionArguments(device_function_lut=self.device.address_table),
+            collector=kwargs["collector"] if "collector" in kwargs else None,
+        )
+
+    def is_lazy(self) -> bool:
+        """Checks the loading type of the device lazy or eager.
+
+        :return: Boolean, true is lazy.
+        """
+        if "loading" not in self._kwargs or self._kwargs["loading"].upper() == "LAZY":
+            return True
+        return False
+
+    def is_pooled(self) -> bool:
+        """Checks if the device shares a persistent connection from the pool.
+
+        :return: Boolean, true if loading is pooled.
+        """
+        return "loading" in self._kwargs and self._kwargs["loading"].upper() == "POOLED"
+
+    def is_queued(self) -> bool:
+        """Checks if instructions are queued to a worker thread owning the port.
+
+        :return: Boolean, true if loading is queued.
+        """
+        return "loading" in self._kwargs and self._kwargs["loading"].upper() == "QUEUED"
+
+    def _execute_instruction(
+        self,
+        function_name: str,
+        volatility,
+        instruction_data: InstructionArguments,
+        collector: list = None,
+    ) -> ComResult:
+        """Common functionality for execution of all UOS instructions.
+
+        :param function_name: The name of the function in the OOL.
+        :param volatility: How volatile should the command be, use constants in HardwareCOM.
+        :param instruction_data: device_functions from the LUT, payload ect.
+        :param collector: List to stage the validated instruction in rather than
+            executing it, None to execute. Passed per call so concurrent
+            instructions on the device are never staged into another's batch.
+        :return: ComResult object, or awaitable ComResult for asyncio devices.
+        :raises: UOSUnsupportedError if function is not possible on the loaded device.
+        """
+        self.__check_instruction(function_name, volatility, instruction_data)
+        if instruction_data.device_function_lut[function_name][volatility] >= 0:
+            instruction_data.packet = self.device.get_packet(
+                function_name, volatility, instruction_data.payload
+            )
+        if collector is not None:  # staging a batch
+            collector.append((function_name, volatility, instruction_data))
+            return ComResult(True)
+        return self._dispatch_instruction(function_name, volatility, instruction_data)
+
+    @abstractmethod
+    def _dispatch_instruction(
+        self,
+        function_name: str,
+        volatility,
+        instruction_data: InstructionArguments,
+    ) -> ComResult:
+        """Abstract method for executing a validated instruction on the device.
+
+        :param function_name: The name of the function in the OOL.
+        :param volatility: How volatile should the command be, use constants in HardwareCOM.
+        :param instruction_data: device_functions from the LUT, payload ect.
+        :return: ComResult object, or awaitable ComResult for asyncio devices.
+        :raises: UOSUnsupportedError if the device class hasn't been built correctly.
+        """
+        raise UOSUnsupportedError(
+            "UOS devices must over-ride "
+            f"{UOSDeviceBase._dispatch_instruction.__name__} prototype."
         )
 
+    def _stage_batch(self, instructions: list[tuple[str, dict]]) -> list:
+        """Validates a batch of instructions without executing them.
+
+        :param instructions: List of (function name, keyword arguments) tuples.
+        :return: List of validated (function name, volatility, instruction data) tuples.
+        :raises: UOSUnsupportedError if any instruction is not possible on the loaded device.
+        """
+        staged_instructions = []
+        for function_name, arguments in instructions:
+            if function_name not in UOS_SCHEMA:
+                raise UOSUnsupportedError(
+                    f"UOS function {function_name} doesn't exist."
+                )
+            # instruction functions validate and stage rather than execute
+            getattr(self, function_name)(**arguments, collector=staged_instructions)
+        return staged_instructions
+
+    @staticmethod
+    def _split_batch(staged_instructions: list) -> list:
+        """Groups staged instructions into runs that can be pipelined.
+
+        :param staged_instructions: List of validated instruction tuples.
+        :return: List of runs, a run is either consecutive normal instructions
+            or a single special action.
+        """
+        runs = []
+        for staged_instruction in staged_instructions:
+            function_name, volatility, instruction_data = staged_instruction
+            if instruction_data.device_function_lut[function_name][volatility] < 0:
+                runs.append([staged_instruction])  # special actions run alone
+                runs.append([])
+            elif len(runs) == 0:
+                runs.append([staged_instruction])
+            else:
+                runs[-1].append(staged_instruction)
+        return [run for run in runs if len(run) > 0]
+
+    @staticmethod
+    def _get_pipeline(run: list) -> list:
+        """Formats a run of normal instructions for interface pipelining.
+
+        :param run: List of validated instruction tuples.
+        :return: List of (address, payload, expected packets, packet) tuples.
+        """
+        return [
+            (
+                instruction_data.device_function_lut[function_name][volatility],
+                instruction_data.payload,
+                instruction_data.expected_rx_packets,
+                instruction_data.packet,
+            )
+            for function_name, volatility, instruction_data in run
+        ]
+
+    def _get_timeout(
+        self, function_name: str, instruction_data: InstructionArguments
+    ) -> float:
+        """Resolves how long to wait on the response to an instruction.
+
+        A timeout_s passed to the instruction takes precedence, then a timeout_s
+        passed to the device, otherwise it's estimated from observed latency.
+
+        :param function_name: The name of the function in the OOL.
+        :param instruction_data: device_functions from the LUT, payload ect.
+        :return: Timeout in seconds.
+        """
+        if instruction_data.timeout_s is not None:
+            return instruction_data.timeout_s
+        if "timeout_s" in self._kwargs:
+            return self._kwargs["timeout_s"]
+        return LATENCY_TRACKER.get_timeout((*self._port_key, function_name))
+
+    def _get_run_timeout(self, run: list) -> float:
+        """Resolves the longest response timeout for a run of instructions.
+
+        :param run: List of validated instruction tuples.
+        :return: Timeout in seconds.
+        """
+        return max(
+            self._get_timeout(function_name, instruction_data)
+            for function_name, _, instruction_data in run
+        )
+
+    def _get_retry_policy(self) -> RetryPolicy:
+        """Gets the policy for retrying failed instructions on this device.
+
+        :return: The RetryPolicy passed to the device, or the default policy.
+        """
+        if "retry_policy" in self._kwargs:
+            return self._kwargs["retry_policy"]
+        return DEFAULT_RETRY_POLICY
+
+    def _record_latency(self, function_name: str, latency_s: float):
+        """Records the round trip time of a successful instruction.
+
+        :param function_name: The name of the function in the OOL.
+        :param latency_s: Time from sending the instruction to the full response.
+        """
+        LATENCY_TRACKER.record((*self._port_key, function_name), latency_s)
+
+    def _reset_latency(self):
+        """Discards the observed latency of the device, as it may have changed."""
+        LATENCY_TRACKER.reset_device(self._port_key)
+
+    def __check_instruction(
+        self,
+        function_name: str,
+        volatility,
+        instruction_data: InstructionArguments,
+    ):
+        """Validates an instruction can be executed on the loaded device.
+
+        :param function_name: The name of the function in the OOL.
+        :param volatility: How volatile should the command be, use constants in HardwareCOM.
+        :param instruction_data: device_functions from the LUT, payload ect.
+        :raises: UOSUnsupportedError if function is not possible on the loaded device.
+        """
+        if (
+            function_name not in self.device.address_table
+            or volatility not in self.device.address_table[function_name]
+            or (
+                instruction_data.check_pin is not None
+                and instruction_data.check_pin
+                not in self.device.compatible_pins[function_name]
+            )
+        ):
+            LOG.debug("Known functions %s", self.device.address_table.keys())
+            raise UOSUnsupportedError(
+                f"{function_name}({volatility}) has not been implemented for {self.identity}"
+            )
+
+    @staticmethod
+    def _verify_checksums(rx_response: ComResult):
+        """Validates the checksums on all packets, failing the response on a
+        mismatch.
+
+        :param rx_response: ComResult object containing the received packets.
+        """
+        for count in range(len(rx_response.rx_packets) + 1):
+            current_packet = (
+                rx_response.ack_packet
+                if count == 0
+                else rx_response.rx_packets[count - 1]
+            )
+            computed_checksum = UOSInterface.get_npc_checksum(current_packet[1:-2])
+            if computed_checksum != current_packet[-2]:
+                LOG.debug(
+                    "Calculated checksum %s does not match rx %s",
+                    computed_checksum,
+                    current_packet[-2],
+                )
+                rx_response.status = False
+                rx_response.exception = "checksum mismatch on received data"
+                rx_response.aux_data["failure"] = Failure.CHECKSUM
+
+    def _get_gpio_config_batch(self, **kwargs) -> list[tuple[str, dict]]:
+        """Builds a batch reading the configuration of every digital pin.
+
+        :param kwargs: Control arguments accepts volatility.
+        :return: List of (function name, keyword arguments) tuples.
+        """
+        arguments = (
+            {"volatility": kwargs["volatility"]} if "volatility" in kwargs else {}
+        )
+        return [
+            (UOSDeviceBase.get_gpio_config.__name__, {"pin": pin, **arguments})
+            for pin in self.device.digital_pins
+        ]
+
+    def _collect_gpio_config(self, results: list[ComResult]) -> ComResult:
+        """Merges the results of a configuration batch into a single result.
+
+        :param results: ComResult objects in digital pin order.
+        :return: ComResult with the mode and level of each pin read in aux_data
+            "pins", keyed on pin index. Status is false if any pin failed.
+        """
+        com_result = ComResult(all(result.status for result in results))
+        rx_packets = []
+        pin_config = {}
+        for pin, result in zip(self.device.digital_pins, results):
+            if not result.status:
+                com_result.exception = f"pin {pin}: {result.exception}"
+                continue
+            rx_packets.extend(result.rx_packets)
+            pin_config[pin] = dict(zip(GPIO_CONFIG_FIELDS, result.get_payload()))
+        com_result.rx_packets = rx_packets
+        com_result.aux_data["pins"] = pin_config
+        return com_result
+
+    def _get_cached_result(
+        self,
+        function_name: str,
+        volatility,
+        instruction_data: InstructionArguments,
+    ) -> Union[ComResult, None]:
+        """Answers a configuration read from the state cache if possible.
+
+        :param function_name: The name of the function in the OOL.
+        :param volatility: How volatile should the command be, use constants in HardwareCOM.
+        :param instruction_data: device_functions from the LUT, payload ect.
+        :return: ComResult built from the shadowed state, None on a miss.
+        """
+        if (
+            self._state_cache is None
+            or function_name != UOSDeviceBase.get_gpio_config.__name__
+            or instruction_data.force_read
+        ):
+            return None
+        config = self._state_cache.get(instruction_data.check_pin)
+        if config is None:
+            return None
+        address = instruction_data.device_function_lut[function_name][volatility]
+        return ComResult(
+            True,
+            ack_packet=UOSInterface.get_npc_packet(0, address, (0,)),
+            rx_packets=[
+                UOSInterface.get_npc_packet(
+                    0, address, tuple(config[name] for name in GPIO_CONFIG_FIELDS)
+                )
+            ],
+            aux_data={"cached": True},
+        )
+
+    def _update_state_cache(self, staged_instruction: tuple, rx_response: ComResult):
+        """Writes an executed instruction through to the state cache.
+
+        Only super volatile outputs are written through, other volatilities
+        are persisted by the device in ways the host can't see so invalidate
+        the pin. Resets invalidate every pin.
+
+        :param staged_instruction: Tuple of function name, volatility and instruction data.
+        :param rx_response: ComResult of the instruction.
+        """
+        if self._state_cache is None:
+            return
+        function_name, volatility, instruction_data = staged_instruction
+        if function_name in (
+            UOSDeviceBase.reset_all_io.__name__,
+            UOSDeviceBase.hard_reset.__name__,
+        ):
+            self._state_cache.invalidate()
+        elif function_name == UOSDeviceBase.set_gpio_output.__name__:
+            pin, mode, level = instruction_data.payload
+            if rx_response.status and volatility == SUPER_VOLATILE:
+                self._state_cache.write(pin, volatility, mode, level)
+            else:
+                self._state_cache.invalidate(pin)
+        elif function_name == UOSDeviceBase.get_gpio_input.__name__:
+            self._state_cache.invalidate(instruction_data.check_pin)
+        elif (
+            function_name == UOSDeviceBase.get_gpio_config.__name__
+            and rx_response.status
+        ):
+            self._state_cache.update(
+                instruction_data.check_pin,
+                dict(zip(GPIO_CONFIG_FIELDS, rx_response.get_payload())),
+            )
+
+    def __repr__(self):
+        """Over-rides the built in repr with something useful.
+
+        :return: String containing connection and identity of the device
+        """
+        return (
+            f"<{type(self).__name__}(address='{self.address}', identity='{self.identity}', "
+            f"device={self.device}, _device_interface='{self._device_interface}', "
+            f"_kwargs={self._kwargs})>"
+        )
+
+
+class UOSDevice(UOSDeviceBase):
+    """Class for high level object-orientated control of UOS devices.
+
+    :ivar __interface_factory: Callable that instantiates the device interface.
+    :ivar __pool_holds: Thread local, held is True while a pooled connection is
+        locked by the device on that thread.
+    :ivar __worker: The worker thread owning the port when loading is queued.
+    """
+
+    __interface_factory = None
+    __pool_holds = None
+    __worker = None
+
+    def __init__(
+        self,
+        identity: Union[str, Device],
+        address: str,
+        interface: Interface = Interface.USB,
+        **kwargs,
+    ):
+        """Instantiate a UOS device instance for communication.
+
+        :param identity: Specify the type of device, this must exist in the device dictionary.
+        :param address: Compliant connection string for identifying the device and interface.
+        :param interface: Set the type of interface to use for communication.
+        :param kwargs: Additional optional connection parameters as defined in documentation.
+            loading - LAZY (default) opens per instruction, EAGER opens on creation,
+            POOLED reuses a persistent connection shared by the process,
+            QUEUED runs instructions in order on a worker thread that owns the port.
+            timeout_s - Fixed response timeout, estimated from latency if not set.
+            retry_policy - RetryPolicy for failed instructions, retry.NO_RETRY disables.
+            state_cache_s - Enables a pin state cache, answering config reads younger than this.
+            simulation - Dict of NPCSimulator parameters, used by the simulator interface.
+        """
+        super().__init__(identity, address, **kwargs)
+        if interface == Interface.USB and Interface.USB in self.device.interfaces:
+            self.__interface_factory = partial(
+                NPCSerialPort,
+                address,
+                baudrate=self.device.aux_params["default_baudrate"],
+                low_latency=(
+                    kwargs["low_latency"] if "low_latency" in kwargs else False
+                ),
+            )
+        elif interface == Interface.STUB and Interface.STUB in self.device.interfaces:
+            self.__interface_factory = partial(
+                NPCStub,
+                connection=address,
+                errored=(kwargs["errored"] if "errored" in kwargs else False),
+            )
+        elif (
+            interface == Interface.SIMULATOR
+            and Interface.SIMULATOR in self.device.interfaces
+        ):
+            self.__interface_factory = partial(
+                NPCSimulator,
+                address,
+                baudrate=self.device.aux_params["default_baudrate"],
+                **(kwargs["simulation"] if "simulation" in kwargs else {}),
+            )
+        else:
+            raise UOSCommunicationError(
+                f"Could not correctly open a connection to {self.identity} - {self.address}"
+            )
+        self._port_key = (interface, address)
+        self.__pool_holds = local()
+        if self.is_pooled():  # share a single handle per interface and address
+            self._device_interface = CONNECTION_POOL.get_interface(
+                self._port_key, self.__interface_factory
+            )
+        elif self.is_queued():  # a single worker thread owns each port
+            self.__worker = PORT_WORKERS.get_worker(
+                self._port_key, self.__interface_factory
+            )
+            self._device_interface = self.__worker.interface
+        else:
+            self._device_interface = self.__interface_factory()
+        if not (
+            self.is_lazy() or self.is_pooled() or self.is_queued()
+        ):  # eager connections open now
+            self.open()
+        LOG.debug("Created device %s", self._device_interface.__repr__())
+
     def open(self):
         """Connects to the device, explict calls are normally not required.
 
         :raises: UOSCommunicationError - Problem opening a connection.
         """
-        if not self.__device_interface.open():
+        if self.is_pooled():  # threads sharing the device each take the lock
+            if not getattr(self.__pool_holds, "held", False):
+                self._device_interface = CONNECTION_POOL.acquire(
+                    self._port_key, self.__interface_factory
+                )
+                self.__pool_holds.held = True
+        elif self.is_queued():  # the worker opens the port
+            self.__run_queued(lambda: None)
+        elif not self._device_interface.open():
+            SYSTEM_INFO_CACHE.invalidate(self._port_key)
+            self._reset_latency()
             raise UOSCommunicationError(
                 "There was an error opening a connection to the device."
             )
@@ -252,105 +728,489 @@ class UOSDevice:
     def close(self):
         """Releases connection, must be called explicitly if loading is eager.
 
+        Pooled connections are returned to the pool rather than closed, queued
+        connections are closed by their worker when idle.
+
         :raises: UOSCommunicationError - Problem closing the connection to an active device.
         """
-        if not self.__device_interface.close():
+        if self.is_pooled():
+            self.__release_pooled(healthy=True)
+        elif self.is_queued():
+            return
+        elif not self._device_interface.close():
             raise UOSCommunicationError(
                 "There was an error closing a connection to the device"
             )
 
-    def __execute_instruction(
+    def __release_pooled(self, healthy: bool):
+        """Returns a held pooled connection, unhealthy connections are closed.
+
+        :param healthy: False if the connection should be re-opened before reuse.
+        """
+        if getattr(self.__pool_holds, "held", False):
+            self.__pool_holds.held = False
+            CONNECTION_POOL.release(self._port_key, healthy=healthy)
+
+    def __run_queued(self, function: Callable, *args):
+        """Runs a function on the port worker thread and waits on the result.
+
+        :param function: Callable executing on the interface, run once the port is open.
+        :param args: Arguments passed to the function.
+        :return: The return of the function.
+        :raises: UOSCommunicationError - Problem opening a connection.
+        """
+
+        def request(interface: UOSInterface):
+            if not interface.check_open() and not interface.open():
+                raise UOSCommunicationError(
+                    "There was an error opening a connection to the device."
+                )
+            return function(*args)
+
+        return self.__worker.submit(request).result()
+
+    def execute_batch(
+        self, instructions: list[tuple[str, dict]], window: int = 1
+    ) -> list[ComResult]:
+        """Executes a list of instructions while holding a single connection.
+
+        All instructions are validated before any are executed, so an invalid
+        instruction raises without affecting the device.
+
+        :param instructions: List of (function name, keyword arguments) tuples,
+            for example ("set_gpio_output", {"pin": 13, "level": 1}).
+        :param window: Maximum number of instructions in flight on interfaces that
+            support pipelining, 1 waits on each response before sending the next.
+        :return: List of ComResult objects in the order of the instructions.
+        :raises: UOSUnsupportedError if any instruction is not possible on the loaded device.
+        """
+        runs = self._split_batch(self._stage_batch(instructions))
+        if self.is_queued():  # batch runs on the worker without interleaving
+            return self.__run_queued(self.__execute_runs, runs, window)
+        if self.is_lazy() or self.is_pooled():  # Connection held for the batch
+            self.open()
+        results = self.__execute_runs(runs, window)
+        if self.is_pooled():  # failed connections are re-opened on next use
+            self.__release_pooled(healthy=all(result.status for result in results))
+        elif self.is_lazy():  # Lazy loaded
+            self.close()
+        return results
+
+    def get_device_info(self, force_read: bool = False, **kwargs) -> SystemInfo:
+        """Gets the firmware version and hardware type of the device.
+
+        The parsed info is memoized per port until the device is hard reset,
+        the connection has to be re-opened, or the ports on the system change.
+
+        :param force_read: Read the info from the device even if memoized.
+        :param kwargs: Control arguments passed to get_system_info.
+        :return: SystemInfo object.
+        :raises: UOSCommunicationError - The system info could not be read.
+        """
+        generation = PORT_INVENTORY.generation
+        system_info = (
+            None if force_read else SYSTEM_INFO_CACHE.get(self._port_key, generation)
+        )
+        if system_info is None:
+            result = self.get_system_info(**kwargs)
+            if not result.status:
+                raise UOSCommunicationError(
+                    f"Could not read system info from {self.address}: {result.exception}"
+                )
+            system_info = SystemInfo.from_result(result)
+            SYSTEM_INFO_CACHE.store(self._port_key, generation, system_info)
+        return system_info
+
+    def get_all_gpio_config(self, **kwargs) -> ComResult:
+        """Reads the configuration of every digital pin over a single connection.
+
+        The requests are pipelined a few at a time, so the device is read in a
+        fraction of the round trips without overflowing its receive buffer.
+
+        :param kwargs: Control arguments accepts volatility.
+        :return: ComResult with the per pin configuration in aux_data "pins".
+        """
+        batch = self._get_gpio_config_batch(**kwargs)
+        return self._collect_gpio_config(self.execute_batch(batch, GPIO_CONFIG_WINDOW))
+
+    def __execute_runs(self, runs: list, window: int) -> list[ComResult]:
+        """Executes runs of staged instructions on an open interface.
+
+        :param runs: List of runs from _split_batch.
+        :param window: Maximum number of instructions in flight.
+        :return: List of ComResult objects in the order of the instructions.
+        """
+        results = []
+        for run in runs:
+            if len(run) == 1 and self._get_pipeline(run)[0][0] < 0:
+                run_results = [self.__transact(*run[0])]  # special action
+            else:
+                run_results = self._device_interface.execute_pipeline(
+                    self._get_pipeline(run), self._get_run_timeout(run), window
+                )
+                for rx_response in run_results:
+                    if rx_response.status:
+                        self._verify_checksums(rx_response)
+            for staged_instruction, rx_response in zip(run, run_results):
+                results.append(self.__retry(staged_instruction, rx_response))
+        return results
+
+    def _dispatch_instruction(
         self,
         function_name: str,
         volatility,
         instruction_data: InstructionArguments,
-        retry: bool = True,
     ) -> ComResult:
-        """Common functionality for execution of all UOS instructions.
+        """Executes a validated instruction, managing the connection.
+
+        Failed instructions are retried on the same connection as allowed by
+        the retry policy.
 
         :param function_name: The name of the function in the OOL.
         :param volatility: How volatile should the command be, use constants in HardwareCOM.
         :param instruction_data: device_functions from the LUT, payload ect.
-        :param retry: Allows the instruction to retry execution when fails.
         :return: ComResult object
-        :raises: UOSUnsupportedError if function is not possible on the loaded device.
         """
-        if (
-            function_name not in self.device.functions_enabled
-            or volatility not in self.device.functions_enabled[function_name]
-            or (
-                instruction_data.check_pin is not None
-                and instruction_data.check_pin
-                not in self.device.get_compatible_pins(function_name)
-            )
-        ):
-            Log(__name__).debug(
-                "Known functions %s", self.device.functions_enabled.keys().__str__()
-            )
-            raise UOSUnsupportedError(
-                f"{function_name}({volatility}) has not been implemented for {self.identity}"
+        cached_result = self._get_cached_result(
+            function_name, volatility, instruction_data
+        )
+        if cached_result is not None:
+            return cached_result
+        staged_instruction = (function_name, volatility, instruction_data)
+        if self.is_queued():  # instruction runs on the worker without interleaving
+            return self.__run_queued(self.__execute_staged, staged_instruction)
+        if self.is_lazy() or self.is_pooled():  # Connection held per instruction
+            self.open()
+        rx_response = self.__execute_staged(staged_instruction)
+        if self.is_pooled():  # failed connections are re-opened on next use
+            self.__release_pooled(healthy=rx_response.status)
+        elif self.is_lazy():  # Lazy loaded
+            self.close()
+        return rx_response
+
+    def __execute_staged(self, staged_instruction: tuple) -> ComResult:
+        """Executes a staged instruction on an open interface, with retries.
+
+        :param staged_instruction: Tuple of function name, volatility and instruction data.
+        :return: ComResult object
+        """
+        return self.__retry(staged_instruction, self.__transact(*staged_instruction))
+
+    def __retry(self, staged_instruction: tuple, rx_response: ComResult) -> ComResult:
+        """Retries a failed instruction as allowed by the retry policy.
+
+        :param staged_instruction: Tuple of function name, volatility and instruction data.
+        :param rx_response: ComResult of the first attempt.
+        :return: ComResult of the last attempt.
+        """
+        policy = self._get_retry_policy()
+        attempt = 0
+        while not rx_response.status:
+            rule = policy.get_rule(rx_response)
+            attempt += 1
+            if attempt > rule.attempts:
+                break
+            LOG.debug(
+                "Retrying %s after failure %s",
+                staged_instruction[0],
+                rx_response.aux_data.get("failure"),
             )
+            if rule.backoff_s > 0:
+                sleep(rule.get_delay(attempt))
+            if rule.reopen:  # the device may have changed while disconnected
+                SYSTEM_INFO_CACHE.invalidate(self._port_key)
+                self._reset_latency()
+                self._device_interface.close()
+                if not self._device_interface.open():
+                    break
+            if rule.resync:
+                self._device_interface.reset_input()
+            rx_response = self.__transact(*staged_instruction)
+        if staged_instruction[0] == UOSDeviceBase.hard_reset.__name__:
+            SYSTEM_INFO_CACHE.invalidate(self._port_key)
+            self._reset_latency()
+        self._update_state_cache(staged_instruction, rx_response)
+        return rx_response
+
+    def __transact(
+        self,
+        function_name: str,
+        volatility,
+        instruction_data: InstructionArguments,
+    ) -> ComResult:
+        """Executes a validated instruction on an open interface.
+
+        :param function_name: The name of the function in the OOL.
+        :param volatility: How volatile should the command be, use constants in HardwareCOM.
+        :param instruction_data: device_functions from the LUT, payload ect.
+        :return: ComResult object
+        """
         rx_response = ComResult(False)
-        if self.is_lazy():  # Lazy loaded
-            self.open()
         if (
             instruction_data.device_function_lut[function_name][volatility] >= 0
         ):  # a normal instruction
-            tx_response = self.__device_interface.execute_instruction(
+            start_s = monotonic()
+            tx_response = self._device_interface.execute_instruction(
                 instruction_data.device_function_lut[function_name][volatility],
                 instruction_data.payload,
+                instruction_data.packet,
             )
+            rx_response = tx_response
             if tx_response.status:
-                rx_response = self.__device_interface.read_response(
-                    instruction_data.expected_rx_packets, 2
+                rx_response = self._device_interface.read_response(
+                    instruction_data.expected_rx_packets,
+                    self._get_timeout(function_name, instruction_data),
                 )
                 if rx_response.status:
-                    # validate checksums on all packets
-                    for count in range(len(rx_response.rx_packets) + 1):
-                        current_packet = (
-                            rx_response.ack_packet
-                            if count == 0
-                            else rx_response.rx_packets[count - 1]
-                        )
-                        computed_checksum = self.__device_interface.get_npc_checksum(
-                            current_packet[1:-2]
-                        )
-                        Log(__name__).debug(
-                            "Calculated checksum %s must match rx %s",
-                            computed_checksum,
-                            current_packet[-2],
-                        )
-                        rx_response.status = rx_response.status & (
-                            computed_checksum == current_packet[-2]
-                        )
+                    self._record_latency(function_name, monotonic() - start_s)
+                    self._verify_checksums(rx_response)
         else:  # run a special action
-            rx_response = getattr(self.__device_interface, function_name)()
-        if self.is_lazy():  # Lazy loaded
-            self.close()
-        if (
-            not rx_response.status and retry
-        ):  # allow one retry per instruction due to DTR resets
-            return self.__execute_instruction(
-                function_name, volatility, instruction_data, False
-            )
+            rx_response = getattr(self._device_interface, function_name)()
         return rx_response
 
-    def is_lazy(self) -> bool:
-        """Checks the loading type of the device lazy or eager.
 
-        :return: Boolean, true is lazy.
+class AsyncUOSDevice(UOSDeviceBase):
+    """Class for asyncio control of UOS devices.
+
+    Instruction functions return awaitables, so many devices can be driven
+    concurrently from a single event loop. Eager devices must be opened with
+    `await device.open()` or by using the device as an async context manager.
+
+    :ivar __lock: Serialises instructions from concurrent tasks on this device.
+    """
+
+    __lock = None
+
+    def __init__(
+        self,
+        identity: Union[str, Device],
+        address: str,
+        interface: Interface = Interface.USB,
+        **kwargs,
+    ):
+        """Instantiate an asyncio UOS device instance for communication.
+
+        :param identity: Specify the type of device, this must exist in the device dictionary.
+        :param address: Compliant connection string for identifying the device and interface.
+        :param interface: Set the type of interface to use for communication.
+        :param kwargs: Additional optional connection parameters as defined in documentation.
+            loading - LAZY (default) opens per instruction, EAGER opens explicitly.
+            timeout_s - Fixed response timeout, estimated from latency if not set.
+            retry_policy - RetryPolicy for failed instructions, retry.NO_RETRY disables.
+            state_cache_s - Enables a pin state cache, answering config reads younger than this.
+        :raises: UOSConfigurationError - Pooled and queued loading are not supported with asyncio.
         """
-        if "loading" not in self.__kwargs or self.__kwargs["loading"].upper() == "LAZY":
-            return True
-        return False
+        super().__init__(identity, address, **kwargs)
+        if self.is_pooled() or self.is_queued():
+            raise UOSConfigurationError(
+                "Pooled and queued loading are not supported by asyncio devices."
+            )
+        if interface == Interface.USB and Interface.USB in self.device.interfaces:
+            self._device_interface = AsyncNPCSerialPort(
+                address,
+                baudrate=self.device.aux_params["default_baudrate"],
+            )
+        elif interface == Interface.STUB and Interface.STUB in self.device.interfaces:
+            self._device_interface = AsyncNPCStub(
+                connection=address,
+                errored=(kwargs["errored"] if "errored" in kwargs else False),
+            )
+        else:
+            raise UOSCommunicationError(
+                f"Could not correctly open a connection to {self.identity} - {self.address}"
+            )
+        self._port_key = (interface, address)
+        LOG.debug("Created device %s", self._device_interface.__repr__())
 
-    def __repr__(self):
-        """Over-rides the built in repr with something useful.
+    async def open(self):
+        """Connects to the device, explict calls are required if eager.
 
-        :return: String containing connection and identity of the device
+        :raises: UOSCommunicationError - Problem opening a connection.
         """
-        return (
-            f"<UOSDevice(address='{self.address}', identity='{self.identity}', "
-            f"device={self.device}, __device_interface='{self.__device_interface}', "
-            f"__kwargs={self.__kwargs})>"
+        if not await self._device_interface.open():
+            raise UOSCommunicationError(
+                "There was an error opening a connection to the device."
+            )
+
+    async def close(self):
+        """Releases connection, must be called explicitly if loading is eager.
+
+        :raises: UOSCommunicationError - Problem closing the connection to an active device.
+        """
+        if not await self._device_interface.close():
+            raise UOSCommunicationError(
+                "There was an error closing a connection to the device"
+            )
+
+    async def __aenter__(self):
+        """Opens eager devices on entering an async context."""
+        if not self.is_lazy():
+            await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Closes eager devices on leaving an async context."""
+        if not self.is_lazy():
+            await self.close()
+
+    async def execute_batch(
+        self, instructions: list[tuple[str, dict]], window: int = 1
+    ) -> list[ComResult]:
+        """Executes a list of instructions while holding a single connection.
+
+        All instructions are validated before any are executed, so an invalid
+        instruction raises without affecting the device.
+
+        :param instructions: List of (function name, keyword arguments) tuples,
+            for example ("set_gpio_output", {"pin": 13, "level": 1}).
+        :param window: Maximum number of instructions in flight on interfaces that
+            support pipelining, 1 waits on each response before sending the next.
+        :return: List of ComResult objects in the order of the instructions.
+        :raises: UOSUnsupportedError if any instruction is not possible on the loaded device.
+        """
+        runs = self._split_batch(self._stage_batch(instructions))
+        results = []
+        async with self.__get_lock():
+            if self.is_lazy():  # Connection held for the batch
+                await self.open()
+            for run in runs:
+                if len(run) == 1 and self._get_pipeline(run)[0][0] < 0:
+                    run_results = [await self.__transact(*run[0])]  # special action
+                else:
+                    run_results = await self._device_interface.execute_pipeline(
+                        self._get_pipeline(run), self._get_run_timeout(run), window
+                    )
+                    for rx_response in run_results:
+                        if rx_response.status:
+                            self._verify_checksums(rx_response)
+                for staged_instruction, rx_response in zip(run, run_results):
+                    results.append(await self.__retry(staged_instruction, rx_response))
+            if self.is_lazy():  # Lazy loaded
+                await self.close()
+        return results
+
+    async def get_all_gpio_config(self, **kwargs) -> ComResult:
+        """Reads the configuration of every digital pin over a single connection.
+
+        :param kwargs: Control arguments accepts volatility.
+        :return: ComResult with the per pin configuration in aux_data "pins".
+        """
+        batch = self._get_gpio_config_batch(**kwargs)
+        return self._collect_gpio_config(
+            await self.execute_batch(batch, GPIO_CONFIG_WINDOW)
         )
+
+    async def _dispatch_instruction(
+        self,
+        function_name: str,
+        volatility,
+        instruction_data: InstructionArguments,
+    ) -> ComResult:
+        """Executes a validated instruction, managing the connection.
+
+        Failed instructions are retried on the same connection as allowed by
+        the retry policy.
+
+        :param function_name: The name of the function in the OOL.
+        :param volatility: How volatile should the command be, use constants in HardwareCOM.
+        :param instruction_data: device_functions from the LUT, payload ect.
+        :return: ComResult object
+        """
+        cached_result = self._get_cached_result(
+            function_name, volatility, instruction_data
+        )
+        if cached_result is not None:
+            return cached_result
+        async with self.__get_lock():
+            if self.is_lazy():  # Lazy loaded
+                await self.open()
+            staged_instruction = (function_name, volatility, instruction_data)
+            rx_response = await self.__retry(
+                staged_instruction, await self.__transact(*staged_instruction)
+            )
+            if self.is_lazy():  # Lazy loaded
+                await self.close()
+        return rx_response
+
+    async def __retry(
+        self, staged_instruction: tuple, rx_response: ComResult
+    ) -> ComResult:
+        """Retries a failed instruction as allowed by the retry policy.
+
+        :param staged_instruction: Tuple of function name, volatility and instruction data.
+        :param rx_response: ComResult of the first attempt.
+        :return: ComResult of the last attempt.
+        """
+        policy = self._get_retry_policy()
+        attempt = 0
+        while not rx_response.status:
+            rule = policy.get_rule(rx_response)
+            attempt += 1
+            if attempt > rule.attempts:
+                break
+            LOG.debug(
+                "Retrying %s after failure %s",
+                staged_instruction[0],
+                rx_response.aux_data.get("failure"),
+            )
+            if rule.backoff_s > 0:
+                await asyncio.sleep(rule.get_delay(attempt))
+            if rule.reopen:  # the device may have changed while disconnected
+                SYSTEM_INFO_CACHE.invalidate(self._port_key)
+                self._reset_latency()
+                await self._device_interface.close()
+                if not await self._device_interface.open():
+                    break
+            if rule.resync:
+                await self._device_interface.reset_input()
+            rx_response = await self.__transact(*staged_instruction)
+        if staged_instruction[0] == UOSDeviceBase.hard_reset.__name__:
+            SYSTEM_INFO_CACHE.invalidate(self._port_key)
+            self._reset_latency()
+        self._update_state_cache(staged_instruction, rx_response)
+        return rx_response
+
+    async def __transact(
+        self,
+        function_name: str,
+        volatility,
+        instruction_data: InstructionArguments,
+    ) -> ComResult:
+        """Executes a validated instruction on an open interface.
+
+        :param function_name: The name of the function in the OOL.
+        :param volatility: How volatile should the command be, use constants in HardwareCOM.
+        :param instruction_data: device_functions from the LUT, payload ect.
+        :return: ComResult object
+        """
+        rx_response = ComResult(False)
+        if (
+            instruction_data.device_function_lut[function_name][volatility] >= 0
+        ):  # a normal instruction
+            start_s = monotonic()
+            tx_response = await self._device_interface.execute_instruction(
+                instruction_data.device_function_lut[function_name][volatility],
+                instruction_data.payload,
+                instruction_data.packet,
+            )
+            rx_response = tx_response
+            if tx_response.status:
+                rx_response = await self._device_interface.read_response(
+                    instruction_data.expected_rx_packets,
+                    self._get_timeout(function_name, instruction_data),
+                )
+                if rx_response.status:
+                    self._record_latency(function_name, monotonic() - start_s)
+                    self._verify_checksums(rx_response)
+        else:  # run a special action
+            rx_response = await getattr(self._device_interface, function_name)()
+        return rx_response
+
+    def __get_lock(self) -> asyncio.Lock:
+        """Gets the device lock, created on first use inside the event loop.
+
+        :return: asyncio Lock object.
+        """
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+        return self.__lock
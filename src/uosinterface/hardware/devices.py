@@ -10,11 +10,12 @@ class Interface(Enum):
 
     STUB = "NPCStub"
     USB = "NPCSerialPort"
+    SIMULATOR = "NPCSimulator"
 
 
 ARDUINO_NANO_3 = Device(
     name="Arduino Nano 3",
-    interfaces=[Interface.USB, Interface.STUB],
+    interfaces=[Interface.USB, Interface.STUB, Interface.SIMULATOR],
     functions_enabled={
         "set_gpio_output": {0: True},
         "get_gpio_input": {0: True},
@@ -0,0 +1,185 @@
+"""Module for running instructions across several UOS devices concurrently."""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from logging import getLogger as Log
+from time import monotonic
+from typing import Callable
+from typing import Dict
+from typing import Union
+
+from uosinterface import UOSConfigurationError
+from uosinterface import UOSError
+from uosinterface import UOSUnsupportedError
+from uosinterface.hardware import UOSDevice
+from uosinterface.hardware.uosabstractions import ComResult
+from uosinterface.hardware.uosabstractions import UOS_SCHEMA
+
+LOG = Log(__name__)
+
+
+@dataclass
+class GroupResult:
+    """Containing the per device results of a DeviceGroup operation.
+
+    :ivar results: ComResult, or list of ComResults for batches, keyed on address.
+    :ivar durations_s: Time taken by each device keyed on address.
+    :ivar wall_time_s: Time taken for all devices to complete.
+    """
+
+    results: Dict = field(default_factory=dict)
+    durations_s: Dict = field(default_factory=dict)
+    wall_time_s: float = 0
+
+    @property
+    def status(self) -> bool:
+        """Checks if every instruction on every device succeeded.
+
+        :return: Boolean, true if all results succeeded.
+        """
+        return all(
+            all(result.status for result in results)
+            if isinstance(results, list)
+            else results.status
+            for results in self.results.values()
+        )
+
+    @property
+    def busy_time_s(self) -> float:
+        """Total time spent by all devices, as if they had run one at a time.
+
+        :return: Sum of the device durations in seconds.
+        """
+        return sum(self.durations_s.values())
+
+
+class DeviceGroup:
+    """Runs instructions on several UOS devices concurrently.
+
+    Each device runs on a worker from a bounded thread pool, so the wall time
+    of an operation approaches the slowest device rather than the sum.
+
+    :ivar devices: UOSDevice objects keyed on address.
+    :ivar __executor: Thread pool the device instructions run on.
+    """
+
+    def __init__(self, devices: list[UOSDevice], max_workers: int = None):
+        """Instantiate a group over devices with unique addresses.
+
+        :param devices: List of UOSDevice objects to control.
+        :param max_workers: Maximum number of devices running at once, defaults
+            to the number of devices up to a limit of 32.
+        :raises: UOSConfigurationError if device addresses are not unique.
+        """
+        self.devices = {device.address: device for device in devices}
+        if len(self.devices) != len(devices):
+            raise UOSConfigurationError(
+                "Devices in a group must have unique addresses."
+            )
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers
+            if max_workers is not None
+            else max(1, min(32, len(devices))),
+            thread_name_prefix="DeviceGroup",
+        )
+
+    def execute(self, function_name: str, **kwargs) -> GroupResult:
+        """Runs the same instruction on every device in the group.
+
+        :param function_name: The name of the UOS function, eg. set_gpio_output.
+        :param kwargs: The arguments of the instruction, eg. pin=13, level=1.
+        :return: GroupResult with a ComResult per device.
+        :raises: UOSUnsupportedError if the function doesn't exist.
+        """
+        if function_name not in UOS_SCHEMA:
+            raise UOSUnsupportedError(f"UOS function {function_name} doesn't exist.")
+        return self.__fan_out(
+            {
+                address: (
+                    lambda device=device: getattr(device, function_name)(**kwargs)
+                )
+                for address, device in self.devices.items()
+            }
+        )
+
+    def execute_batch(
+        self, instructions: Dict[str, list[tuple[str, dict]]], window: int = 1
+    ) -> GroupResult:
+        """Runs a list of instructions per device, each on a single connection.
+
+        :param instructions: Lists of (function name, keyword arguments) tuples
+            keyed on the address of the device to run them on.
+        :param window: Maximum number of instructions in flight on each device.
+        :return: GroupResult with a list of ComResults per device, or a single
+            failed ComResult if the device raised an error.
+        :raises: UOSConfigurationError if an address is not in the group.
+        """
+        unknown = [address for address in instructions if address not in self.devices]
+        if len(unknown) > 0:
+            raise UOSConfigurationError(f"Devices {unknown} are not in the group.")
+        return self.__fan_out(
+            {
+                address: (
+                    lambda device=self.devices[address], batch=batch: (
+                        device.execute_batch(batch, window)
+                    )
+                )
+                for address, batch in instructions.items()
+            }
+        )
+
+    def close(self):
+        """Waits on running instructions and stops the worker threads."""
+        self.__executor.shutdown(wait=True)
+
+    def __fan_out(self, tasks: Dict[str, Callable]) -> GroupResult:
+        """Runs a task per device on the pool and gathers the results.
+
+        Errors raised by a device are captured in its result rather than
+        interrupting the other devices.
+
+        :param tasks: Callables keyed on the address of the device they control.
+        :return: GroupResult containing the task results.
+        """
+        group_result = GroupResult()
+        start_s = monotonic()
+        futures = {
+            address: self.__executor.submit(self.__timed, task)
+            for address, task in tasks.items()
+        }
+        for address, future in futures.items():
+            (
+                group_result.results[address],
+                group_result.durations_s[address],
+            ) = future.result()
+        group_result.wall_time_s = monotonic() - start_s
+        LOG.debug(
+            "Group of %s devices completed in %ss", len(tasks), group_result.wall_time_s
+        )
+        return group_result
+
+    @staticmethod
+    def __timed(task: Callable) -> tuple[Union[ComResult, list], float]:
+        """Runs a device task, timing it and capturing UOS errors.
+
+        :param task: Callable returning a ComResult or list of ComResults.
+        :return: Tuple of the task result and its duration in seconds.
+        """
+        start_s = monotonic()
+        try:
+            result = task()
+        except UOSError as exception:
+            result = ComResult(False, exception=str(exception))
+        return result, monotonic() - start_s
+
+    def __enter__(self):
+        """Allows the group to be used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops the worker threads on leaving the context."""
+        self.close()
+
+    def __len__(self):
+        """Number of devices in the group."""
+        return len(self.devices)
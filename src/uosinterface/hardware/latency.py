@@ -0,0 +1,108 @@
+"""Module estimating response timeouts from observed instruction latency."""
+from collections import deque
+from collections.abc import Hashable
+from math import ceil
+from threading import Lock
+
+
+class LatencyTracker:
+    """Records instruction round trip times and derives response timeouts.
+
+    Samples are kept in a rolling window per key, the timeout is a high
+    percentile of the window plus a margin, clamped between a floor and
+    ceiling. Until enough samples are observed the ceiling is used.
+
+    :ivar percentile: The fraction of observed round trips the timeout should cover.
+    :ivar margin_s: Time added to the percentile latency to allow for jitter.
+    :ivar floor_s: The minimum timeout that will be estimated.
+    :ivar ceiling_s: The maximum timeout, used while there are too few samples.
+    :ivar min_samples: Number of samples required before estimating.
+    :ivar window: Number of most recent samples kept per key.
+    :ivar __samples: Deques of round trip times keyed on (*device key, function).
+    :ivar __timeouts: Cached timeout estimates, cleared when a key is sampled.
+    :ivar __lock: Guards the sample windows.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.99,
+        margin_s: float = 0.05,
+        floor_s: float = 0.1,
+        ceiling_s: float = 2,
+        **kwargs,
+    ):
+        """Instantiate a tracker with no samples.
+
+        :param percentile: The fraction of observed round trips the timeout should cover.
+        :param margin_s: Time added to the percentile latency to allow for jitter.
+        :param floor_s: The minimum timeout that will be estimated.
+        :param ceiling_s: The maximum timeout, used while there are too few samples.
+        :param kwargs: Accepts min_samples (default 10) and window (default 100).
+        """
+        self.percentile = percentile
+        self.margin_s = margin_s
+        self.floor_s = floor_s
+        self.ceiling_s = ceiling_s
+        self.min_samples = kwargs["min_samples"] if "min_samples" in kwargs else 10
+        self.window = kwargs["window"] if "window" in kwargs else 100
+        self.__samples = {}
+        self.__timeouts = {}
+        self.__lock = Lock()
+
+    def record(self, key: Hashable, latency_s: float):
+        """Adds an observed round trip time to the window for a key.
+
+        :param key: Identifies the device and function, eg. (interface, address, function name).
+        :param latency_s: The time from sending the instruction to the full response.
+        """
+        with self.__lock:
+            if key not in self.__samples:
+                self.__samples[key] = deque(maxlen=self.window)
+            self.__samples[key].append(latency_s)
+            self.__timeouts.pop(key, None)
+
+    def get_timeout(self, key: Hashable) -> float:
+        """Estimates how long to wait on a response for a key.
+
+        :param key: Identifies the device and function, eg. (interface, address, function name).
+        :return: Timeout in seconds between floor_s and ceiling_s.
+        """
+        if key in self.__timeouts:
+            return self.__timeouts[key]
+        with self.__lock:
+            samples = sorted(self.__samples[key]) if key in self.__samples else []
+        if len(samples) < self.min_samples:
+            return self.ceiling_s
+        latency_s = samples[ceil(self.percentile * len(samples)) - 1]
+        timeout_s = min(max(latency_s + self.margin_s, self.floor_s), self.ceiling_s)
+        self.__timeouts[key] = timeout_s
+        return timeout_s
+
+    def reset(self, key: Hashable = None):
+        """Discards the samples for a key, or all keys.
+
+        :param key: Identifies the device and function, None to reset all.
+        """
+        with self.__lock:
+            for sample_key in [key] if key is not None else list(self.__samples):
+                self.__samples.pop(sample_key, None)
+                self.__timeouts.pop(sample_key, None)
+
+    def reset_device(self, device_key: tuple):
+        """Discards the samples for every function of a device.
+
+        Used when the device may have changed, eg. after a reset or reconnect.
+
+        :param device_key: Leading elements of the keys to reset, eg. (interface, address).
+        """
+        with self.__lock:
+            for sample_key in [
+                sample_key
+                for sample_key in self.__samples
+                if sample_key[: len(device_key)] == device_key
+            ]:
+                self.__samples.pop(sample_key)
+                self.__timeouts.pop(sample_key, None)
+
+
+LATENCY_TRACKER = LatencyTracker()
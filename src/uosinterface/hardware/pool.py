@@ -0,0 +1,204 @@
+"""Module defining a process-wide pool of open interface connections."""
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from logging import getLogger as Log
+from threading import Lock
+from threading import Timer
+from time import monotonic
+from typing import Callable
+from typing import Tuple
+
+from uosinterface import UOSCommunicationError
+from uosinterface import UOSConfigurationError
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.uosabstractions import UOSInterface
+
+LOG = Log(__name__)
+
+
+@dataclass
+class PooledConnection:
+    """Containing a shared interface handle and its usage state.
+
+    :ivar settings: Keyword arguments the handle was created with, None if unknown.
+    """
+
+    interface: UOSInterface
+    settings: dict = None
+    lock: Lock = field(default_factory=Lock)
+    last_used: float = field(default_factory=monotonic)
+
+
+class ConnectionPool:
+    """Keeps interface handles open between instructions for reuse.
+
+    Handles are keyed on (interface, address), the first handle created for a key
+    is shared by all subsequent users of that key, who must request the same
+    connection settings. Idle handles are closed by a timer that runs while the
+    pool has connections that aren't in use.
+
+    :ivar idle_timeout_s: Connections unused for longer than this are closed.
+    :ivar acquire_timeout_s: Maximum time to wait on a handle in use elsewhere.
+    :ivar __connections: Pooled connections keyed on (interface, address).
+    :ivar __lock: Guards modification of the connection dictionary.
+    :ivar __reaper: Timer evicting the next connection to go idle, None if not pending.
+    """
+
+    def __init__(self, idle_timeout_s: float = 60, acquire_timeout_s: float = 10):
+        """Instantiate an empty connection pool.
+
+        :param idle_timeout_s: Connections unused for longer than this are closed.
+        :param acquire_timeout_s: Maximum time to wait on a handle in use elsewhere.
+        """
+        self.idle_timeout_s = idle_timeout_s
+        self.acquire_timeout_s = acquire_timeout_s
+        self.__connections = {}
+        self.__lock = Lock()
+        self.__reaper = None
+
+    def get_interface(
+        self,
+        key: Tuple[Interface, str],
+        factory: Callable[[], UOSInterface],
+    ) -> UOSInterface:
+        """Looks up the shared handle for a key, creating it if required.
+
+        :param key: Tuple of the interface type and address of the device.
+        :param factory: Callable used to instantiate the handle if not pooled.
+        :return: The pooled UOSInterface, this may not be open.
+        :raises: UOSConfigurationError - Handle pooled with different settings.
+        """
+        return self.__get_connection(key, factory).interface
+
+    def acquire(
+        self,
+        key: Tuple[Interface, str],
+        factory: Callable[[], UOSInterface],
+    ) -> UOSInterface:
+        """Locks a pooled handle for exclusive use, opening it if required.
+
+        :param key: Tuple of the interface type and address of the device.
+        :param factory: Callable used to instantiate the handle if not pooled.
+        :return: The open UOSInterface, must be returned with release.
+        :raises: UOSCommunicationError - Handle busy or failed to open.
+        :raises: UOSConfigurationError - Handle pooled with different settings.
+        """
+        while True:
+            connection = self.__get_connection(key, factory)
+            if not connection.lock.acquire(timeout=self.acquire_timeout_s):
+                raise UOSCommunicationError(f"Timed out waiting on connection {key}.")
+            if self.__connections.get(key) is connection:
+                break
+            connection.lock.release()  # evicted while waiting, retry with a new handle
+        if not connection.interface.check_open():  # health check failed, reconnect
+            LOG.debug("Opening pooled connection %s", key)
+            connection.interface.close()
+            if not connection.interface.open():
+                connection.lock.release()
+                raise UOSCommunicationError(
+                    "There was an error opening a connection to the device."
+                )
+        return connection.interface
+
+    def release(self, key: Tuple[Interface, str], healthy: bool = True):
+        """Unlocks a handle after use and evicts any idle connections.
+
+        :param key: Tuple of the interface type and address of the device.
+        :param healthy: False if the handle failed and should be closed.
+        """
+        connection = self.__connections[key]
+        connection.last_used = monotonic()
+        if not healthy:  # force a fresh connection on next acquire
+            LOG.debug("Closing unhealthy pooled connection %s", key)
+            connection.interface.close()
+        connection.lock.release()
+        self.evict_idle()
+        self.__schedule_reaper()
+
+    def evict_idle(self):
+        """Closes and removes connections that have exceeded the idle
+        timeout."""
+        with self.__lock:
+            for key in list(self.__connections):
+                connection = self.__connections[key]
+                if (
+                    monotonic() - connection.last_used >= self.idle_timeout_s
+                    and connection.lock.acquire(blocking=False)
+                ):
+                    LOG.debug("Evicting idle pooled connection %s", key)
+                    connection.interface.close()
+                    del self.__connections[key]
+                    connection.lock.release()
+
+    def close_all(self):
+        """Closes and removes every connection that is not currently in
+        use."""
+        with self.__lock:
+            for key in list(self.__connections):
+                connection = self.__connections[key]
+                if connection.lock.acquire(blocking=False):
+                    connection.interface.close()
+                    del self.__connections[key]
+                    connection.lock.release()
+
+    def __schedule_reaper(self):
+        """Starts a timer to evict the next connection to go idle, if not pending.
+
+        Connections in use are not timed, they are rescheduled on release.
+        """
+        with self.__lock:
+            if self.__reaper is not None:
+                return
+            last_used = [
+                connection.last_used
+                for connection in self.__connections.values()
+                if not connection.lock.locked()
+            ]
+            if len(last_used) == 0:
+                return
+            self.__reaper = Timer(
+                max(min(last_used) + self.idle_timeout_s - monotonic(), 0),
+                self.__reap,
+            )
+            self.__reaper.daemon = True  # don't hold the process open
+            self.__reaper.start()
+
+    def __reap(self):
+        """Timer callback, evicts idle connections then times the next."""
+        with self.__lock:
+            self.__reaper = None
+        self.evict_idle()
+        self.__schedule_reaper()
+
+    def __get_connection(
+        self,
+        key: Tuple[Interface, str],
+        factory: Callable[[], UOSInterface],
+    ) -> PooledConnection:
+        """Looks up the pooled connection for a key, creating it if required.
+
+        Settings are compared when the factory is a partial, as the keywords
+        passed to the interface, eg. baudrate, apply to the whole port.
+        """
+        settings = factory.keywords if isinstance(factory, partial) else None
+        with self.__lock:
+            if key not in self.__connections:
+                self.__connections[key] = PooledConnection(factory(), settings)
+                LOG.debug("Pooled new connection %s", key)
+            connection = self.__connections[key]
+        if None not in (settings, connection.settings) and (
+            settings != connection.settings
+        ):
+            raise UOSConfigurationError(
+                f"Connection {key} is pooled with settings {connection.settings} "
+                f"not {settings}."
+            )
+        return connection
+
+    def __len__(self):
+        """Number of connections currently pooled."""
+        return len(self.__connections)
+
+
+CONNECTION_POOL = ConnectionPool()
@@ -0,0 +1,66 @@
+"""Module defining how failed instructions are retried."""
+from dataclasses import dataclass
+from dataclasses import field
+
+from uosinterface.hardware.uosabstractions import ComResult
+from uosinterface.hardware.uosabstractions import Failure
+
+
+@dataclass(frozen=True)
+class RetryRule:
+    """Defines how an instruction is retried after a class of failure.
+
+    :ivar attempts: Number of retries allowed after the first attempt.
+    :ivar backoff_s: Delay before the first retry, doubled for each further retry.
+    :ivar resync: Discard unread input on the interface before retrying.
+    :ivar reopen: Close and re-open the interface before retrying.
+    """
+
+    attempts: int = 0
+    backoff_s: float = 0
+    resync: bool = False
+    reopen: bool = False
+
+    def get_delay(self, attempt: int) -> float:
+        """Gets the backoff delay before a retry.
+
+        :param attempt: The retry number, starting at 1.
+        :return: Delay in seconds.
+        """
+        return self.backoff_s * 2 ** (attempt - 1)
+
+
+@dataclass
+class RetryPolicy:
+    """Maps failure classes to retry rules for a device.
+
+    :ivar rules: RetryRule objects keyed on the Failure class.
+    :ivar default: Rule used for failures that haven't been classified.
+    """
+
+    rules: dict = field(
+        default_factory=lambda: {
+            Failure.NOT_OPEN: RetryRule(attempts=1, backoff_s=0.1, reopen=True),
+            Failure.WRITE: RetryRule(attempts=1, backoff_s=0.05, resync=True),
+            Failure.TIMEOUT: RetryRule(),  # retrying would wait the full timeout again
+            Failure.CHECKSUM: RetryRule(attempts=2, resync=True),
+            Failure.PARTIAL_FRAME: RetryRule(attempts=1, resync=True),
+        }
+    )
+    default: RetryRule = RetryRule(attempts=1)
+
+    def get_rule(self, result: ComResult) -> RetryRule:
+        """Looks up the rule for a failed instruction.
+
+        :param result: ComResult of the failed instruction.
+        :return: The RetryRule for the class of failure.
+        """
+        failure = result.aux_data.get("failure")
+        return self.rules[failure] if failure in self.rules else self.default
+
+
+# Policy used by devices unless one is passed with the retry_policy kwarg.
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Policy that never retries, failures are returned immediately.
+NO_RETRY = RetryPolicy(rules={}, default=RetryRule())
@@ -0,0 +1,206 @@
+"""Module for continuously sampling analogue inputs into a ring buffer."""
+from array import array
+from logging import getLogger as Log
+from threading import Event
+from threading import Thread
+from time import monotonic
+from time import time
+
+from uosinterface import UOSConfigurationError
+from uosinterface import UOSError
+from uosinterface import UOSUnsupportedError
+from uosinterface.hardware import UOSDevice
+
+LOG = Log(__name__)
+
+
+class ADCSampler:
+    """Reads analogue pins at a target rate into preallocated ring buffers.
+
+    Every sweep reads all the pins in a single pipelined batch and stores one
+    value per pin, with the time the sweep completed. The buffers are mirrored,
+    each sample is written twice capacity apart, so the latest samples are
+    always contiguous and can be returned as memoryviews without copying.
+
+    :ivar device: The UOSDevice sampled, this must hold its connection open.
+    :ivar pins: The analogue pin indices sampled in each sweep.
+    :ivar rate_hz: The target number of sweeps per second.
+    :ivar capacity: The number of sweeps held in the buffers.
+    :ivar byteorder: Byte order of the ADC value in the response payload.
+    :ivar sweeps: The number of sweeps successfully stored.
+    :ivar overruns: The number of sweep deadlines missed.
+    :ivar errors: The number of sweeps discarded due to a failed read.
+    :ivar __values: Mirrored value buffers keyed on pin.
+    :ivar __timestamps: Mirrored buffer of the epoch time of each sweep.
+    :ivar __instructions: The batch of instructions executed each sweep.
+    :ivar __started: Monotonic time sampling started.
+    :ivar __stopped: Monotonic time sampling stopped, None while sampling.
+    :ivar __started_sweeps: The number of sweeps stored before sampling started.
+    :ivar __stop: Event set to stop the sampling thread.
+    :ivar __thread: The sampling thread, None if not started.
+    """
+
+    def __init__(
+        self,
+        device: UOSDevice,
+        pins: list[int],
+        rate_hz: float,
+        capacity: int = 4096,
+        **kwargs,
+    ):
+        """Instantiate a sampler, allocating the buffers.
+
+        :param device: The UOSDevice to sample, loading must not be lazy.
+        :param pins: The analogue pin indices to sample each sweep.
+        :param rate_hz: The target number of sweeps per second.
+        :param capacity: The number of sweeps held in the buffers.
+        :param kwargs: Accepts byteorder of the ADC value, defaults to little.
+        :raises: UOSUnsupportedError if a pin doesn't support ADC input.
+        :raises: UOSConfigurationError if the device is lazy loaded.
+        """
+        compatible_pins = device.device.get_compatible_pins("get_adc_input")
+        for pin in pins:
+            if pin not in compatible_pins:
+                raise UOSUnsupportedError(
+                    f"Pin {pin} doesn't support ADC input on {device.identity}."
+                )
+        if device.is_lazy():  # re-opening per sweep would reset most devices
+            raise UOSConfigurationError(
+                "Sampling requires a device that holds its connection open."
+            )
+        self.device = device
+        self.pins = list(pins)
+        self.rate_hz = rate_hz
+        self.capacity = capacity
+        self.byteorder = kwargs["byteorder"] if "byteorder" in kwargs else "little"
+        self.sweeps = 0
+        self.overruns = 0
+        self.errors = 0
+        self.__values = {pin: array("H", bytes(4 * capacity)) for pin in self.pins}
+        self.__timestamps = array("d", bytes(16 * capacity))
+        self.__instructions = [
+            ("get_adc_input", {"pin": pin, "level": 0}) for pin in self.pins
+        ]
+        self.__started = None
+        self.__stopped = None
+        self.__started_sweeps = 0
+        self.__stop = Event()
+        self.__thread = None
+
+    def start(self):
+        """Starts sampling on a background thread."""
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__stop.clear()
+        self.__started = monotonic()
+        self.__stopped = None
+        self.__started_sweeps = self.sweeps  # sweeps are kept to index the buffers
+        self.__thread = Thread(
+            target=self.__run, name=f"ADCSampler({self.device.address})", daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self):
+        """Stops sampling, waiting on the sweep in progress."""
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+            self.__stopped = monotonic()
+
+    def is_running(self) -> bool:
+        """Checks if the sampling thread is running.
+
+        :return: Boolean, true if sampling.
+        """
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def latest(self, pin: int, count: int = None) -> memoryview:
+        """Gets a view of the most recent values read from a pin, oldest first.
+
+        The view is of the live buffer, copy it if values must not change.
+
+        :param pin: The analogue pin index.
+        :param count: Number of values, defaults to all that are available.
+        :return: memoryview of unsigned 16 bit values.
+        """
+        return self.__latest(self.__values[pin], count)
+
+    def latest_timestamps(self, count: int = None) -> memoryview:
+        """Gets a view of the epoch times of the most recent sweeps, oldest
+        first.
+
+        :param count: Number of timestamps, defaults to all that are available.
+        :return: memoryview of float seconds.
+        """
+        return self.__latest(self.__timestamps, count)
+
+    @property
+    def achieved_rate_hz(self) -> float:
+        """The average number of sweeps per second since sampling last started.
+
+        :return: Rate in Hz, 0 if not started.
+        """
+        if self.__started is None:
+            return 0
+        elapsed_s = (
+            monotonic() if self.__stopped is None else self.__stopped
+        ) - self.__started
+        sweeps = self.sweeps - self.__started_sweeps
+        return sweeps / elapsed_s if elapsed_s > 0 else 0
+
+    def __latest(self, buffer: array, count: int = None) -> memoryview:
+        """Slices the latest samples from a mirrored buffer.
+
+        :param buffer: The mirrored buffer to view.
+        :param count: Number of samples, defaults to all that are available.
+        :return: memoryview of the contiguous samples.
+        """
+        available = min(self.sweeps, self.capacity)
+        count = available if count is None else min(count, available)
+        end = self.sweeps % self.capacity + self.capacity
+        return memoryview(buffer)[end - count : end]
+
+    def __run(self):
+        """Sampling thread loop, sweeps the pins until stopped."""
+        period_s = 1 / self.rate_hz
+        deadline = monotonic()
+        while not self.__stop.is_set():
+            self.__sweep()
+            deadline += period_s
+            delay_s = deadline - monotonic()
+            if delay_s < 0:  # missed the deadline, resync rather than burst
+                self.overruns += 1
+                deadline = monotonic()
+            elif self.__stop.wait(delay_s):
+                break
+
+    def __sweep(self):
+        """Reads every pin and stores the values if all reads succeeded."""
+        try:
+            results = self.device.execute_batch(self.__instructions, len(self.pins))
+        except UOSError as exception:
+            LOG.error("ADC sweep failed %s", exception)
+            self.errors += 1
+            return
+        if not all(result.status for result in results):
+            self.errors += 1
+            return
+        index = self.sweeps % self.capacity
+        for pin, result in zip(self.pins, results):
+            value = int.from_bytes(result.get_payload()[:2], self.byteorder)
+            self.__values[pin][index] = value
+            self.__values[pin][index + self.capacity] = value
+        timestamp = time()
+        self.__timestamps[index] = timestamp
+        self.__timestamps[index + self.capacity] = timestamp
+        self.sweeps += 1
+
+    def __enter__(self):
+        """Starts sampling on entering a context."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops sampling on leaving a context."""
+        self.stop()
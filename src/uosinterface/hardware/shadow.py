@@ -0,0 +1,85 @@
+"""Module for keeping a host side shadow of the pin state on a device."""
+from threading import Lock
+from time import monotonic
+
+CONFIG_LEVELS = ("current", "ram", "eeprom")  # indexed on volatility
+
+
+class PinStateCache:
+    """Shadow of the mode and level of each pin at every volatility.
+
+    Entries are populated from configuration reads and written through by
+    instructions that change pin state. An entry only answers reads while
+    every volatility is known and younger than the staleness bound.
+
+    :ivar max_age_s: Maximum age of a shadowed value before it is re-read.
+    :ivar __pins: Dicts of (mode, level, monotonic time) keyed on volatility,
+        keyed on pin index.
+    :ivar __lock: Guards the pin entries.
+    """
+
+    def __init__(self, max_age_s: float = 1):
+        """Instantiate an empty cache.
+
+        :param max_age_s: Maximum age of a shadowed value before it is re-read.
+        """
+        self.max_age_s = max_age_s
+        self.__pins = {}
+        self.__lock = Lock()
+
+    def update(self, pin: int, config: dict):
+        """Stores the configuration of a pin read from the device.
+
+        :param pin: The pin index.
+        :param config: Dict with the "<level>_mode" and "<level>_level" of each
+            volatility, as returned by get_gpio_config.
+        """
+        now = monotonic()
+        entry = {
+            volatility: (config[f"{name}_mode"], config[f"{name}_level"], now)
+            for volatility, name in enumerate(CONFIG_LEVELS)
+            if f"{name}_mode" in config and f"{name}_level" in config
+        }
+        with self.__lock:
+            self.__pins[pin] = entry
+
+    def write(self, pin: int, volatility: int, mode: int, level: int):
+        """Writes through a change to the state of a pin at a volatility.
+
+        :param pin: The pin index.
+        :param volatility: The volatility the state was set at.
+        :param mode: The io mode the pin was set to.
+        :param level: The level the pin was set to.
+        """
+        with self.__lock:
+            self.__pins.setdefault(pin, {})[volatility] = (mode, level, monotonic())
+
+    def invalidate(self, pin: int = None):
+        """Discards the shadowed state of a pin, or all pins.
+
+        :param pin: The pin index, None to invalidate every pin.
+        """
+        with self.__lock:
+            if pin is None:
+                self.__pins.clear()
+            else:
+                self.__pins.pop(pin, None)
+
+    def get(self, pin: int) -> dict:
+        """Looks up the shadowed configuration of a pin.
+
+        :param pin: The pin index.
+        :return: Dict in the form of update's config, None if any volatility
+            is unknown or stale.
+        """
+        oldest_s = monotonic() - self.max_age_s
+        with self.__lock:
+            entry = self.__pins.get(pin, {})
+            if len(entry) < len(CONFIG_LEVELS) or any(
+                updated_s < oldest_s for _, _, updated_s in entry.values()
+            ):
+                return None
+            config = {}
+            for volatility, name in enumerate(CONFIG_LEVELS):
+                config[f"{name}_mode"], config[f"{name}_level"], _ = entry[volatility]
+            return config
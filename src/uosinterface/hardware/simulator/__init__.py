@@ -0,0 +1,307 @@
+"""Package simulates a stateful UOS device with modelled link timing."""
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from math import pi
+from math import sin
+from random import Random
+from time import monotonic
+from time import sleep
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+from uosinterface.hardware.uosabstractions import ComResult
+from uosinterface.hardware.uosabstractions import Failure
+from uosinterface.hardware.uosabstractions import UOSInterface
+
+# Bits on the wire per byte, 8N1 framing adds a start and stop bit.
+BITS_PER_BYTE = 10
+
+# Full scale reading of the simulated 10 bit ADC.
+ADC_FULL_SCALE = 1023
+
+OUTPUT_MODE = 0  # io type argument of set_gpio_output
+INPUT_MODE = 1  # io type argument of get_gpio_input
+
+
+def sine_wave(
+    frequency_hz: float = 1, amplitude: float = 511, offset: float = 512
+) -> Callable[[float], float]:
+    """Creates an ADC waveform tracing a sine.
+
+    :param frequency_hz: Cycles per second.
+    :param amplitude: Peak deviation from the offset in ADC counts.
+    :param offset: The mid point of the wave in ADC counts.
+    :return: Callable taking a time in seconds and returning ADC counts.
+    """
+    return lambda time_s: offset + amplitude * sin(2 * pi * frequency_hz * time_s)
+
+
+def constant(value: float) -> Callable[[float], float]:
+    """Creates an ADC waveform holding a single value.
+
+    :param value: The ADC counts to return.
+    :return: Callable taking a time in seconds and returning ADC counts.
+    """
+    return lambda time_s: value
+
+
+@dataclass
+class PinState:
+    """Containing the simulated mode and level of a pin at each volatility.
+
+    :ivar modes: io type at super volatile (current), volatile (ram) and
+        non volatile (eeprom) levels.
+    :ivar levels: Output level or pull up state, indexed the same as modes.
+    """
+
+    modes: List = field(default_factory=lambda: [INPUT_MODE] * 3)
+    levels: List = field(default_factory=lambda: [0] * 3)
+
+
+class NPCSimulator(UOSInterface):
+    """Simulated UOS endpoint that keeps pin state and models link timing.
+
+    Responses become readable once they would have arrived over a serial
+    link, the instruction and response frames each take their length in bits
+    over the baudrate, plus the device processing time and a random jitter.
+    Responses are queued per instruction, so instructions can be pipelined.
+
+    :ivar connection: The simulated connection string.
+    :ivar baudrate: Serial link speed used to time frames.
+    :ivar processing_s: Time the device takes to act on an instruction.
+    :ivar jitter_s: Maximum random delay added to each response.
+    :ivar error_rate: Probability of an instruction's response being faulty.
+    :ivar version: Firmware version reported by get_system_info.
+    :ivar hwid: Hardware id reported by get_system_info.
+    :ivar waveforms: ADC waveform callables keyed on analogue pin index.
+    :ivar inputs: Levels driven onto input pins, keyed on pin index, pins not
+        driven read their pull up state.
+    :ivar pins: PinState of each pin used, keyed on pin index.
+    :ivar __responses: Deque of (ready time, frames, failure) per instruction.
+    :ivar __tx_free: Monotonic time the host to device link is next idle.
+    :ivar __rx_free: Monotonic time the device to host link is next idle.
+    :ivar __started: Monotonic time the simulation started, for waveforms.
+    :ivar __random: Random generator for jitter and faults.
+    :ivar __open: True while the simulated connection is open.
+    """
+
+    def __init__(self, connection: str, baudrate: int = 115200, **kwargs):
+        """Instantiate a simulated device in its power on state.
+
+        :param connection: The simulated connection string, empty fails to open.
+        :param baudrate: Serial link speed used to time frames.
+        :param kwargs: Simulation parameters, accepts processing_s (default
+            0.0005), jitter_s (0), error_rate (0), seed, version ((0, 0, 0)),
+            hwid (0), waveforms and inputs.
+        """
+        self.connection = connection
+        self.baudrate = baudrate
+        self.processing_s = (
+            kwargs["processing_s"] if "processing_s" in kwargs else 0.0005
+        )
+        self.jitter_s = kwargs["jitter_s"] if "jitter_s" in kwargs else 0
+        self.error_rate = kwargs["error_rate"] if "error_rate" in kwargs else 0
+        self.version = kwargs["version"] if "version" in kwargs else (0, 0, 0)
+        self.hwid = kwargs["hwid"] if "hwid" in kwargs else 0
+        self.waveforms = kwargs["waveforms"] if "waveforms" in kwargs else {}
+        self.inputs = kwargs["inputs"] if "inputs" in kwargs else {}
+        self.pins = {}
+        self.__responses = deque()
+        self.__tx_free = 0
+        self.__rx_free = 0
+        self.__started = monotonic()
+        self.__random = Random(kwargs["seed"] if "seed" in kwargs else None)
+        self.__open = False
+
+    def execute_instruction(
+        self, address: int, payload: Tuple[int, ...], packet: bytes = None
+    ) -> ComResult:
+        """Sends an instruction to the simulated device.
+
+        :param address: An 8 bit unsigned integer of the UOS subsystem targeted by the instruction.
+        :param payload: A tuple containing the uint8 parameters of the UOS instruction.
+        :param packet: The pre-built packet for the instruction, None to build it.
+        :return: ComResult object, failing if not open or not a UOS instruction.
+        """
+        if not self.__open:
+            return ComResult(
+                False,
+                exception="Connection must be open first.",
+                aux_data={"failure": Failure.NOT_OPEN},
+            )
+        response = self.respond(address, payload)
+        if response is None:
+            return ComResult(False, exception=f"Unknown instruction {address}.")
+        if packet is None:
+            packet = self.get_npc_packet(to_addr=address, from_addr=0, payload=payload)
+        now = monotonic()
+        self.__tx_free = max(now, self.__tx_free) + self.get_link_time_s(len(packet))
+        frames = [self.get_npc_packet(0, address, (0,))] + [
+            self.get_npc_packet(0, address, data) for data in response
+        ]
+        ready_s = max(self.__tx_free + self.processing_s, self.__rx_free)
+        ready_s += self.get_link_time_s(sum(len(frame) for frame in frames))
+        if self.jitter_s > 0:
+            ready_s += self.__random.uniform(0, self.jitter_s)
+        self.__rx_free = ready_s
+        failure = None
+        if self.error_rate > 0 and self.__random.random() < self.error_rate:
+            failure = self.__random.choice(
+                [Failure.TIMEOUT, Failure.CHECKSUM, Failure.PARTIAL_FRAME]
+            )
+        self.__responses.append((ready_s, frames, failure))
+        return ComResult(True)
+
+    def read_response(self, expect_packets: int, timeout_s: float) -> ComResult:
+        """Waits for the response to the oldest unread instruction.
+
+        :param expect_packets: How many packets including ACK to expect.
+        :param timeout_s: The maximum time this function will wait for data.
+        :return: ComResult object, failures are classified in aux_data.
+        """
+        if not self.__open:
+            return ComResult(
+                False,
+                exception="Connection must be opened first.",
+                aux_data={"failure": Failure.NOT_OPEN},
+            )
+        deadline_s = monotonic() + timeout_s
+        if len(self.__responses) == 0:
+            sleep(timeout_s)
+            return ComResult(
+                False,
+                exception="Timed out waiting on response.",
+                aux_data={"failure": Failure.TIMEOUT},
+            )
+        ready_s, frames, failure = self.__responses[0]
+        if failure == Failure.TIMEOUT or ready_s > deadline_s:
+            sleep(max(0, deadline_s - monotonic()))
+            if failure == Failure.TIMEOUT:  # lost, a late response is still read
+                self.__responses.popleft()
+            return ComResult(
+                False,
+                exception="Timed out waiting on response.",
+                aux_data={"failure": Failure.TIMEOUT},
+            )
+        sleep(max(0, ready_s - monotonic()))
+        self.__responses.popleft()
+        frames = frames[:expect_packets]
+        if failure == Failure.CHECKSUM:  # the device verifies checksums
+            frames[-1] = frames[-1][:-2] + bytes([frames[-1][-2] ^ 0xFF]) + b"<"
+        elif failure == Failure.PARTIAL_FRAME:
+            return ComResult(
+                False,
+                exception="Received a partial frame.",
+                ack_packet=frames[0] if len(frames) > 1 else b"",
+                rx_packets=[*frames[1:-1], frames[-1][: len(frames[-1]) // 2]],
+                aux_data={"failure": Failure.PARTIAL_FRAME},
+            )
+        return ComResult(True, ack_packet=frames[0], rx_packets=frames[1:])
+
+    def execute_pipeline(
+        self,
+        instructions: List[Tuple[int, Tuple[int, ...], int, bytes]],
+        timeout_s: float,
+        window: int = 1,
+    ) -> List[ComResult]:
+        """Executes several instructions with up to window in flight.
+
+        :param instructions: List of (address, payload, expected packets, packet) tuples.
+        :param timeout_s: The maximum time to wait on the response to each instruction.
+        :param window: The maximum number of instructions in flight at once.
+        :return: List of ComResult objects in the order of the instructions.
+        """
+        results = [None] * len(instructions)
+        in_flight = deque()
+        for index, (address, payload, expect_packets, packet) in enumerate(
+            instructions
+        ):
+            while len(in_flight) >= max(1, window):
+                oldest, oldest_expect = in_flight.popleft()
+                results[oldest] = self.read_response(oldest_expect, timeout_s)
+            results[index] = self.execute_instruction(address, payload, packet)
+            if results[index].status:
+                in_flight.append((index, expect_packets))
+        for index, expect_packets in in_flight:
+            results[index] = self.read_response(expect_packets, timeout_s)
+        return results
+
+    def reset_input(self) -> bool:
+        """Discards responses that have not been read."""
+        self.__responses.clear()
+        return self.__open
+
+    def hard_reset(self) -> ComResult:
+        """Simulates a power cycle, pins return to their non volatile state."""
+        self.__responses.clear()
+        for state in self.pins.values():
+            state.modes[:2] = [state.modes[2]] * 2
+            state.levels[:2] = [state.levels[2]] * 2
+        return ComResult(True)
+
+    def open(self) -> bool:
+        """Opens the simulated connection, fails if the connection is empty."""
+        self.__open = len(self.connection) > 0
+        return self.__open
+
+    def close(self) -> bool:
+        """Closes the simulated connection, discarding unread responses."""
+        self.__responses.clear()
+        self.__open = False
+        return True
+
+    def check_open(self) -> bool:
+        """Checks the simulated connection state."""
+        return self.__open
+
+    def get_link_time_s(self, num_bytes: int) -> float:
+        """The time taken to transfer bytes over the simulated link.
+
+        :param num_bytes: Number of bytes sent.
+        :return: Time in seconds.
+        """
+        return num_bytes * BITS_PER_BYTE / self.baudrate
+
+    def respond(self, address: int, payload: Tuple[int, ...]):
+        """Applies an instruction to the simulated state.
+
+        :param address: The UOS subsystem targeted by the instruction.
+        :param payload: The parameters of the instruction.
+        :return: List of response data payloads, None if not a UOS instruction.
+        """
+        if address == 64 and len(payload) == 3:  # gpio, pin, io type, level
+            pin, mode, level = payload
+            state = self.pins.setdefault(pin, PinState())
+            state.modes[0], state.levels[0] = mode, level
+            if mode == OUTPUT_MODE:
+                return []
+            return [(self.inputs.get(pin, level),)]
+        if address == 85 and len(payload) == 1:  # adc, pin
+            waveform = self.waveforms.get(payload[0], constant(0))
+            value = int(
+                min(max(waveform(monotonic() - self.__started), 0), ADC_FULL_SCALE)
+            )
+            return [tuple(value.to_bytes(2, "little"))]
+        if address == 68:  # reset all io to the volatile state
+            for state in self.pins.values():
+                state.modes[0], state.levels[0] = state.modes[1], state.levels[1]
+            return []
+        if address == 250:  # system info
+            return [(*self.version, self.hwid, 0, 0)]
+        if address == 251 and len(payload) == 1:  # gpio config, pin
+            state = self.pins.get(payload[0], PinState())
+            return [
+                tuple(
+                    value
+                    for mode, level in zip(state.modes, state.levels)
+                    for value in (mode, level)
+                )
+            ]
+        return None
+
+    @staticmethod
+    def enumerate_devices() -> []:
+        """Returns a list of simulated devices available on the interface."""
+        return [NPCSimulator("SIMULATOR")]  # The simulator is always available
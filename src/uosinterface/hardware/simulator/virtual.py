@@ -0,0 +1,138 @@
+"""Module serving a simulated UOS device over a pseudo terminal."""
+import os
+import platform
+from logging import getLogger as Log
+from select import select
+from threading import Thread
+
+from uosinterface import UOSUnsupportedError
+from uosinterface.hardware.simulator import NPCSimulator
+from uosinterface.hardware.uosabstractions import NPCFrameDecoder
+from uosinterface.hardware.uosabstractions import UOSInterface
+
+if platform.system() == "Linux":
+    import tty  # pylint: disable=E0401
+else:
+    pass
+
+LOG = Log(__name__)
+
+# Time the server waits on data before checking if it should stop.
+POLL_S = 0.05
+
+
+class VirtualSerialDevice:
+    """Speaks the NPC protocol on the slave side of a Linux pseudo terminal.
+
+    The slave path is connected to by NPCSerialPort like any other port, so
+    the real serial code paths can be exercised without hardware. Instructions
+    are applied to an NPCSimulator's pin state and answered as soon as they
+    are framed, the only latency is that of the pseudo terminal.
+
+    :ivar simulator: NPCSimulator holding the state of the virtual device.
+    :ivar path: The slave device path to connect to, None until started.
+    :ivar instructions: Count of instructions answered.
+    :ivar unknown: Count of frames received that were not UOS instructions.
+    :ivar __master: File descriptor of the master side, None until started.
+    :ivar __slave: File descriptor of the slave side, held open so the pseudo
+        terminal is not hung up between client connections.
+    :ivar __thread: Thread serving the master side.
+    :ivar __running: True until the server is asked to stop.
+    """
+
+    def __init__(self, **kwargs):
+        """Instantiate a virtual device, the pseudo terminal opens on start.
+
+        :param kwargs: Simulation parameters passed to NPCSimulator, such as
+            version, hwid, waveforms and inputs. Link timing is not modelled.
+        """
+        self.simulator = NPCSimulator("VIRTUAL", **kwargs)
+        self.path = None
+        self.instructions = 0
+        self.unknown = 0
+        self.__master = None
+        self.__slave = None
+        self.__thread = None
+        self.__running = False
+
+    def start(self) -> str:
+        """Opens the pseudo terminal and starts serving it.
+
+        :return: The slave device path to connect to.
+        :raises UOSUnsupportedError: Pseudo terminals are only supported on Linux.
+        """
+        if platform.system() != "Linux":
+            raise UOSUnsupportedError("Virtual serial devices require Linux.")
+        if self.__thread is not None:
+            return self.path
+        self.__master, self.__slave = os.openpty()
+        tty.setraw(self.__slave)  # no echo or line processing of binary frames
+        self.path = os.ttyname(self.__slave)
+        self.__running = True
+        self.__thread = Thread(
+            target=self.__serve, name=f"VirtualSerialDevice({self.path})", daemon=True
+        )
+        self.__thread.start()
+        LOG.debug("Serving virtual device on %s", self.path)
+        return self.path
+
+    def stop(self):
+        """Stops serving and closes the pseudo terminal."""
+        if self.__thread is None:
+            return
+        self.__running = False
+        self.__thread.join()
+        self.__thread = None
+        os.close(self.__master)
+        os.close(self.__slave)
+        self.__master = self.__slave = None
+        LOG.debug("Stopped virtual device on %s", self.path)
+
+    def is_running(self) -> bool:
+        """Checks if the server is answering instructions.
+
+        :return: Boolean, true if started and not stopped.
+        """
+        return self.__thread is not None
+
+    def __serve(self):
+        """Frames instructions written to the slave side and answers them."""
+        decoder = NPCFrameDecoder()
+        while self.__running:
+            readable, _, _ = select([self.__master], [], [], POLL_S)
+            if not readable:
+                continue
+            try:
+                decoder.feed(os.read(self.__master, 4096))
+            except OSError as exception:  # no client has the slave side open
+                LOG.debug("Virtual device read failed %s", exception)
+                continue
+            response = b"".join(self.__answer(frame) for frame in decoder.frames())
+            if len(response) > 0:
+                os.write(self.__master, response)
+
+    def __answer(self, frame: bytes) -> bytes:
+        """Applies an instruction to the simulator and builds the response.
+
+        :param frame: The instruction packet.
+        :return: The ACK and response packets, empty if not a UOS instruction.
+        """
+        address, payload = frame[1], tuple(frame[4:-2])
+        response = self.simulator.respond(address, payload)
+        if response is None:
+            self.unknown += 1
+            LOG.debug("Virtual device ignored unknown instruction %s", frame)
+            return b""
+        self.instructions += 1
+        return b"".join(
+            UOSInterface.get_npc_packet(0, address, data) for data in [(0,), *response]
+        )
+
+    def __enter__(self):
+        """Starts serving when used as a context manager."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops serving on leaving the context."""
+        self.stop()
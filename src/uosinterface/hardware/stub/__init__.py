@@ -1,47 +1,66 @@
 """Package is used as a simulated UOSInteface for test purposes."""
+from collections import deque
 from typing import Tuple
 
+from uosinterface.hardware.uosabstractions import AsyncUOSInterface
 from uosinterface.hardware.uosabstractions import ComResult
+from uosinterface.hardware.uosabstractions import NPCFrameDecoder
 from uosinterface.hardware.uosabstractions import UOS_SCHEMA
 from uosinterface.hardware.uosabstractions import UOSFunction
 from uosinterface.hardware.uosabstractions import UOSInterface
 
 
+def index_schema() -> dict:
+    """Indexes the UOS schema on address, with the responses to simulate.
+
+    Each response is framed from its byte stream by NPCFrameDecoder, so the
+    stub serves the frames a serial interface would read.
+
+    :return: Lists of (UOSFunction, response frames) tuples keyed on address,
+        in schema order.
+    """
+    index = {}
+    for function in UOS_SCHEMA.values():
+        for address in set(function.address_lut.values()):
+            frames = [
+                UOSInterface.get_npc_packet(0, address, (0,) * rx_packet)
+                for rx_packet in function.rx_packets_expected
+            ]
+            if function.ack:
+                frames.insert(0, UOSInterface.get_npc_packet(0, address, (0,)))
+            decoder = NPCFrameDecoder()
+            decoder.feed(b"".join(frames))
+            index.setdefault(address, []).append((function, tuple(decoder.frames())))
+    return index
+
+
+# Simulated functions and their response frames keyed on address.
+SCHEMA_INDEX = index_schema()
+
+
 class NPCStub(UOSInterface):
     """Class can be used as a low level test endpoint."""
 
     def __init__(self, connection: str, errored: int = 0):
         """Instantiate an instance of the test stub."""
-        self.__packet_buffer = []
+        self.__packet_buffer = deque()
         self.__open = False
         self.errored = errored
         self.connection = connection
 
-    def execute_instruction(self, address: int, payload: Tuple[int, ...]) -> ComResult:
+    def execute_instruction(
+        self, address: int, payload: Tuple[int, ...], packet: bytes = None
+    ) -> ComResult:
         """Simulates executing an instruction on a UOS endpoint.
 
         Should check weather the last instruction was valid and store
         it. This will allow read response to provide more realistic
-        responses.
+        responses. The pre-built packet is not used by the stub.
         """
-        for function in UOS_SCHEMA:
-            for vol in UOS_SCHEMA[function].address_lut:
-                if UOS_SCHEMA[function].address_lut[
-                    vol
-                ] == address and self.__check_required_args(
-                    payload, UOS_SCHEMA[function]
-                ):
-                    if UOS_SCHEMA[function].ack:
-                        self.__packet_buffer.append(
-                            self.get_npc_packet(0, address, tuple([0]))
-                        )
-                    for rx_packet in UOS_SCHEMA[function].rx_packets_expected:
-                        self.__packet_buffer.append(
-                            self.get_npc_packet(
-                                0, address, tuple(0 for _ in range(rx_packet))
-                            )
-                        )
-                    return ComResult(True)
+        for function, frames in SCHEMA_INDEX.get(address, ()):
+            if self.__check_required_args(payload, function):
+                self.__packet_buffer.extend(frames)
+                return ComResult(True)
         return ComResult(False)
 
     def read_response(self, expect_packets: int, timeout_s: float) -> ComResult:
@@ -52,12 +71,19 @@ class NPCStub(UOSInterface):
         """
         result = ComResult(False)
         if len(self.__packet_buffer) > 0:
-            result.ack_packet = self.__packet_buffer.pop(0)
+            result.ack_packet = self.__packet_buffer.popleft()
             result.status = True
-        for _ in self.__packet_buffer:
-            result.rx_packets.append(self.__packet_buffer.pop(0))
+            result.rx_packets = [
+                self.__packet_buffer.popleft()
+                for _ in range(min(expect_packets - 1, len(self.__packet_buffer)))
+            ]
         return result
 
+    def reset_input(self) -> bool:
+        """Over-riding base prototype, discards unread responses."""
+        self.__packet_buffer.clear()
+        return self.__open
+
     def hard_reset(self) -> ComResult:
         """Over-riding base prototype, simulates reset."""
         return ComResult(status=True)
@@ -74,6 +100,10 @@ class NPCStub(UOSInterface):
         self.__open = False
         return self.errored == 0
 
+    def check_open(self) -> bool:
+        """Over-riding base prototype, simulates checking connection state."""
+        return self.__open
+
     @staticmethod
     def enumerate_devices() -> []:
         """Returns a list of test stubs implemented in the interface."""
@@ -94,3 +124,44 @@ class NPCStub(UOSInterface):
                 if argument is not None and argument != payload[i]:
                     return False
         return True
+
+
+class AsyncNPCStub(AsyncUOSInterface):
+    """Class can be used as a low level asyncio test endpoint.
+
+    :ivar __stub: The synchronous stub simulating the endpoint.
+    """
+
+    def __init__(self, connection: str, errored: int = 0):
+        """Instantiate an instance of the asyncio test stub."""
+        self.__stub = NPCStub(connection=connection, errored=errored)
+
+    async def execute_instruction(
+        self, address: int, payload: Tuple[int, ...], packet: bytes = None
+    ) -> ComResult:
+        """Simulates executing an instruction on a UOS endpoint."""
+        return self.__stub.execute_instruction(address, payload, packet)
+
+    async def read_response(self, expect_packets: int, timeout_s: float) -> ComResult:
+        """Simulates gathering the response from an instruction."""
+        return self.__stub.read_response(expect_packets, timeout_s)
+
+    async def reset_input(self) -> bool:
+        """Over-riding base prototype, discards unread responses."""
+        return self.__stub.reset_input()
+
+    async def hard_reset(self) -> ComResult:
+        """Over-riding base prototype, simulates reset."""
+        return self.__stub.hard_reset()
+
+    async def open(self) -> bool:
+        """Over-riding base prototype, simulates opening a connection."""
+        return self.__stub.open()
+
+    async def close(self) -> bool:
+        """Over-riding base prototype, simulates close a connection."""
+        return self.__stub.close()
+
+    def check_open(self) -> bool:
+        """Over-riding base prototype, simulates checking connection state."""
+        return self.__stub.check_open()
@@ -0,0 +1,97 @@
+"""Module for the typed system information reported by UOS devices."""
+from collections.abc import Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Tuple
+
+from uosinterface.hardware.devices import DEVICES
+from uosinterface.hardware.uosabstractions import ComResult
+from uosinterface.hardware.uosabstractions import Device
+
+
+@dataclass(frozen=True)
+class SystemInfo:
+    """Containing the parsed response of a get_system_info instruction.
+
+    :ivar version: Firmware version as a (major, minor, patch) tuple.
+    :ivar hwid: The hardware identifier reported by the device.
+    :ivar device: Device definition for the hwid, None if not recognised.
+    """
+
+    version: Tuple[int, int, int]
+    hwid: int
+    device: Device = None
+
+    @property
+    def version_string(self) -> str:
+        """The firmware version formatted for display, eg. V1.2.3.
+
+        :return: Version string.
+        """
+        return "V" + ".".join(str(part) for part in self.version)
+
+    @staticmethod
+    def from_result(result: ComResult) -> "SystemInfo":
+        """Parses a successful get_system_info result.
+
+        :param result: ComResult containing the system info response packet.
+        :return: SystemInfo object.
+        """
+        payload = result.get_payload()
+        return SystemInfo(
+            version=tuple(payload[:3]),
+            hwid=payload[3],
+            device=DEVICES.get(f"hwid{payload[3]}"),
+        )
+
+
+class SystemInfoCache:
+    """Memoizes system info per port, for a single connection generation.
+
+    Entries stored against an older generation are ignored, so a change in
+    the ports present on the system invalidates every entry.
+
+    :ivar __entries: Tuples of (generation, SystemInfo) keyed on port.
+    :ivar __lock: Guards the entries.
+    """
+
+    def __init__(self):
+        """Instantiate an empty cache."""
+        self.__entries = {}
+        self.__lock = Lock()
+
+    def get(self, key: Hashable, generation: int) -> SystemInfo:
+        """Looks up the system info stored for a port.
+
+        :param key: Identifies the port, eg. (interface, address).
+        :param generation: The current connection generation.
+        :return: SystemInfo, None if not stored for this generation.
+        """
+        with self.__lock:
+            if key in self.__entries and self.__entries[key][0] == generation:
+                return self.__entries[key][1]
+        return None
+
+    def store(self, key: Hashable, generation: int, system_info: SystemInfo):
+        """Stores the system info read from a port.
+
+        :param key: Identifies the port, eg. (interface, address).
+        :param generation: The connection generation the info was read in.
+        :param system_info: The parsed system info.
+        """
+        with self.__lock:
+            self.__entries[key] = (generation, system_info)
+
+    def invalidate(self, key: Hashable = None):
+        """Discards the system info for a port, or all ports.
+
+        :param key: Identifies the port, None to invalidate every port.
+        """
+        with self.__lock:
+            if key is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(key, None)
+
+
+SYSTEM_INFO_CACHE = SystemInfoCache()
@@ -1,9 +1,16 @@
 """Module defining the base class and static func for interfaces."""
 from abc import ABCMeta
 from abc import abstractmethod
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
 from dataclasses import dataclass
 from dataclasses import field
+from enum import Enum
+from enum import IntFlag
 from functools import lru_cache
+from itertools import product
+from types import MappingProxyType
 from typing import Dict
 from typing import List
 from typing import Tuple
@@ -50,21 +57,132 @@ UOS_SCHEMA = {
     "get_gpio_config": UOSFunction(
         address_lut={0: 251},
         ack=True,
-        rx_packets_expected=[2],
+        rx_packets_expected=[6],  # mode and level at each volatility
         pin_requirements=[],
     ),
 }
 
+ACK_PAYLOAD_LENGTH = 1  # acknowledgement frames carry a single status byte
+
+
+def index_response_lengths() -> dict:
+    """Indexes the payload length of each frame in the response to an instruction.
+
+    Functions sharing an address are told apart by the number of packets
+    they expect. Where that is ambiguous the lengths are not indexed.
+
+    :return: Tuples of payload lengths, ACK first, keyed on (address,
+        expected packets).
+    """
+    index = {}
+    for function in UOS_SCHEMA.values():
+        lengths = tuple(function.rx_packets_expected)
+        if function.ack:
+            lengths = (ACK_PAYLOAD_LENGTH, *lengths)
+        for address in set(function.address_lut.values()):
+            key = (address, len(lengths))
+            index[key] = lengths if index.get(key, lengths) == lengths else None
+    return {key: lengths for key, lengths in index.items() if lengths is not None}
+
+
+# Response frame payload lengths keyed on (address, expected packets).
+RESPONSE_LENGTHS = index_response_lengths()
+
 
-@dataclass
 class ComResult:
-    """Containing the data structure used to capture UOS results."""
+    """Containing the data structure used to capture UOS results.
+
+    Results are created for every instruction, so they are slotted, frames
+    are stored as immutable bytes and aux_data is only allocated when used.
+
+    :ivar status: True if the instruction completed successfully.
+    :ivar exception: Description of the failure, empty on success.
+    :ivar ack_packet: The acknowledgement frame, empty if not received.
+    :ivar rx_packets: Sequence of the response frames received.
+    :ivar aux_data: Dict of additional data, such as the failure class.
+    """
+
+    __slots__ = ("status", "exception", "ack_packet", "rx_packets", "__aux_data")
+
+    def __init__(
+        self,
+        status: bool,
+        exception: str = "",
+        ack_packet: bytes = b"",
+        rx_packets: Sequence[bytes] = (),
+        aux_data: Dict = None,
+    ):
+        """Instantiate a result.
+
+        :param status: True if the instruction completed successfully.
+        :param exception: Description of the failure, empty on success.
+        :param ack_packet: The acknowledgement frame, empty if not received.
+        :param rx_packets: Sequence of the response frames received.
+        :param aux_data: Dict of additional data, allocated on first use if None.
+        """
+        self.status = status
+        self.exception = exception
+        self.ack_packet = ack_packet
+        self.rx_packets = rx_packets
+        self.__aux_data = aux_data
+
+    @property
+    def aux_data(self) -> Dict:
+        """Dict of additional data, such as the failure class."""
+        if self.__aux_data is None:
+            self.__aux_data = {}
+        return self.__aux_data
+
+    @aux_data.setter
+    def aux_data(self, aux_data: Dict):
+        """Replaces the additional data."""
+        self.__aux_data = aux_data
+
+    def get_payload(self, index: int = 0) -> bytes:
+        """Gets the payload of a response frame, without the header or checksum.
+
+        :param index: The index of the frame in rx_packets.
+        :return: The payload bytes, sized by the frame's length field.
+        """
+        packet = self.rx_packets[index]
+        return bytes(packet[4 : 4 + packet[3]])
+
+    def to_dict(self) -> dict:
+        """Converts the result into JSON serializable types.
+
+        :return: Dict of the fields, frames are lists of integers.
+        """
+        return {
+            "status": self.status,
+            "exception": self.exception,
+            "ack_packet": list(self.ack_packet),
+            "rx_packets": [list(packet) for packet in self.rx_packets],
+            "aux_data": dict(self.__aux_data) if self.__aux_data is not None else {},
+        }
+
+    def __eq__(self, other):
+        """Results are equal if all their fields are equal."""
+        if not isinstance(other, ComResult):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        """Over-rides the built in repr with the fields of the result."""
+        return (
+            f"ComResult(status={self.status}, exception={self.exception!r}, "
+            f"ack_packet={self.ack_packet!r}, rx_packets={self.rx_packets!r}, "
+            f"aux_data={self.aux_data!r})"
+        )
+
 
-    status: bool
-    exception: str = ""
-    ack_packet: List = field(default_factory=list)
-    rx_packets: List = field(default_factory=list)
-    aux_data: Dict = field(default_factory=dict)
+class Failure(str, Enum):
+    """Classifies why an instruction failed, stored in ComResult aux_data."""
+
+    NOT_OPEN = "not_open"
+    WRITE = "write"
+    TIMEOUT = "timeout"
+    CHECKSUM = "checksum"
+    PARTIAL_FRAME = "partial_frame"
 
 
 @dataclass
@@ -75,17 +193,23 @@ class InstructionArguments:
     payload: tuple = ()
     expected_rx_packets: int = 1
     check_pin: int = None
+    packet: bytes = None
+    timeout_s: float = None
+    force_read: bool = False
 
 
 class UOSInterface(metaclass=ABCMeta):
     """Base class for low level UOS interfaces classes to inherit."""
 
     @abstractmethod
-    def execute_instruction(self, address: int, payload: Tuple[int, ...]) -> ComResult:
+    def execute_instruction(
+        self, address: int, payload: Tuple[int, ...], packet: bytes = None
+    ) -> ComResult:
         """Abstract method for executing instructions on UOSInterfaces.
 
         :param address: An 8 bit unsigned integer of the UOS subsystem targeted by the instruction.
         :param payload: A tuple containing the uint8 parameters of the UOS instruction.
+        :param packet: The pre-built packet for the instruction, None to build it.
         :returns: ComResult object.
         :raises: UOSUnsupportedError if the interface hasn't been built correctly.
         """
@@ -107,6 +231,40 @@ class UOSInterface(metaclass=ABCMeta):
             f"UOSInterfaces must over-ride {UOSInterface.read_response.__name__} prototype."
         )
 
+    def execute_pipeline(
+        self,
+        instructions: List[Tuple[int, Tuple[int, ...], int, bytes]],
+        timeout_s: float,
+        window: int = 1,
+    ) -> List[ComResult]:
+        """Executes several instructions and reads the response to each.
+
+        The base implementation is stop-and-wait, interfaces that can keep
+        multiple instructions in flight should over-ride this.
+
+        :param instructions: List of (address, payload, expected packets, packet) tuples.
+        :param timeout_s: The maximum time to wait on the response to each instruction.
+        :param window: The maximum number of instructions in flight at once.
+        :return: List of ComResult objects in the order of the instructions.
+        """
+        results = []
+        for address, payload, expect_packets, packet in instructions:
+            result = self.execute_instruction(address, payload, packet)
+            if result.status:
+                result = self.read_response(expect_packets, timeout_s)
+            results.append(result)
+        return results
+
+    def reset_input(self) -> bool:
+        """Discards received data that has not been read, to resync on failure.
+
+        The base implementation has nothing to discard, interfaces that buffer
+        received data should over-ride this.
+
+        :return: Success boolean.
+        """
+        return self.check_open()
+
     @abstractmethod
     def hard_reset(self) -> ComResult:
         """UOS loop reset functionality should be as hard a reset as possible.
@@ -139,6 +297,17 @@ class UOSInterface(metaclass=ABCMeta):
             f"UOSInterfaces must over-ride {UOSInterface.close.__name__} prototype."
         )
 
+    @abstractmethod
+    def check_open(self) -> bool:
+        """Abstract method for checking if a UOSInterface connection is open.
+
+        :return: Boolean, true if open.
+        :raises: UOSUnsupportedError if the interface hasn't been built correctly.
+        """
+        raise UOSUnsupportedError(
+            f"UOSInterfaces must over-ride {UOSInterface.check_open.__name__} prototype."
+        )
+
     @staticmethod
     @abstractmethod
     def enumerate_devices() -> []:
@@ -186,6 +355,232 @@ class UOSInterface(metaclass=ABCMeta):
         return ((lrc ^ 0xFF) + 1) & 0xFF
 
 
+class NPCFrameDecoder:
+    """Incrementally frames NPC packets from chunks of received bytes.
+
+    Frames are yielded once complete, partial frames are held until more
+    bytes are fed. Malformed frames are skipped by jumping to the next start
+    symbol.
+
+    :ivar verify_lrc: Discard frames with an invalid LRC checksum.
+    :ivar dropped_bytes: Count of bytes discarded while searching for a start symbol.
+    :ivar resynced_bytes: Count of bytes discarded from malformed or corrupt frames.
+    :ivar checksum_errors: Count of frames discarded due to an LRC mismatch.
+    :ivar __buffer: Received bytes that have not yet been framed.
+    """
+
+    START_SYMBOL = b">"
+    END_SYMBOL = 0x3C
+
+    def __init__(self, verify_lrc: bool = True):
+        """Instantiate a decoder with an empty buffer.
+
+        :param verify_lrc: Discard frames with an invalid LRC checksum.
+        """
+        self.verify_lrc = verify_lrc
+        self.dropped_bytes = 0
+        self.resynced_bytes = 0
+        self.checksum_errors = 0
+        self.__buffer = bytearray()
+
+    def feed(self, data: bytes):
+        """Appends received bytes to the decode buffer.
+
+        :param data: Bytes like object containing the received data.
+        """
+        self.__buffer += data
+
+    def frames(self, limit: int = None) -> Iterator[bytes]:
+        """Yields the complete frames in the buffer, consuming them.
+
+        :param limit: The maximum number of frames to yield, None for all.
+        :return: Iterator of frames as bytes, including the start and end symbols.
+        """
+        count = 0
+        while limit is None or count < limit:
+            start = self.__buffer.find(self.START_SYMBOL)
+            if start == -1:  # nothing in the buffer is usable
+                self.dropped_bytes += len(self.__buffer)
+                self.__buffer.clear()
+                return
+            if start > 0:  # discard bytes preceding the start symbol
+                self.dropped_bytes += start
+                del self.__buffer[:start]
+            if len(self.__buffer) < 4:  # header not fully received
+                return
+            end = 5 + self.__buffer[3]  # index of the end symbol
+            if end >= len(self.__buffer):  # payload not fully received
+                return
+            if self.__buffer[end] != self.END_SYMBOL:  # malformed, resync
+                self.resynced_bytes += 1
+                del self.__buffer[:1]
+                continue
+            frame = bytes(self.__buffer[: end + 1])
+            del self.__buffer[: end + 1]
+            if (
+                self.verify_lrc
+                and UOSInterface.get_npc_checksum(frame[1:-2]) != frame[-2]
+            ):
+                self.checksum_errors += 1
+                self.resynced_bytes += len(frame)
+                continue
+            count += 1
+            yield frame
+
+    def reset(self):
+        """Discards any buffered bytes."""
+        self.__buffer.clear()
+
+    def pending(self) -> bytes:
+        """Gets the buffered bytes that have not formed a frame.
+
+        :return: Bytes object, a copy of the buffer.
+        """
+        return bytes(self.__buffer)
+
+
+class AsyncUOSInterface(metaclass=ABCMeta):
+    """Base class for asyncio UOS interface classes to inherit.
+
+    Mirrors UOSInterface with awaitable I/O, packets are formed using the
+    UOSInterface static helpers.
+    """
+
+    @abstractmethod
+    async def execute_instruction(
+        self, address: int, payload: Tuple[int, ...], packet: bytes = None
+    ) -> ComResult:
+        """Abstract method for executing instructions on AsyncUOSInterfaces.
+
+        :param address: An 8 bit unsigned integer of the UOS subsystem targeted by the instruction.
+        :param payload: A tuple containing the uint8 parameters of the UOS instruction.
+        :param packet: The pre-built packet for the instruction, None to build it.
+        :returns: ComResult object.
+        :raises: UOSUnsupportedError if the interface hasn't been built correctly.
+        """
+        raise UOSUnsupportedError(
+            "AsyncUOSInterfaces must over-ride "
+            f"{AsyncUOSInterface.execute_instruction.__name__} prototype."
+        )
+
+    @abstractmethod
+    async def read_response(self, expect_packets: int, timeout_s: float) -> ComResult:
+        """Abstract method for reading ACK and Data packets from an
+        AsyncUOSInterface.
+
+        :param expect_packets: How many packets including ACK to expect
+        :param timeout_s: The maximum time this function will wait for data.
+        :return: COM Result object.
+        :raises: UOSUnsupportedError if the interface hasn't been built correctly.
+        """
+        raise UOSUnsupportedError(
+            "AsyncUOSInterfaces must over-ride "
+            f"{AsyncUOSInterface.read_response.__name__} prototype."
+        )
+
+    async def execute_pipeline(
+        self,
+        instructions: List[Tuple[int, Tuple[int, ...], int, bytes]],
+        timeout_s: float,
+        window: int = 1,
+    ) -> List[ComResult]:
+        """Executes several instructions and reads the response to each.
+
+        The base implementation is stop-and-wait.
+
+        :param instructions: List of (address, payload, expected packets, packet) tuples.
+        :param timeout_s: The maximum time to wait on the response to each instruction.
+        :param window: The maximum number of instructions in flight at once.
+        :return: List of ComResult objects in the order of the instructions.
+        """
+        results = []
+        for address, payload, expect_packets, packet in instructions:
+            result = await self.execute_instruction(address, payload, packet)
+            if result.status:
+                result = await self.read_response(expect_packets, timeout_s)
+            results.append(result)
+        return results
+
+    async def reset_input(self) -> bool:
+        """Discards received data that has not been read, to resync on failure.
+
+        :return: Success boolean.
+        """
+        return self.check_open()
+
+    @abstractmethod
+    async def hard_reset(self) -> ComResult:
+        """UOS loop reset functionality should be as hard a reset as possible.
+
+        :return: COM Result object.
+        """
+        raise UOSUnsupportedError(
+            "AsyncUOSInterfaces must over-ride "
+            f"{AsyncUOSInterface.hard_reset.__name__} prototype."
+        )
+
+    @abstractmethod
+    async def open(self) -> bool:
+        """Abstract method for opening a connection to an AsyncUOSInterface.
+
+        :return: Success boolean.
+        :raises: UOSUnsupportedError if the interface hasn't been built correctly.
+        """
+        raise UOSUnsupportedError(
+            f"AsyncUOSInterfaces must over-ride {AsyncUOSInterface.open.__name__} prototype."
+        )
+
+    @abstractmethod
+    async def close(self) -> bool:
+        """Abstract method for closing a connection to an AsyncUOSInterface.
+
+        :return: Success boolean.
+        :raises: UOSUnsupportedError if the interface hasn't been built correctly.
+        """
+        raise UOSUnsupportedError(
+            f"AsyncUOSInterfaces must over-ride {AsyncUOSInterface.close.__name__} prototype."
+        )
+
+    @abstractmethod
+    def check_open(self) -> bool:
+        """Abstract method for checking if the connection is open.
+
+        :return: Boolean, true if open.
+        :raises: UOSUnsupportedError if the interface hasn't been built correctly.
+        """
+        raise UOSUnsupportedError(
+            "AsyncUOSInterfaces must over-ride "
+            f"{AsyncUOSInterface.check_open.__name__} prototype."
+        )
+
+
+class PinCapability(IntFlag):
+    """Bit flags for the features of a pin, named after the Pin fields."""
+
+    NONE = 0
+    GPIO_OUT = 1 << 0
+    GPIO_IN = 1 << 1
+    DAC_OUT = 1 << 2
+    PWM_OUT = 1 << 3
+    ADC_IN = 1 << 4
+    PULL_UP = 1 << 5
+    PULL_DOWN = 1 << 6
+    PC_INT = 1 << 7
+    HW_INT = 1 << 8
+
+    @staticmethod
+    def from_names(names: list) -> "PinCapability":
+        """Combines capabilities named by Pin field, eg. ["gpio_out", "pwm_out"].
+
+        :param names: List of Pin boolean field names.
+        :return: PinCapability with every named flag set.
+        """
+        capabilities = PinCapability.NONE
+        for name in names:
+            capabilities |= PinCapability[name.upper()]
+        return capabilities
+
+
 @dataclass
 class Pin:
     """Defines supported features of the pin."""
@@ -207,10 +602,34 @@ class Pin:
     spi: dict = field(default_factory=dict)
     i2c: dict = field(default_factory=dict)
 
+    @property
+    def capabilities(self) -> PinCapability:
+        """The boolean features of the pin as bit flags.
 
-@dataclass
+        :return: PinCapability with a flag set for each supported feature.
+        """
+        return PinCapability.from_names(
+            [
+                capability.name.lower()
+                for capability in PinCapability
+                if capability and getattr(self, capability.name.lower())
+            ]
+        )
+
+
+@dataclass(frozen=True)
 class Device:
-    """Define an implemented UOS device dictionary."""
+    """Define an implemented UOS device dictionary.
+
+    Definitions are compiled once on creation into read only lookup tables,
+    so validating an instruction doesn't mutate or rebuild shared state.
+
+    :ivar address_table: Function name to volatility to instruction address.
+    :ivar digital_capabilities: PinCapability flags keyed on digital pin index.
+    :ivar analogue_capabilities: PinCapability flags keyed on analogue pin index.
+    :ivar compatible_pins: Function name to the frozenset of suitable pin indices.
+    :ivar packet_table: Pre-built packets keyed on (function name, volatility, payload).
+    """
 
     name: str
     interfaces: list
@@ -218,6 +637,127 @@ class Device:
     digital_pins: dict = field(default_factory=dict)
     analogue_pins: dict = field(default_factory=dict)
     aux_params: dict = field(default_factory=dict)
+    address_table: Mapping = field(default=None, init=False, repr=False, compare=False)
+    digital_capabilities: Mapping = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    analogue_capabilities: Mapping = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    compatible_pins: Mapping = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    packet_table: Mapping = field(default=None, init=False, repr=False, compare=False)
+
+    # Values compiled for instruction arguments other than the pin, eg. level.
+    ARGUMENT_VALUES = (0, 1)
+
+    def __post_init__(self):
+        """Compiles the lookup tables and packets for all valid instructions."""
+        for function_name in self.functions_enabled:
+            if function_name not in UOS_SCHEMA:
+                raise UOSUnsupportedError(
+                    f"UOS function {function_name} doesn't exist."
+                )
+        # frozen instances are initialised through object.__setattr__
+        object.__setattr__(
+            self,
+            "address_table",
+            MappingProxyType(
+                {
+                    function_name: MappingProxyType(
+                        {
+                            volatility: UOS_SCHEMA[function_name].address_lut[
+                                volatility
+                            ]
+                            for volatility, enabled in volatilities.items()
+                            if enabled
+                        }
+                    )
+                    for function_name, volatilities in self.functions_enabled.items()
+                }
+            ),
+        )
+        for name, pins in (
+            ("digital_capabilities", self.digital_pins),
+            ("analogue_capabilities", self.analogue_pins),
+        ):
+            object.__setattr__(
+                self,
+                name,
+                MappingProxyType(
+                    {index: pin.capabilities for index, pin in pins.items()}
+                ),
+            )
+        object.__setattr__(
+            self,
+            "compatible_pins",
+            MappingProxyType(
+                {
+                    function_name: self.__find_compatible_pins(function_name)
+                    for function_name in UOS_SCHEMA
+                }
+            ),
+        )
+        object.__setattr__(
+            self, "packet_table", MappingProxyType(self.__compile_packets())
+        )
+
+    def get_packet(
+        self, function_name: str, volatility: int, payload: Tuple[int, ...]
+    ) -> bytes:
+        """Looks up the ready to send packet for an instruction.
+
+        :param function_name: the string name of the UOS Schema function.
+        :param volatility: The volatility level of the instruction.
+        :param payload: A tuple containing the uint8 parameters of the UOS instruction.
+        :return: NPC packet as a bytes object, built if not in the packet table.
+        """
+        packet = self.packet_table.get((function_name, volatility, payload))
+        if packet is None:
+            packet = UOSInterface.get_npc_packet(
+                to_addr=self.address_table[function_name][volatility],
+                from_addr=0,
+                payload=payload,
+            )
+        return packet
+
+    def __compile_packets(self) -> dict:
+        """Builds packets for every enabled function, volatility and pin.
+
+        :return: Dict of packet bytes keyed on (function name, volatility, payload).
+        """
+        packets = {}
+        for function_name in self.address_table:
+            function = UOS_SCHEMA[function_name]
+            if function.pin_requirements is None:
+                payloads = [()]
+            elif function.required_arguments is None:
+                payloads = [
+                    (pin,) for pin in sorted(self.compatible_pins[function_name])
+                ]
+            else:  # first free argument is the pin, others take argument values
+                free = function.required_arguments.count(None) - 1
+                payloads = []
+                for pin in sorted(self.compatible_pins[function_name]):
+                    for values in product(self.ARGUMENT_VALUES, repeat=free):
+                        values = iter((pin,) + values)
+                        payloads.append(
+                            tuple(
+                                next(values) if argument is None else argument
+                                for argument in function.required_arguments
+                            )
+                        )
+            for volatility, address in self.address_table[function_name].items():
+                if address < 0:  # special actions are not packets
+                    continue
+                for payload in payloads:
+                    packets[
+                        (function_name, volatility, payload)
+                    ] = UOSInterface.get_npc_packet(
+                        to_addr=address, from_addr=0, payload=payload
+                    )
+        return packets
 
     def get_compatible_pins(self, function_name: str) -> {}:
         """Returns a dict of pin objects that are suitable for a function.
@@ -227,12 +767,43 @@ class Device:
         """
         if function_name not in UOS_SCHEMA:
             raise UOSUnsupportedError(f"UOS function {function_name} doesn't exist.")
-        requirements = UOS_SCHEMA[function_name].pin_requirements
-        if requirements is None:  # pins are not relevant to this function
-            return {}
-        pin_dict = self.analogue_pins if "adc_in" in requirements else self.digital_pins
+        pin_dict = (
+            self.analogue_pins
+            if UOS_SCHEMA[function_name].pin_requirements is not None
+            and "adc_in" in UOS_SCHEMA[function_name].pin_requirements
+            else self.digital_pins
+        )
         return {
             pin: pin_dict[pin]
             for pin in pin_dict
-            if all(hasattr(pin_dict[pin], requirement) for requirement in requirements)
+            if pin in self.compatible_pins[function_name]
         }
+
+    def get_pins_with(
+        self, capabilities: PinCapability, analogue: bool = False
+    ) -> frozenset:
+        """Finds every pin that has all of a set of capabilities.
+
+        :param capabilities: PinCapability flags required, eg. GPIO_OUT | PWM_OUT.
+        :param analogue: Search the analogue rather than the digital pins.
+        :return: Frozenset of pin indices.
+        """
+        table = self.analogue_capabilities if analogue else self.digital_capabilities
+        return frozenset(
+            pin
+            for pin, pin_capabilities in table.items()
+            if pin_capabilities & capabilities == capabilities
+        )
+
+    def __find_compatible_pins(self, function_name: str) -> frozenset:
+        """Finds the indices of the pins that are suitable for a function.
+
+        :param function_name: the string name of the UOS Schema function.
+        :return: Frozenset of pin indices.
+        """
+        requirements = UOS_SCHEMA[function_name].pin_requirements
+        if requirements is None:  # pins are not relevant to this function
+            return frozenset()
+        return self.get_pins_with(
+            PinCapability.from_names(requirements), analogue="adc_in" in requirements
+        )
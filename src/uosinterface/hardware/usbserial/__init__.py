@@ -1,20 +1,143 @@
 """Module defining the low level UOSImplementation for serial port devices."""
+import asyncio
 import platform
+from collections import deque
+from logging import DEBUG
 from logging import getLogger as Log
+from os import stat
+from os.path import realpath
+from threading import Lock
+from time import monotonic
 from time import sleep
 from time import time_ns
+from typing import Tuple
 
 import serial
 from serial.serialutil import SerialException
 from serial.tools import list_ports
+from serial.tools.list_ports_common import ListPortInfo
+from uosinterface.hardware.uosabstractions import AsyncUOSInterface
 from uosinterface.hardware.uosabstractions import ComResult
+from uosinterface.hardware.uosabstractions import Failure
+from uosinterface.hardware.uosabstractions import NPCFrameDecoder
+from uosinterface.hardware.uosabstractions import RESPONSE_LENGTHS
 from uosinterface.hardware.uosabstractions import UOSInterface
+from uosinterface.util import SampledTrace
 
 if platform.system() == "Linux":
     import termios  # pylint: disable=E0401
 else:
     pass
 
+LOG = Log(__name__)
+# Samples of the raw bytes sent and received, disabled unless configured.
+BYTE_TRACE = SampledTrace(__name__ + ".trace")
+
+# Read timeout used when waiting on data in low latency mode.
+LOW_LATENCY_TIMEOUT_S = 0.01
+
+
+class PortInventory:
+    """Caches the serial ports present on the system, indexed by device path.
+
+    The cache is refreshed when the TTL expires, or immediately if the
+    device directory is modified by a port being added or removed. Pseudo
+    terminals are not enumerated, but can be found by their full path.
+
+    :ivar ttl_s: Maximum age of the cached ports in seconds.
+    :ivar generation: Incremented whenever the set of ports changes.
+    :ivar __ports: Cached port info objects keyed on device path.
+    :ivar __refreshed: Monotonic time of the last refresh, None if invalid.
+    :ivar __dev_mtime: Modification time of the device directory at last refresh.
+    :ivar __lock: Guards refreshing of the cache.
+    """
+
+    DEVICE_DIRECTORY = "/dev"
+    PSEUDO_TERMINAL_DIRECTORY = "/dev/pts/"
+
+    def __init__(self, ttl_s: float = 5):
+        """Instantiate an empty port inventory.
+
+        :param ttl_s: Maximum age of the cached ports in seconds.
+        """
+        self.ttl_s = ttl_s
+        self.generation = 0
+        self.__ports = {}
+        self.__refreshed = None
+        self.__dev_mtime = None
+        self.__lock = Lock()
+
+    def get_ports(self) -> list:
+        """Gets the serial ports available on the system.
+
+        :return: List of pyserial port info objects.
+        """
+        self.__check_stale()
+        return list(self.__ports.values())
+
+    def find(self, device: str):
+        """Looks up a serial port by its connection string.
+
+        :param device: OS connection string for the serial port.
+        :return: The port device class if it exists, else None.
+        """
+        self.__check_stale()
+        if device in self.__ports:
+            return self.__ports[device]
+        for port_device, port in self.__ports.items():  # partial connection string
+            if device in port_device:
+                return port
+        if self.is_pseudo_terminal(device):
+            return ListPortInfo(device, skip_link_detection=True)
+        return None
+
+    @staticmethod
+    def is_pseudo_terminal(device: str) -> bool:
+        """Checks if a connection string is the path of an existing pseudo terminal.
+
+        :param device: OS connection string for the serial port.
+        :return: Boolean, true if the device is a pseudo terminal slave.
+        """
+        try:
+            return realpath(device).startswith(
+                PortInventory.PSEUDO_TERMINAL_DIRECTORY
+            ) and bool(stat(device))
+        except OSError:  # does not exist
+            return False
+
+    def invalidate(self):
+        """Forces the ports to be enumerated on next lookup."""
+        self.__refreshed = None
+
+    def __check_stale(self):
+        """Refreshes the cached ports if expired or the devices changed."""
+        dev_mtime = self.__get_dev_mtime()
+        if (
+            self.__refreshed is not None
+            and monotonic() - self.__refreshed < self.ttl_s
+            and dev_mtime == self.__dev_mtime
+        ):
+            return
+        with self.__lock:
+            ports = {port.device: port for port in list_ports.comports()}
+            if ports.keys() != self.__ports.keys():
+                self.generation += 1
+                LOG.debug("Serial ports changed %s", list(ports))
+            self.__ports = ports
+            self.__dev_mtime = dev_mtime
+            self.__refreshed = monotonic()
+
+    @staticmethod
+    def __get_dev_mtime():
+        """Modification time of the device directory, None if not supported."""
+        try:
+            return stat(PortInventory.DEVICE_DIRECTORY).st_mtime_ns
+        except OSError:  # Windows or no device directory
+            return None
+
+
+PORT_INVENTORY = PortInventory()
+
 
 class NPCSerialPort(UOSInterface):
     """Low level pyserial class that handles reading / writing to the serial
@@ -23,7 +146,11 @@ class NPCSerialPort(UOSInterface):
     :ivar _device: Holds the pyserial device once opened. None if not opened.
     :ivar _connection: Holds the standard connection string 'Interface'|'OS Connection String.
     :ivar _port: Holds the port class, none type if device not instantiated.
-    :ivar _kwargs: Additional keyword arguments as defined in the documentation.
+    :ivar _kwargs: Additional keyword arguments as defined in the documentation,
+        set low_latency to wait on incoming data rather than polling every 50ms.
+    :ivar _decoder: Frames packets from the bytes read from the device.
+    :ivar _pseudo_terminal: True if connected to a pseudo terminal, which has
+        no modem lines and shares its output buffer with the peer's input.
     """
 
     _device = None
@@ -31,6 +158,8 @@ class NPCSerialPort(UOSInterface):
     _connection = ""
     _port = None
     _kwargs = {}
+    _decoder = None
+    _pseudo_terminal = False
 
     def __init__(self, connection: str, **kwargs):
         """Constructor for a NPCSerialPort device.
@@ -40,10 +169,12 @@ class NPCSerialPort(UOSInterface):
         self._connection = connection
         self._port = self.check_port_exists(connection)
         self._kwargs = kwargs
+        self._decoder = NPCFrameDecoder()
+        self._pseudo_terminal = PortInventory.is_pseudo_terminal(connection)
         if self._port is None:
-            Log(__name__).error("%s port does not exist", connection)
+            LOG.error("%s port does not exist", connection)
         else:
-            Log(__name__).debug("%s located", self._port)
+            LOG.debug("%s located", self._port)
 
     def open(self):
         """Opens a connection to the the port and creates the device object.
@@ -53,16 +184,16 @@ class NPCSerialPort(UOSInterface):
         try:
             self._port = self.check_port_exists(self._connection)
             if self._port is None:
-                Log(__name__).error(
-                    "%s device was not present to open", self._connection
-                )
+                LOG.error("%s device was not present to open", self._connection)
                 return False
             self._device = serial.Serial()
             self._device.port = self._connection
             if "baudrate" in self._kwargs:
                 self._device.baudrate = self._kwargs["baudrate"]
+            if self.is_low_latency():  # reads block until data or timeout
+                self._device.timeout = LOW_LATENCY_TIMEOUT_S
             if platform.system() == "Linux":  # DTR transient workaround for Unix
-                Log(__name__).debug("Linux platform found so using DTR workaround")
+                LOG.debug("Linux platform found so using DTR workaround")
                 with open(self._connection) as port:
                     attrs = termios.tcgetattr(port)
                     attrs[2] = attrs[2] & ~termios.HUPCL
@@ -70,10 +201,13 @@ class NPCSerialPort(UOSInterface):
             else:  # DTR transient workaround for Windows
                 self._device.dtr = False
             self._device.open()
-            Log(__name__).debug("%s opened successfully", self._port.device)
+            self._decoder.reset()  # nothing buffered belongs to this connection
+            if self.is_low_latency() and platform.system() == "Linux":
+                self.__set_low_latency_flag()
+            LOG.debug("%s opened successfully", self._port.device)
             return True
         except (SerialException, FileNotFoundError) as exception:
-            Log(__name__).error(
+            LOG.error(
                 "Opening %s threw error %s",
                 self._port.device if self._port is not None else "None",
                 exception.__str__(),
@@ -81,7 +215,7 @@ class NPCSerialPort(UOSInterface):
             if (
                 exception.errno == 13
             ):  # permission denied another connection open to this device.
-                Log(__name__).error(
+                LOG.error(
                     "Cannot open connection, account has insufficient permissions."
                 )
             self._device = None
@@ -97,35 +231,49 @@ class NPCSerialPort(UOSInterface):
         try:
             self._device.close()
         except SerialException as exception:
-            Log(__name__).debug(
-                "Closing the connection threw error %s", exception.__str__()
-            )
+            LOG.debug("Closing the connection threw error %s", exception.__str__())
             self._device = None
             return False
-        Log(__name__).debug("Connection closed successfully")
+        LOG.debug("Connection closed successfully")
         self._device = None
         return True
 
-    def execute_instruction(self, address, payload):
+    def execute_instruction(self, address, payload, packet: bytes = None):
         """Builds and executes a new packet.
 
         :param address: An 8 bit unsigned integer of the UOS subsystem targeted by the instruction.
         :param payload: A tuple containing the uint8 parameters of the UOS instruction.
+        :param packet: The pre-built packet for the instruction, None to build it.
         :return: Tuple containing a status boolean and index 0 and a result-set dict at index 1.
         """
         if not self.check_open():
-            return ComResult(False, exception="Connection must be opened first.")
-        packet = self.get_npc_packet(to_addr=address, from_addr=0, payload=payload)
-        Log(__name__).debug("packet formed %s", packet)
+            return ComResult(
+                False,
+                exception="Connection must be opened first.",
+                aux_data={"failure": Failure.NOT_OPEN},
+            )
+        if packet is None:
+            packet = self.get_npc_packet(to_addr=address, from_addr=0, payload=payload)
         try:  # Send the packet.
             num_bytes = self._device.write(packet)
             self._device.flush()
-            Log(__name__).debug("Sent %s bytes of data", num_bytes)
+            BYTE_TRACE.trace("tx %s: %s", packet)
+            if LOG.isEnabledFor(DEBUG):
+                LOG.debug("Sent %s bytes of data %s", num_bytes, packet)
         except serial.SerialException as exception:
-            return ComResult(False, exception=str(exception))
+            return ComResult(
+                False, exception=str(exception), aux_data={"failure": Failure.WRITE}
+            )
         finally:
-            self._device.reset_output_buffer()
-        return ComResult(num_bytes == len(packet))
+            if not self._pseudo_terminal:  # would discard data the peer hasn't read
+                self._device.reset_output_buffer()
+        if num_bytes != len(packet):
+            return ComResult(
+                False,
+                exception=f"Only {num_bytes} of {len(packet)} bytes were written.",
+                aux_data={"failure": Failure.WRITE},
+            )
+        return ComResult(True)
 
     def read_response(self, expect_packets: int, timeout_s: float):
         """Reads ACK and response packets from the serial device.
@@ -136,44 +284,193 @@ class NPCSerialPort(UOSInterface):
         """
         response_object = ComResult(False)
         if not self.check_open():
+            response_object.exception = "Connection must be opened first."
+            response_object.aux_data["failure"] = Failure.NOT_OPEN
             return response_object
         start_ns = time_ns()
-        packet = []
-        byte_index = -1  # tracks the byte position index of the current packet
-        packet_index = 0  # tracks the packet number being received 0 = ACK
+        low_latency = self.is_low_latency()
+        checksum_errors = self._decoder.checksum_errors
+        # frames may have been decoded from bytes read with an earlier response
+        packets = list(self._decoder.frames(expect_packets))
         try:
             while (
-                timeout_s * 1000000000
-            ) > time_ns() - start_ns and byte_index > -2:  # read until packet or timeout
-                num_bytes = self._device.in_waiting
-                for _ in range(num_bytes):
-                    byte_in = self._device.read(1)
-                    byte_index, packet = self.decode_and_capture(
-                        byte_index, byte_in, packet
-                    )
-                    if byte_index == -2:
-                        if packet_index == 0:
-                            response_object.ack_packet = packet
-                        else:
-                            response_object.rx_packets.append(packet)
-                        packet_index += 1
-                        if expect_packets == packet_index:
-                            break
-                        byte_index = -1
-                        packet = []
-                    byte_index += 1
-                sleep(0.05)  # Don't churn CPU cycles waiting for data
-            Log(__name__).debug("Packet received %s", packet)
-            if expect_packets != packet_index or len(packet) < 6 or byte_index != -2:
-                response_object.rx_packets.append(packet)
-                response_object.exception = "did not receive all the expected data"
+                len(packets) < expect_packets
+                and (timeout_s * 1000000000) > time_ns() - start_ns
+            ):  # read until packets or timeout
+                if self.__receive(low_latency):
+                    packets.extend(self._decoder.frames(expect_packets - len(packets)))
+                    if len(packets) == expect_packets:
+                        break
+                if not low_latency:
+                    sleep(0.05)  # Don't churn CPU cycles waiting for data
+            if LOG.isEnabledFor(DEBUG):
+                LOG.debug("Packets received %s", packets)
+            if len(packets) > 0:
+                response_object.ack_packet = packets[0]
+                response_object.rx_packets = packets[1:]
+            if expect_packets != len(packets):
+                response_object.rx_packets = [
+                    *response_object.rx_packets,
+                    self._decoder.pending(),
+                ]
+                (
+                    response_object.exception,
+                    response_object.aux_data["failure"],
+                ) = self.classify_shortfall(self._decoder, packets, checksum_errors)
                 return response_object
             response_object.status = True
             return response_object
         except serial.SerialException as exception:
             response_object.exception = str(exception)
+            response_object.aux_data["failure"] = Failure.NOT_OPEN
             return response_object
 
+    @staticmethod
+    def classify_shortfall(
+        decoder: NPCFrameDecoder, packets: list, checksum_errors: int
+    ) -> Tuple[str, Failure]:
+        """Describes why fewer packets than expected were received.
+
+        :param decoder: The decoder the packets were framed by.
+        :param packets: The packets that were received.
+        :param checksum_errors: The decoder checksum error count before reading.
+        :return: Tuple of the exception description and failure class.
+        """
+        if decoder.checksum_errors > checksum_errors:
+            return "checksum mismatch on received data", Failure.CHECKSUM
+        if len(packets) > 0 or len(decoder.pending()) > 0:
+            return "did not receive all the expected data", Failure.PARTIAL_FRAME
+        return "did not receive all the expected data", Failure.TIMEOUT
+
+    def execute_pipeline(self, instructions, timeout_s: float, window: int = 1):
+        """Keeps a window of instructions in flight and correlates responses.
+
+        Responses are matched to the oldest in flight instruction sent to the
+        address the response is from. If a response arrives for a later
+        instruction the earlier ones are failed as lost and reception resyncs,
+        as they are if a frame's payload length doesn't fit the schema.
+
+        :param instructions: List of (address, payload, expected packets, packet) tuples.
+        :param timeout_s: The maximum time to wait on the response to each instruction.
+        :param window: The maximum number of instructions in flight at once.
+        :return: List of ComResult objects in the order of the instructions.
+        """
+        results = [ComResult(False) for _ in instructions]
+        if not self.check_open():
+            for result in results:
+                result.exception = "Connection must be opened first."
+                result.aux_data["failure"] = Failure.NOT_OPEN
+            return results
+        low_latency = self.is_low_latency()
+        in_flight = deque()  # [index, time became oldest, packets received]
+        next_index = 0
+        try:
+            while next_index < len(instructions) or len(in_flight) > 0:
+                if next_index < len(instructions) and len(in_flight) < window:
+                    while next_index < len(instructions) and len(in_flight) < window:
+                        address, payload, _, packet = instructions[next_index]
+                        if packet is None:
+                            packet = self.get_npc_packet(
+                                to_addr=address, from_addr=0, payload=payload
+                            )
+                        self._device.write(packet)
+                        BYTE_TRACE.trace("tx %s: %s", packet)
+                        in_flight.append([next_index, time_ns(), []])
+                        next_index += 1
+                    self._device.flush()
+                received = self.__receive(low_latency)
+                for frame in self._decoder.frames():  # including earlier reads
+                    self.__correlate(frame, instructions, in_flight, results)
+                if not received and not low_latency:
+                    sleep(0.05)  # Don't churn CPU cycles waiting for data
+                if (
+                    len(in_flight) > 0
+                    and time_ns() - in_flight[0][1] > timeout_s * 1000000000
+                ):
+                    self.__retire(in_flight, results, "timed out waiting on response")
+        except serial.SerialException as exception:
+            for result in results[in_flight[0][0] if in_flight else next_index :]:
+                result.exception = str(exception)
+                result.aux_data["failure"] = Failure.NOT_OPEN
+        return results
+
+    @staticmethod
+    def __correlate(packet: bytes, instructions, in_flight: deque, results: list):
+        """Assigns a received packet to the in flight instruction it answers.
+
+        A packet is only accepted if its payload length matches the ACK or
+        data frame expected next, so a lost frame can't be replaced by the
+        response to a later instruction sent to the same address.
+
+        :param packet: The received packet, from address is at index 2.
+        :param instructions: List of (address, payload, expected packets, packet) tuples.
+        :param in_flight: Deque of in flight instruction state, oldest first.
+        :param results: List of ComResult objects to complete.
+        """
+        while any(instructions[entry[0]][0] == packet[2] for entry in in_flight):
+            address, _, expect_packets, _ = instructions[in_flight[0][0]]
+            if address != packet[2]:  # resync
+                NPCSerialPort.__retire(in_flight, results, "response lost, resynced")
+                continue
+            lengths = RESPONSE_LENGTHS.get((address, expect_packets))
+            if lengths is not None and packet[3] != lengths[len(in_flight[0][2])]:
+                NPCSerialPort.__retire(
+                    in_flight,
+                    results,
+                    "unexpected frame, resynced",
+                    Failure.PARTIAL_FRAME,
+                )
+                continue
+            in_flight[0][2].append(packet)
+            if len(in_flight[0][2]) == expect_packets:
+                NPCSerialPort.__retire(in_flight, results)
+            return
+        if LOG.isEnabledFor(DEBUG):
+            LOG.debug("Discarding unsolicited packet %s", packet)
+
+    @staticmethod
+    def __retire(
+        in_flight: deque,
+        results: list,
+        exception: str = None,
+        failure: Failure = None,
+    ):
+        """Completes the oldest in flight instruction and starts the next timeout.
+
+        :param in_flight: Deque of in flight instruction state, oldest first.
+        :param results: List of ComResult objects to complete.
+        :param exception: Description of the failure, None if successful.
+        :param failure: Failure class, by default a partial frame if any packets
+            were received else a timeout.
+        """
+        index, _, packets = in_flight.popleft()
+        results[index].status = exception is None
+        results[index].exception = exception if exception is not None else ""
+        if exception is not None:  # lost responses will not arrive, as a timeout
+            if failure is None:
+                failure = Failure.PARTIAL_FRAME if len(packets) > 0 else Failure.TIMEOUT
+            results[index].aux_data["failure"] = failure
+        if len(packets) > 0:
+            results[index].ack_packet = packets[0]
+            results[index].rx_packets = packets[1:]
+        if len(in_flight) > 0:
+            in_flight[0][1] = max(in_flight[0][1], time_ns())
+
+    def reset_input(self) -> bool:
+        """Discards buffered data received from the device but not yet read.
+
+        :return: Success boolean.
+        """
+        self._decoder.reset()
+        if not self.check_open():
+            return False
+        try:
+            self._device.reset_input_buffer()
+        except serial.SerialException as exception:
+            LOG.error("Failed to reset input buffer %s", exception)
+            return False
+        return True
+
     def hard_reset(self):
         """Manually drives the DTR line low to reset the device.
 
@@ -181,12 +478,50 @@ class NPCSerialPort(UOSInterface):
         """
         if not self.check_open():
             return ComResult(False, exception="Connection must be open first.")
-        Log(__name__).debug("Resetting the device using the DTR line")
+        if self._pseudo_terminal:
+            return ComResult(
+                False, exception="Pseudo terminals do not have a DTR line."
+            )
+        LOG.debug("Resetting the device using the DTR line")
         self._device.dtr = not self._device.dtr
         sleep(0.2)
         self._device.dtr = not self._device.dtr
         return ComResult(True)
 
+    def __receive(self, low_latency: bool) -> bool:
+        """Appends the bytes available on the device to the receive buffer.
+
+        :param low_latency: Block until data arrives or the read times out.
+        :return: True if any bytes were received.
+        """
+        num_bytes = self._device.in_waiting
+        if num_bytes > 0 or low_latency:  # everything available in one read
+            data = self._device.read(max(num_bytes, 1))
+            BYTE_TRACE.trace("rx %s: %s", data)
+            self._decoder.feed(data)
+            return len(data) > 0
+        return False
+
+    def is_low_latency(self) -> bool:
+        """Checks if the port waits on data instead of polling the buffer.
+
+        :return: Boolean, true if low latency mode was requested.
+        """
+        return "low_latency" in self._kwargs and self._kwargs["low_latency"]
+
+    def __set_low_latency_flag(self):
+        """Sets the ASYNC_LOW_LATENCY flag on the port driver where possible."""
+        try:
+            self._device.set_low_latency_mode(True)
+            LOG.debug("%s low latency flag set", self._connection)
+        except (ValueError, AttributeError) as exception:
+            # Not all drivers support the flag, the blocking read still applies.
+            LOG.debug(
+                "Could not set low latency flag on %s, %s",
+                self._connection,
+                exception.__str__(),
+            )
+
     def check_open(self) -> bool:
         """Tests if the connection is open by validating an open device.
 
@@ -206,41 +541,10 @@ class NPCSerialPort(UOSInterface):
             f"_device={self._device})>"
         )
 
-    @staticmethod
-    def decode_and_capture(
-        byte_index: int, byte_in: bytes, packet: list
-    ) -> (int, list):
-        """Parser takes in a byte and vets it against UOS packet.
-
-        :param byte_index: The index of the last 'valid' byte found.
-        :param byte_in: The current byte for inspection.
-        :param packet: The current packet of validated bytes.
-        :return: Tuple containing the updated byte index and updated packet.
-        """
-        if byte_index == -1:  # start symbol
-            if byte_in == b">":
-                byte_index += 1
-        if byte_index >= 0:
-            Log(__name__).debug(
-                "read %s byte index = %s",
-                byte_in,
-                byte_index,
-            )
-            payload_len = packet[3] if len(packet) > 3 else 0
-            if byte_index == 3 + 2 + payload_len:  # End packet symbol
-                if byte_in == b"<":
-                    byte_index = -2  # packet complete
-                    Log(__name__).debug("Found end packet symbol")
-                else:  # Errored data
-                    byte_index = -1
-                    packet = []
-            packet.append(int.from_bytes(byte_in, byteorder="little"))
-        return byte_index, packet
-
     @staticmethod
     def enumerate_devices():
         """Get the available ports on the system."""
-        return [NPCSerialPort(port.device) for port in list_ports.comports()]
+        return [NPCSerialPort(port.device) for port in PORT_INVENTORY.get_ports()]
 
     @staticmethod
     def check_port_exists(device: str):
@@ -249,8 +553,190 @@ class NPCSerialPort(UOSInterface):
         :param device: OS connection string for the serial port.
         :return: The port device class if it exists, else None.
         """
-        ports = list_ports.comports()
-        for port in ports:
-            if device in port.device:
-                return port
-        return None
+        return PORT_INVENTORY.find(device)
+
+
+class AsyncNPCSerialPort(AsyncUOSInterface):
+    """Asyncio serial port class that waits on data using the event loop.
+
+    Where the event loop can watch the port's file descriptor reads are
+    driven by readiness, otherwise the port is polled without blocking the loop.
+
+    :ivar __serial: NPCSerialPort used to configure and access the port.
+    :ivar __decoder: Frames packets from the bytes read from the device.
+    """
+
+    # pylint: disable=protected-access
+    # The pyserial device is shared with the wrapped NPCSerialPort.
+
+    def __init__(self, connection: str, **kwargs):
+        """Constructor for an AsyncNPCSerialPort device.
+
+        :param connection: OS connection string for the serial port.
+        """
+        self.__serial = NPCSerialPort(connection, **kwargs)
+        self.__decoder = NPCFrameDecoder()
+
+    async def open(self) -> bool:
+        """Opens a connection to the port in an executor.
+
+        :return: Success boolean.
+        """
+        self.__decoder.reset()  # nothing buffered belongs to this connection
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.__serial.open
+        )
+
+    async def close(self) -> bool:
+        """Closes the connection to the port in an executor.
+
+        :return: Success boolean.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.__serial.close
+        )
+
+    def check_open(self) -> bool:
+        """Tests if the connection is open by validating an open device.
+
+        :return: Boolean, true if open.
+        """
+        return self.__serial.check_open()
+
+    async def execute_instruction(self, address, payload, packet: bytes = None):
+        """Builds and writes a new packet.
+
+        :param address: An 8 bit unsigned integer of the UOS subsystem targeted by the instruction.
+        :param payload: A tuple containing the uint8 parameters of the UOS instruction.
+        :param packet: The pre-built packet for the instruction, None to build it.
+        :return: ComResult object.
+        """
+        if not self.check_open():
+            return ComResult(
+                False,
+                exception="Connection must be opened first.",
+                aux_data={"failure": Failure.NOT_OPEN},
+            )
+        if packet is None:
+            packet = UOSInterface.get_npc_packet(
+                to_addr=address, from_addr=0, payload=payload
+            )
+        try:
+            num_bytes = self.__serial._device.write(packet)
+            BYTE_TRACE.trace("tx %s: %s", packet)
+        except serial.SerialException as exception:
+            return ComResult(
+                False, exception=str(exception), aux_data={"failure": Failure.WRITE}
+            )
+        if num_bytes != len(packet):
+            return ComResult(
+                False,
+                exception=f"Only {num_bytes} of {len(packet)} bytes were written.",
+                aux_data={"failure": Failure.WRITE},
+            )
+        return ComResult(True)
+
+    async def read_response(self, expect_packets: int, timeout_s: float):
+        """Reads ACK and response packets, yielding to the loop between data.
+
+        :param expect_packets: How many packets including ACK to expect.
+        :param timeout_s: The maximum time this function will wait for data.
+        :return: ComResult object.
+        """
+        response_object = ComResult(False)
+        if not self.check_open():
+            response_object.exception = "Connection must be opened first."
+            response_object.aux_data["failure"] = Failure.NOT_OPEN
+            return response_object
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_s
+        checksum_errors = self.__decoder.checksum_errors
+        # frames may have been decoded from bytes read with an earlier response
+        packets = list(self.__decoder.frames(expect_packets))
+        try:
+            while len(packets) < expect_packets and loop.time() < deadline:
+                num_bytes = self.__serial._device.in_waiting
+                if num_bytes > 0:
+                    data = self.__serial._device.read(num_bytes)
+                    BYTE_TRACE.trace("rx %s: %s", data)
+                    self.__decoder.feed(data)
+                    packets.extend(self.__decoder.frames(expect_packets - len(packets)))
+                else:
+                    await self.__wait_readable(deadline - loop.time())
+        except serial.SerialException as exception:
+            response_object.exception = str(exception)
+            response_object.aux_data["failure"] = Failure.NOT_OPEN
+            return response_object
+        if len(packets) > 0:
+            response_object.ack_packet = packets[0]
+            response_object.rx_packets = packets[1:]
+        if expect_packets != len(packets):
+            response_object.rx_packets = [
+                *response_object.rx_packets,
+                self.__decoder.pending(),
+            ]
+            (
+                response_object.exception,
+                response_object.aux_data["failure"],
+            ) = NPCSerialPort.classify_shortfall(
+                self.__decoder, packets, checksum_errors
+            )
+            return response_object
+        response_object.status = True
+        return response_object
+
+    async def reset_input(self) -> bool:
+        """Discards buffered data received from the device but not yet read.
+
+        :return: Success boolean.
+        """
+        self.__decoder.reset()
+        return self.__serial.reset_input()
+
+    async def hard_reset(self):
+        """Manually drives the DTR line low to reset the device.
+
+        :return: ComResult object.
+        """
+        if not self.check_open():
+            return ComResult(False, exception="Connection must be open first.")
+        if self.__serial._pseudo_terminal:
+            return ComResult(
+                False, exception="Pseudo terminals do not have a DTR line."
+            )
+        LOG.debug("Resetting the device using the DTR line")
+        self.__serial._device.dtr = not self.__serial._device.dtr
+        await asyncio.sleep(0.2)
+        self.__serial._device.dtr = not self.__serial._device.dtr
+        return ComResult(True)
+
+    async def __wait_readable(self, timeout_s: float):
+        """Waits until the port has data to read or the timeout expires.
+
+        :param timeout_s: The maximum time to wait.
+        """
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        try:
+            file_descriptor = self.__serial._device.fileno()
+            loop.add_reader(
+                file_descriptor,
+                lambda: readable.done() or readable.set_result(True),
+            )
+        except (AttributeError, OSError, NotImplementedError):
+            # No descriptor or loop support to watch, poll without blocking.
+            await asyncio.sleep(min(timeout_s, LOW_LATENCY_TIMEOUT_S))
+            return
+        try:
+            await asyncio.wait_for(readable, max(timeout_s, 0))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(file_descriptor)
+
+    def __repr__(self):
+        """Over-rides the built in repr with something useful.
+
+        :return: String containing the wrapped serial port.
+        """
+        return f"<AsyncNPCSerialPort(__serial={self.__serial})>"
@@ -0,0 +1,136 @@
+"""Module defining per-port worker threads that own an interface."""
+from concurrent.futures import Future
+from logging import getLogger as Log
+from queue import Empty
+from queue import SimpleQueue
+from threading import Lock
+from threading import Thread
+from typing import Callable
+from typing import Tuple
+
+from uosinterface.hardware.devices import Interface
+from uosinterface.hardware.uosabstractions import UOSInterface
+
+LOG = Log(__name__)
+
+
+class PortWorker:
+    """Executes requests on an interface from a single dedicated thread.
+
+    Requests are queued and run in the order they were submitted, so
+    transactions from concurrent callers can't interleave on the port. The
+    interface is closed by the worker after being idle.
+
+    :ivar interface: The interface owned by the worker thread.
+    :ivar idle_timeout_s: The interface is closed after being idle for this long.
+    :ivar __queue: Thread safe queue of (future, request) tuples, None stops the worker.
+    :ivar __thread: The thread executing requests.
+    """
+
+    def __init__(self, interface: UOSInterface, idle_timeout_s: float = 60):
+        """Instantiate a worker and start its thread.
+
+        :param interface: The interface the worker will own.
+        :param idle_timeout_s: The interface is closed after being idle for this long.
+        """
+        self.interface = interface
+        self.idle_timeout_s = idle_timeout_s
+        self.__queue = SimpleQueue()
+        self.__thread = Thread(
+            target=self.__run, name=f"PortWorker({interface})", daemon=True
+        )
+        self.__thread.start()
+
+    def submit(self, request: Callable[[UOSInterface], object]) -> Future:
+        """Queues a request to be run on the worker thread.
+
+        :param request: Callable taking the interface, its return is the future's result.
+        :return: Future that completes when the request has run.
+        """
+        future = Future()
+        self.__queue.put((future, request))
+        return future
+
+    def stop(self):
+        """Runs the requests already queued, then closes the interface and stops."""
+        if self.__thread.is_alive():
+            self.__queue.put(None)
+            self.__thread.join()
+
+    def is_alive(self) -> bool:
+        """Checks if the worker thread is running.
+
+        :return: Boolean, true if requests can be submitted.
+        """
+        return self.__thread.is_alive()
+
+    def __run(self):
+        """Worker thread loop, executes requests until stopped."""
+        while True:
+            try:
+                item = self.__queue.get(timeout=self.idle_timeout_s)
+            except Empty:  # idle, release the port until the next request
+                if self.interface.check_open():
+                    LOG.debug("Closing idle worker interface %s", self.interface)
+                    self.interface.close()
+                continue
+            if item is None:
+                break
+            future, request = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(request(self.interface))
+            except BaseException as exception:  # pylint: disable=broad-except
+                future.set_exception(exception)
+        if self.interface.check_open():
+            self.interface.close()
+
+
+class PortWorkerRegistry:
+    """Keeps a single worker per port, keyed on (interface, address).
+
+    :ivar idle_timeout_s: Idle timeout passed to new workers.
+    :ivar __workers: PortWorker objects keyed on (interface, address).
+    :ivar __lock: Guards creation of workers.
+    """
+
+    def __init__(self, idle_timeout_s: float = 60):
+        """Instantiate an empty registry.
+
+        :param idle_timeout_s: Idle timeout passed to new workers.
+        """
+        self.idle_timeout_s = idle_timeout_s
+        self.__workers = {}
+        self.__lock = Lock()
+
+    def get_worker(
+        self,
+        key: Tuple[Interface, str],
+        factory: Callable[[], UOSInterface],
+    ) -> PortWorker:
+        """Looks up the worker for a port, starting one if required.
+
+        :param key: Tuple of the interface type and address of the device.
+        :param factory: Callable used to instantiate the interface for a new worker.
+        :return: The running PortWorker for the port.
+        """
+        with self.__lock:
+            if key not in self.__workers or not self.__workers[key].is_alive():
+                self.__workers[key] = PortWorker(factory(), self.idle_timeout_s)
+                LOG.debug("Started port worker %s", key)
+            return self.__workers[key]
+
+    def stop_all(self):
+        """Stops every worker, closing their interfaces."""
+        with self.__lock:
+            for worker in self.__workers.values():
+                worker.stop()
+            self.__workers.clear()
+
+    def __len__(self):
+        """Number of workers in the registry."""
+        return len(self.__workers)
+
+
+PORT_WORKERS = PortWorkerRegistry()
@@ -1,12 +1,25 @@
 """General utility functions for all packages in UOSInterfaces."""
+import atexit
+from logging import DEBUG
 from logging import FileHandler
 from logging import Formatter
 from logging import getLogger
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from pathlib import Path
+from queue import SimpleQueue
+
+# Active queue listeners keyed on logger name, stopped at exit to flush records.
+LOG_LISTENERS = {}
 
 
 def configure_logs(name: str, level: int, base_path: Path):
-    """Per-package logs must be manually configured to prefix correctly."""
+    """Per-package logs must be manually configured to prefix correctly.
+
+    Records are passed through a queue to a listener thread, so file writes
+    don't block the thread that is logging. Re-configuring a package replaces
+    its existing pipeline.
+    """
     logger = getLogger(name)
     logger.setLevel(level)
     # Dont capture to console as custom messages only, root logger captures stderr
@@ -18,4 +31,61 @@ def configure_logs(name: str, level: int, base_path: Path):
     file_handler.setFormatter(
         Formatter("%(asctime)s : %(levelname)s : %(name)s : %(message)s")
     )
-    logger.addHandler(file_handler)
+    stop_logs(name)
+    log_queue = SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    logger.addHandler(queue_handler)
+    LOG_LISTENERS[name] = (listener, queue_handler)
+
+
+def stop_logs(name: str = None):
+    """Flushes and stops the queued log pipelines created by configure_logs.
+
+    :param name: The package logger to stop, None stops all of them.
+    """
+    for key in [name] if name is not None else list(LOG_LISTENERS):
+        if key in LOG_LISTENERS:
+            listener, queue_handler = LOG_LISTENERS.pop(key)
+            getLogger(key).removeHandler(queue_handler)
+            listener.stop()  # processes any records remaining in the queue
+            for handler in listener.handlers:
+                handler.close()
+
+
+atexit.register(stop_logs)
+
+
+class SampledTrace:
+    """Logs a sample of raw data transfers without stalling the I/O path.
+
+    Disabled by default, when enabled only every nth transfer is formatted
+    and logged at debug level.
+
+    :ivar logger: The logger the trace is written to.
+    :ivar sample_every: Log one in this many transfers, 0 disables tracing.
+    :ivar __count: Number of transfers seen since tracing was enabled.
+    """
+
+    def __init__(self, name: str, sample_every: int = 0):
+        """Instantiate a trace writing to the named logger.
+
+        :param name: Name of the logger the trace is written to.
+        :param sample_every: Log one in this many transfers, 0 disables tracing.
+        """
+        self.logger = getLogger(name)
+        self.sample_every = sample_every
+        self.__count = 0
+
+    def trace(self, message: str, data: bytes):
+        """Logs the data if this transfer is sampled.
+
+        :param message: Log format string taking the transfer count and data as hex.
+        :param data: Bytes like object containing the transferred data.
+        """
+        if self.sample_every <= 0:
+            return
+        self.__count += 1
+        if self.__count % self.sample_every == 0 and self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(message, self.__count, bytes(data).hex(" "))
@@ -13,6 +13,7 @@ from sqlalchemy.orm import scoped_session
 from uosinterface import UOSDatabaseError
 from uosinterface.util import configure_logs
 from uosinterface.webapp.api import routing as api_routing
+from uosinterface.webapp.api.util import UOSJSONEncoder
 from uosinterface.webapp.auth import default_user
 from uosinterface.webapp.auth import PrivilegeNames
 from uosinterface.webapp.auth import routing as auth_routing
@@ -119,18 +120,26 @@ def register_database(app):
         return None  # no auth
 
 
-def create_app(testing: bool, base_path: Path, static_path: Path):
-    """Creates the flask app and registers all addons."""
+def create_app(testing: bool, base_path: Path, static_path: Path, log_level=DEBUG):
+    """Creates the flask app and registers all addons.
+
+    :param testing: Sets the flask testing config.
+    :param base_path: Directory the logs are written under.
+    :param static_path: Directory of the static files and templates.
+    :param log_level: Level of the web-app logs, use the constants from logging lib.
+    :return: The configured Flask app.
+    """
     app = Flask(
         __name__,
         static_folder=static_path.__str__(),
         template_folder=static_path.joinpath(Path("templates/")).__str__(),
     )
+    app.json_encoder = UOSJSONEncoder
     csrf.init_app(app)
     app.config["TESTING"] = testing
     app.config["SECRET_KEY"] = secrets.token_urlsafe(32)
     register_database(app)
     register_blueprints(app)
-    register_logs(DEBUG, base_path=base_path)
+    register_logs(log_level, base_path=base_path)
     Log(__name__).debug("Static resolved to %s", static_path.__str__())
     return app
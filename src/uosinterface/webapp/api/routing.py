@@ -39,25 +39,26 @@ def route_hardware_function(api_version: str, function: str):
     response, required_args = util.check_required_args(
         possible_args, request.args, add_device=True
     )
-    if response.status:
+    if response.status and arguments.return_annotation is not ComResult:
+        # only instructions are routed, other functions have no result to return
+        response.exception = f"function '{function}' has not been implemented."
+        response.status = False
+    elif response.status:
         device = UOSDevice(
             identity=required_args["identity"].arg_value,
             address=required_args["address"].arg_value,
+            loading="QUEUED",  # serialised on a worker keeping the port warm
         )
-        if function in dir(UOSDevice):
-            instr_response = getattr(device, function)(
-                *[
-                    required_args[parameter.name].arg_value
-                    for parameter in inspect.signature(
-                        getattr(device, function)
-                    ).parameters.values()
-                    if parameter.name in required_args
-                    and required_args[parameter.name].arg_value is not None
-                ]
-            )
-            response.status = instr_response.status
-            response.com_data = instr_response
-        else:  # dunno how to handle that function
-            response.exception = f"function '{function}' has not been implemented."
-            response.status = False
+        instr_response = getattr(device, function)(
+            *[
+                required_args[parameter.name].arg_value
+                for parameter in inspect.signature(
+                    getattr(device, function)
+                ).parameters.values()
+                if parameter.name in required_args
+                and required_args[parameter.name].arg_value is not None
+            ]
+        )
+        response.status = instr_response.status
+        response.com_data = instr_response
     return jsonify(response)
@@ -2,9 +2,26 @@
 from dataclasses import dataclass
 from logging import getLogger as Log
 
+from flask.json import JSONEncoder
 from uosinterface.hardware.uosabstractions import ComResult
 
 
+class UOSJSONEncoder(JSONEncoder):
+    """Extends the flask encoder with UOS results, frames become integer lists."""
+
+    def default(self, o):
+        """Converts objects the standard encoder doesn't support.
+
+        :param o: The object to serialize.
+        :return: JSON serializable representation of the object.
+        """
+        if isinstance(o, ComResult):
+            return o.to_dict()
+        if isinstance(o, (bytes, bytearray)):
+            return list(o)
+        return super().default(o)
+
+
 @dataclass
 class APIargument:
     """API request argument datatype."""
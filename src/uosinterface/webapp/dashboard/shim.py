@@ -2,8 +2,8 @@
 from logging import getLogger
 
 from flask import flash
+from uosinterface import UOSError
 from uosinterface.hardware import UOSDevice
-from uosinterface.hardware.devices import DEVICES
 
 
 def get_system_info(device_identity, device_address: str, **kwargs) -> {}:
@@ -16,21 +16,26 @@ def get_system_info(device_identity, device_address: str, **kwargs) -> {}:
     """
     sys_data = {}
     try:
-        device = UOSDevice(identity=device_identity, address=device_address, **kwargs)
-        result = device.get_system_info()
-        getLogger(__name__).debug("Shim queried device info %s", str(result))
-        device.close()
-        if result.status:
-            sys_data["version"] = (
-                f"V{result.rx_packets[0][4]}.{result.rx_packets[0][5]}."
-                f"{result.rx_packets[0][6]}"
-            )
-            sys_data["address"] = device.address
-            if f"hwid{result.rx_packets[0][7]}" in DEVICES:
-                sys_data["type"] = f"{DEVICES[f'hwid{result.rx_packets[0][7]}'].name}"
-            else:
-                sys_data["type"] = "Unknown"
-    except (AttributeError, ValueError, NotImplementedError, RuntimeError) as exception:
+        device = UOSDevice(
+            identity=device_identity,
+            address=device_address,
+            loading="QUEUED",  # shares the port worker with the API
+            **kwargs,
+        )
+        system_info = device.get_device_info()
+        getLogger(__name__).debug("Shim queried device info %s", str(system_info))
+        sys_data["version"] = system_info.version_string
+        sys_data["address"] = device.address
+        sys_data["type"] = (
+            system_info.device.name if system_info.device is not None else "Unknown"
+        )
+    except (
+        AttributeError,
+        ValueError,
+        NotImplementedError,
+        RuntimeError,
+        UOSError,
+    ) as exception:
         message = (
             f"Cannot open connection to '{device_address}', info: {exception.__str__()}"
         )
@@ -39,31 +44,26 @@ def get_system_info(device_identity, device_address: str, **kwargs) -> {}:
     return sys_data
 
 
-def get_system_config(device_identity: str, device_address):
+def get_system_config(device_identity: str, device_address: str, **kwargs) -> {}:
     """Gets the mode and level of all gpio configured on the device.
 
     :param device_identity: Class of device being connected to.
     :param device_address: Connection string to the device.
-    :return: Dictionary containing 'gpioX' with 'mode'/'level' for each pin index X.
+    :param kwargs: Additional arguments that can be supplied to the UOS device.
+    :return: Dictionary keyed on pin index, containing the current, ram and eeprom
+        mode and level of each pin.
     """
     uos_data = {}
     try:
         device = UOSDevice(
             identity=device_identity,
             address=device_address,
+            loading="QUEUED",  # shares the port worker with the API
+            **kwargs,
         )
-        for digital_pin in device.device.digital_pins:
-            pin_config = device.get_gpio_config(digital_pin)
-            getLogger(__name__).debug("Shim queried device info %s", str(pin_config))
-            if pin_config.status:
-                uos_data[digital_pin] = {
-                    "current_mode": pin_config.rx_packets[0][4],
-                    "current_level": pin_config.rx_packets[0][5],
-                    "ram_mode": pin_config.rx_packets[0][6],
-                    "ram_level": pin_config.rx_packets[0][7],
-                    "eeprom_mode": pin_config.rx_packets[0][8],
-                    "eeprom_level": pin_config.rx_packets[0][9],
-                }
+        result = device.get_all_gpio_config()
+        getLogger(__name__).debug("Shim queried device config %s", str(result))
+        uos_data = result.aux_data["pins"]
     except (AttributeError, ValueError, NotImplementedError, RuntimeError) as exception:
         message = (
             f"Cannot open connection to '{device_address}', info: {exception.__str__()}"
@@ -82,6 +82,7 @@ def execute_digital_instruction(
         device = UOSDevice(
             identity=device_identity,
             address=device_address,
+            loading="QUEUED",  # shares the port worker with the API
         )
         # result = device.set_gpio_output()
         device.close()